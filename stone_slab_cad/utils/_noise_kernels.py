@@ -0,0 +1,312 @@
+"""
+Noise kernels for baked surface imperfection maps.
+
+2D simplex noise and fractal sums of it, evaluated over a pixel grid in UV
+space. Numba compiles the per-pixel loops when it is installed; otherwise
+the same maps are computed with vectorized NumPy.
+"""
+import math
+import numpy as np
+from typing import Dict
+
+try:
+    from numba import njit, prange
+except ImportError:  # Optional; kernels fall back to NumPy
+    njit = None
+
+
+_F2 = 0.5 * (math.sqrt(3.0) - 1.0)
+_G2 = (3.0 - math.sqrt(3.0)) / 6.0
+
+# Gradient directions, indexed by the hashed lattice corner
+_GRADIENTS = np.array([
+    (1.0, 1.0), (-1.0, 1.0), (1.0, -1.0), (-1.0, -1.0),
+    (1.0, 0.0), (-1.0, 0.0), (0.0, 1.0), (0.0, -1.0),
+], dtype=np.float32)
+
+
+def _hash_tables(seed: int):
+    """Doubled permutation table and the gradient index hashed from it"""
+    perm = np.random.default_rng(seed).permutation(256).astype(np.int32)
+    perm = np.concatenate([perm, perm])
+    return perm, (perm % len(_GRADIENTS)).astype(np.int32)
+
+
+def _octave_count(octaves: int, scale: float, size: int, lacunarity: float = 2.0) -> int:
+    """Octave count capped to drop octaves finer than a pixel"""
+    nyquist = int(math.log(max(size / (2.0 * scale), 1.0)) / math.log(lacunarity)) + 1
+    return max(1, min(octaves, nyquist))
+
+
+def _simplex_np(x: np.ndarray, y: np.ndarray, perm: np.ndarray, grad_idx: np.ndarray) -> np.ndarray:
+    """Vectorized 2D simplex noise in [-1, 1]"""
+    s = (x + y) * _F2
+    i = np.floor(x + s)
+    j = np.floor(y + s)
+    t = (i + j) * _G2
+    x0 = x - (i - t)
+    y0 = y - (j - t)
+    i1 = (x0 > y0).astype(np.int64)
+    j1 = 1 - i1
+    ii = i.astype(np.int64) & 255
+    jj = j.astype(np.int64) & 255
+
+    def corner(cx, cy, gi):
+        falloff = np.maximum(0.5 - cx * cx - cy * cy, 0.0)
+        falloff *= falloff
+        return falloff * falloff * (_GRADIENTS[gi, 0] * cx + _GRADIENTS[gi, 1] * cy)
+
+    total = corner(x0, y0, grad_idx[ii + perm[jj]])
+    total += corner(x0 - i1 + _G2, y0 - j1 + _G2, grad_idx[ii + i1 + perm[jj + j1]])
+    total += corner(x0 - 1.0 + 2.0 * _G2, y0 - 1.0 + 2.0 * _G2, grad_idx[ii + 1 + perm[jj + 1]])
+    return 70.0 * total
+
+
+def _uv_grid(height: int, width: int, scale: float):
+    """Pixel-center UV coordinates multiplied by scale, as (H, W) arrays"""
+    v, u = np.meshgrid(
+        (np.arange(height, dtype=np.float32) + 0.5) / height,
+        (np.arange(width, dtype=np.float32) + 0.5) / width,
+        indexing='ij'
+    )
+    return u * scale, v * scale
+
+
+def _octave_sum_np(out, scale, first, last, roughness, perm, grad_idx):
+    """Unnormalized sum of simplex octaves first..last-1"""
+    x, y = _uv_grid(out.shape[0], out.shape[1], scale)
+    out[:] = 0.0
+    for octave in range(first, last):
+        frequency = 2.0 ** octave
+        out += roughness ** octave * _simplex_np(x * frequency, y * frequency, perm, grad_idx)
+
+
+def _ridged_np(out, scale, octaves, lacunarity, dimension, offset, gain, perm, grad_idx):
+    """Ridged multifractal sum of simplex octaves, as Blender's Musgrave computes it"""
+    x, y = _uv_grid(out.shape[0], out.shape[1], scale)
+    octave_gain = lacunarity ** -dimension
+    signal = offset - np.abs(_simplex_np(x, y, perm, grad_idx))
+    signal *= signal
+    total = signal.copy()
+    amplitude = octave_gain
+    for octave in range(1, octaves):
+        x *= lacunarity
+        y *= lacunarity
+        weight = np.clip(signal * gain, 0.0, 1.0)
+        signal = offset - np.abs(_simplex_np(x, y, perm, grad_idx))
+        signal *= signal
+        signal *= weight
+        total += signal * amplitude
+        amplitude *= octave_gain
+    out[:] = total
+
+
+if njit is not None:
+    _GRAD_X = _GRADIENTS[:, 0].copy()
+    _GRAD_Y = _GRADIENTS[:, 1].copy()
+
+    @njit(inline='always', fastmath=True, cache=True)
+    def _corner(cx, cy, gi, grad_x, grad_y):
+        """Contribution of one simplex corner"""
+        falloff = 0.5 - cx * cx - cy * cy
+        if falloff <= 0.0:
+            return 0.0
+        falloff *= falloff
+        return falloff * falloff * (grad_x[gi] * cx + grad_y[gi] * cy)
+
+    @njit(fastmath=True, cache=True)
+    def _simplex_point(x, y, perm, grad_idx, grad_x, grad_y):
+        """2D simplex noise in [-1, 1] at one point"""
+        s = (x + y) * _F2
+        i = math.floor(x + s)
+        j = math.floor(y + s)
+        t = (i + j) * _G2
+        x0 = x - (i - t)
+        y0 = y - (j - t)
+        if x0 > y0:
+            i1, j1 = 1, 0
+        else:
+            i1, j1 = 0, 1
+        ii = int(i) & 255
+        jj = int(j) & 255
+
+        total = _corner(x0, y0, grad_idx[ii + perm[jj]], grad_x, grad_y)
+        total += _corner(x0 - i1 + _G2, y0 - j1 + _G2,
+                         grad_idx[ii + i1 + perm[jj + j1]], grad_x, grad_y)
+        total += _corner(x0 - 1.0 + 2.0 * _G2, y0 - 1.0 + 2.0 * _G2,
+                         grad_idx[ii + 1 + perm[jj + 1]], grad_x, grad_y)
+        return 70.0 * total
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _octave_sum_numba(out, scale, first, last, roughness, perm, grad_idx, grad_x, grad_y):
+        """Unnormalized sum of simplex octaves first..last-1"""
+        height, width = out.shape
+        for row in prange(height):
+            y = (row + 0.5) / height * scale
+            for col in range(width):
+                x = (col + 0.5) / width * scale
+                total = 0.0
+                amplitude = roughness ** first
+                frequency = 2.0 ** first
+                for octave in range(first, last):
+                    total += amplitude * _simplex_point(x * frequency, y * frequency,
+                                                        perm, grad_idx, grad_x, grad_y)
+                    amplitude *= roughness
+                    frequency *= 2.0
+                out[row, col] = total
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _ridged_numba(out, scale, octaves, lacunarity, dimension, offset, gain,
+                      perm, grad_idx, grad_x, grad_y):
+        """Ridged multifractal sum of simplex octaves, as Blender's Musgrave computes it"""
+        height, width = out.shape
+        octave_gain = lacunarity ** -dimension
+        for row in prange(height):
+            for col in range(width):
+                x = (col + 0.5) / width * scale
+                y = (row + 0.5) / height * scale
+                signal = offset - abs(_simplex_point(x, y, perm, grad_idx, grad_x, grad_y))
+                signal *= signal
+                total = signal
+                amplitude = octave_gain
+                for octave in range(1, octaves):
+                    x *= lacunarity
+                    y *= lacunarity
+                    weight = min(max(signal * gain, 0.0), 1.0)
+                    signal = offset - abs(_simplex_point(x, y, perm, grad_idx, grad_x, grad_y))
+                    signal *= signal * weight
+                    total += signal * amplitude
+                    amplitude *= octave_gain
+                out[row, col] = total
+else:
+    _octave_sum_numba = None
+    _ridged_numba = None
+
+
+def _octave_sum(out, scale, first, last, roughness, perm, grad_idx):
+    """Unnormalized sum of simplex octaves first..last-1, compiled when numba is available"""
+    if _octave_sum_numba is not None:
+        _octave_sum_numba(out, float(scale), first, last, float(roughness),
+                          perm, grad_idx, _GRAD_X, _GRAD_Y)
+    else:
+        _octave_sum_np(out, scale, first, last, roughness, perm, grad_idx)
+
+
+def _to_fac(total: np.ndarray, octaves: int, roughness: float) -> np.ndarray:
+    """Normalize an octave sum and remap it to [0, 1] like Blender's noise Fac"""
+    norm = sum(roughness ** octave for octave in range(octaves))
+    return 0.5 + 0.5 * total / norm
+
+
+def _upsample2x(values: np.ndarray) -> np.ndarray:
+    """Bilinear 2x upsampling on pixel centers, clamped at the borders"""
+    rows = np.empty((values.shape[0] * 2, values.shape[1]), dtype=values.dtype)
+    rows[0::2] = 0.75 * values + 0.25 * np.vstack([values[:1], values[:-1]])
+    rows[1::2] = 0.75 * values + 0.25 * np.vstack([values[1:], values[-1:]])
+    up = np.empty((rows.shape[0], rows.shape[1] * 2), dtype=values.dtype)
+    up[:, 0::2] = 0.75 * rows + 0.25 * np.hstack([rows[:, :1], rows[:, :-1]])
+    up[:, 1::2] = 0.75 * rows + 0.25 * np.hstack([rows[:, 1:], rows[:, -1:]])
+    return up
+
+
+def simplex2d(out: np.ndarray, scale: float, detail: float, roughness: float, seed: int = 0) -> np.ndarray:
+    """
+    Fill out with fractal simplex noise over the unit UV square.
+
+    Mirrors Blender's Noise Texture on UV coordinates: scale sets the base
+    frequency, detail the octave count and roughness the per-octave gain.
+    Octaves finer than a pixel are skipped since they would only alias.
+
+    Args:
+        out: (H, W) float32 array to fill with values in [0, 1]
+        scale: Base noise frequency across the UV square
+        detail: Blender-style detail (octaves - 1)
+        roughness: Amplitude gain per octave
+        seed: Seed for the permutation table
+
+    Returns:
+        out
+    """
+    perm, grad_idx = _hash_tables(seed)
+    octaves = _octave_count(int(detail) + 1, scale, min(out.shape))
+    _octave_sum(out, scale, 0, octaves, roughness, perm, grad_idx)
+    out[:] = _to_fac(out, octaves, roughness)
+    return out
+
+
+def simplex2d_pyramid(resolution: int, scale: float, detail: float, roughness: float,
+                      seed: int = 0, base_resolution: int = 256) -> Dict[int, np.ndarray]:
+    """
+    simplex2d maps for resolution and its halvings down to base_resolution,
+    computed in one pass.
+
+    Octaves already representable at a level are upsampled from the level
+    below; only the octaves the doubled resolution newly resolves are
+    evaluated, so the top level costs about one octave instead of all of them.
+
+    Args:
+        resolution: Size of the largest level
+        scale: Base noise frequency across the UV square
+        detail: Blender-style detail (octaves - 1)
+        roughness: Amplitude gain per octave
+        seed: Seed for the permutation table
+        base_resolution: Size of the smallest level
+
+    Returns:
+        (size, size) float32 map in [0, 1] per level size
+    """
+    perm, grad_idx = _hash_tables(seed)
+    sizes = [resolution]
+    while sizes[0] // 2 >= base_resolution:
+        sizes.insert(0, sizes[0] // 2)
+
+    levels = {}
+    total = None
+    done = 0
+    for size in sizes:
+        octaves = _octave_count(int(detail) + 1, scale, size)
+        if total is not None and total.shape[0] * 2 == size:
+            total = _upsample2x(total)
+        else:
+            total = np.zeros((size, size), dtype=np.float32)
+            done = 0
+        if octaves > done:
+            added = np.empty((size, size), dtype=np.float32)
+            _octave_sum(added, scale, done, octaves, roughness, perm, grad_idx)
+            total += added
+            done = octaves
+        levels[size] = _to_fac(total, done, roughness)
+    return levels
+
+
+def ridged_multifractal(out: np.ndarray, scale: float, detail: float, lacunarity: float,
+                        dimension: float, seed: int = 0, offset: float = 0.0,
+                        gain: float = 1.0) -> np.ndarray:
+    """
+    Fill out with ridged multifractal simplex noise over the unit UV square.
+
+    Mirrors Blender's Musgrave Texture in RIDGED_MULTIFRACTAL mode: each octave
+    inverts the absolute noise, squares it and is weighted by the previous
+    octave's signal, giving sharp creases along the noise zero crossings.
+
+    Args:
+        out: (H, W) float32 array to fill
+        scale: Base noise frequency across the UV square
+        detail: Musgrave detail (number of octaves)
+        lacunarity: Frequency gap between octaves
+        dimension: Fractal dimension, sets the per-octave amplitude gain
+        seed: Seed for the permutation table
+        offset: Musgrave offset added before squaring
+        gain: Musgrave gain applied to the octave weight
+
+    Returns:
+        out
+    """
+    perm, grad_idx = _hash_tables(seed)
+    octaves = _octave_count(max(1, int(detail)), scale, min(out.shape), lacunarity)
+    if _ridged_numba is not None:
+        _ridged_numba(out, float(scale), octaves, float(lacunarity), float(dimension),
+                      float(offset), float(gain), perm, grad_idx, _GRAD_X, _GRAD_Y)
+    else:
+        _ridged_np(out, scale, octaves, lacunarity, dimension, offset, gain, perm, grad_idx)
+    return out
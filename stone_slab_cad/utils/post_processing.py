@@ -6,11 +6,22 @@ for professional 3D stone slab visualization.
 """
 import bpy
 import mathutils
-from typing import Dict, List, Tuple, Optional, Any
-from dataclasses import dataclass, field
+import numpy as np
+from typing import Dict, List, Tuple, Optional, Any, Callable, Iterable, Mapping, Union, NamedTuple
+from dataclasses import dataclass, field, fields, replace, astuple
 from enum import Enum
 from pathlib import Path
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import hashlib
 import math
+import os
+
+try:
+    from numba import njit, prange
+except ImportError:  # Optional; noise estimation falls back to NumPy
+    njit = None
 
 
 class ColorGradingMode(Enum):
@@ -32,13 +43,26 @@ class LUTType(Enum):
     CUSTOM = "custom"
 
 
+class LUTFormat(Enum):
+    """Storage formats for baked LUTs"""
+    FLOAT32 = "float32"
+    UINT8 = "uint8"
+    R11G11B10 = "r11g11b10"
+
+
 class ToneMappingType(Enum):
-    """Tone mapping algorithms"""
-    REINHARD = "reinhard"
-    FILMIC = "filmic"
-    ACES = "aces"
-    AGX = "agx"
-    RAW = "raw"
+    """Tone mapping algorithms and their Blender view transforms"""
+    REINHARD = ("reinhard", "Standard")
+    FILMIC = ("filmic", "Filmic")
+    ACES = ("aces", "ACES")
+    AGX = ("agx", "AgX")
+    RAW = ("raw", "Raw")
+    
+    def __new__(cls, value: str, view_transform: str):
+        obj = object.__new__(cls)
+        obj._value_ = value
+        obj.view_transform = view_transform
+        return obj
 
 
 class PostEffectType(Enum):
@@ -52,15 +76,98 @@ class PostEffectType(Enum):
     FILM_GRAIN = "film_grain"
 
 
-@dataclass
-class WhiteBalanceConfig:
+def _halton(index: int, base: int) -> float:
+    """Radical inverse of index in the given base"""
+    f, r = 1.0, 0.0
+    while index > 0:
+        f /= base
+        r += f * (index % base)
+        index //= base
+    return r
+
+
+@functools.lru_cache(maxsize=None)
+def _halton_hemisphere(n: int) -> np.ndarray:
+    """Deterministic cosine-weighted hemisphere samples from Halton(2, 3)"""
+    samples = np.empty((n, 3), dtype=np.float32)
+    for i in range(n):
+        u1, u2 = _halton(i + 1, 2), _halton(i + 1, 3)
+        r, phi = math.sqrt(u1), 2.0 * math.pi * u2
+        # Pack samples closer to the origin so near occluders weigh more
+        scale = 0.1 + 0.9 * (i / n) ** 2
+        samples[i] = (r * math.cos(phi) * scale,
+                      r * math.sin(phi) * scale,
+                      math.sqrt(1.0 - u1) * scale)
+    samples.flags.writeable = False
+    return samples
+
+
+def _rotation_noise_tile(size: int = 4, seed: int = 0) -> np.ndarray:
+    """Tileable (size, size, 2) table of random unit rotation vectors"""
+    angles = np.random.default_rng(seed).uniform(0.0, 2.0 * math.pi, (size, size))
+    tile = np.stack([np.cos(angles), np.sin(angles)], axis=-1).astype(np.float32)
+    tile.flags.writeable = False
+    return tile
+
+
+_SSAO_SAMPLE_COUNTS = {'low': 8, 'medium': 16, 'high': 32}
+_SSAO_NOISE_TILE = _rotation_noise_tile()
+
+
+# Shared immutable RGB defaults for config fields
+_RGB_ZERO = (0.0, 0.0, 0.0)
+_RGB_HALF = (0.5, 0.5, 0.5)
+
+CurvePoints = Tuple[Tuple[float, float], ...]
+
+
+def _freeze_curve(points: Union[Mapping[float, float],
+                                Iterable[Tuple[float, float]]]) -> CurvePoints:
+    """Normalize a {x: y} mapping or (x, y) sequence into sorted, hashable pairs"""
+    if isinstance(points, Mapping):
+        points = points.items()
+    return tuple(sorted((float(x), float(y)) for x, y in points))
+
+
+@functools.lru_cache(maxsize=64)
+def _curve_arrays(points: CurvePoints) -> Tuple[np.ndarray, np.ndarray]:
+    """Split sorted curve points into float32 x and y arrays"""
+    pts = np.asarray(points, dtype=np.float32).reshape(-1, 2)
+    xs, ys = np.ascontiguousarray(pts[:, 0]), np.ascontiguousarray(pts[:, 1])
+    xs.flags.writeable = False
+    ys.flags.writeable = False
+    return xs, ys
+
+
+class _CachedConfig:
+    """
+    Base for config dataclasses. Configs are frozen, so anything baked from
+    one (LUTs, compiled apply functions) is computed once and kept on the
+    instance.
+    """
+    __slots__ = ('_bake_cache',)
+
+    def _baked(self, key: Any, bake: Callable[[], Any]) -> Any:
+        """Return bake(), computing it only on first use"""
+        try:
+            cache = self._bake_cache
+        except AttributeError:
+            cache = {}
+            object.__setattr__(self, '_bake_cache', cache)
+        if key not in cache:
+            cache[key] = bake()
+        return cache[key]
+
+
+@dataclass(frozen=True)
+class WhiteBalanceConfig(_CachedConfig):
     """White balance correction settings"""
     temperature: float = 6500.0  # Kelvin
     tint: float = 0.0  # Green (-) to Magenta (+)
     
     
-@dataclass
-class ExposureConfig:
+@dataclass(frozen=True)
+class ExposureConfig(_CachedConfig):
     """Exposure and contrast settings"""
     exposure: float = 0.0  # EV stops
     contrast: float = 0.0  # -1 to 1
@@ -70,74 +177,105 @@ class ExposureConfig:
     blacks: float = 0.0  # -1 to 1
 
 
-@dataclass
-class SaturationConfig:
+@dataclass(frozen=True)
+class SaturationConfig(_CachedConfig):
     """Saturation and vibrance settings"""
     saturation: float = 1.0  # 0 to 2
     vibrance: float = 0.0  # -1 to 1 (preserves skin tones)
 
 
-@dataclass
-class ColorBalanceConfig:
+@dataclass(frozen=True)
+class ColorBalanceConfig(_CachedConfig):
     """Color balance for shadows, midtones, highlights"""
     # Shadows (RGB adjustments)
-    shadows: Tuple[float, float, float] = (0.0, 0.0, 0.0)
+    shadows: Tuple[float, float, float] = _RGB_ZERO
     # Midtones (RGB adjustments)
-    midtones: Tuple[float, float, float] = (0.0, 0.0, 0.0)
+    midtones: Tuple[float, float, float] = _RGB_ZERO
     # Highlights (RGB adjustments)
-    highlights: Tuple[float, float, float] = (0.0, 0.0, 0.0)
+    highlights: Tuple[float, float, float] = _RGB_ZERO
     # Preserve luminosity
     preserve_luminosity: bool = True
 
 
-@dataclass
-class CurvesConfig:
-    """Curve-based color corrections"""
+@dataclass(frozen=True)
+class CurvesConfig(_CachedConfig):
+    """Curve-based color corrections (points stored as sorted (x, y) tuples)"""
     # Master curve (RGB combined)
-    master_curve: List[Tuple[float, float]] = field(default_factory=list)
+    master_curve: CurvePoints = ()
     # Red curve
-    red_curve: List[Tuple[float, float]] = field(default_factory=list)
+    red_curve: CurvePoints = ()
     # Green curve
-    green_curve: List[Tuple[float, float]] = field(default_factory=list)
+    green_curve: CurvePoints = ()
     # Blue curve
-    blue_curve: List[Tuple[float, float]] = field(default_factory=list)
+    blue_curve: CurvePoints = ()
     # Hue vs Hue curve (hue shifts)
-    hue_vs_hue: Dict[float, float] = field(default_factory=dict)
+    hue_vs_hue: CurvePoints = ()
     # Hue vs Saturation curve
-    hue_vs_sat: Dict[float, float] = field(default_factory=dict)
+    hue_vs_sat: CurvePoints = ()
     # Luma vs Saturation curve
-    luma_vs_sat: Dict[float, float] = field(default_factory=dict)
+    luma_vs_sat: CurvePoints = ()
+
+    def __post_init__(self):
+        # Accept lists of pairs or {x: y} dicts; store hashable sorted tuples
+        for f in fields(self):
+            object.__setattr__(self, f.name, _freeze_curve(getattr(self, f.name)))
+
+    def evaluate(self, x: np.ndarray) -> np.ndarray:
+        """Evaluate the master curve at x (identity when no points are set)"""
+        xs, ys = _curve_arrays(self.master_curve)
+        if xs.size == 0:
+            return x
+        return np.interp(x, xs, ys)
+
+    def shift_hue(self, hue: np.ndarray) -> np.ndarray:
+        """Apply the hue-vs-hue curve to hue values in [0, 1)"""
+        xs, ys = _curve_arrays(self.hue_vs_hue)
+        if xs.size == 0:
+            return hue
+        return np.mod(hue + np.interp(hue, xs, ys, period=1.0), 1.0)
 
+    def scale_saturation(self, sat: np.ndarray, hue: np.ndarray,
+                         luma: np.ndarray) -> np.ndarray:
+        """Scale saturation by the hue-vs-sat and luma-vs-sat curves"""
+        hx, hy = _curve_arrays(self.hue_vs_sat)
+        lx, ly = _curve_arrays(self.luma_vs_sat)
+        if hx.size:
+            sat = sat * np.interp(hue, hx, hy, period=1.0)
+        if lx.size:
+            sat = sat * np.interp(luma, lx, ly)
+        return sat
 
-@dataclass
-class SplitToningConfig:
+
+@dataclass(frozen=True)
+class SplitToningConfig(_CachedConfig):
     """Split toning for shadows and highlights"""
-    shadows_color: Tuple[float, float, float] = (0.5, 0.5, 0.5)
+    shadows_color: Tuple[float, float, float] = _RGB_HALF
     shadows_amount: float = 0.0  # 0 to 1
-    highlights_color: Tuple[float, float, float] = (0.5, 0.5, 0.5)
+    highlights_color: Tuple[float, float, float] = _RGB_HALF
     highlights_amount: float = 0.0  # 0 to 1
     balance: float = 0.5  # 0 = more shadows, 1 = more highlights
 
 
-@dataclass
-class FilmGrainConfig:
+@dataclass(frozen=True)
+class FilmGrainConfig(_CachedConfig):
     """Film grain settings"""
     intensity: float = 0.0  # 0 to 1
     size: float = 1.0  # Grain particle size
     roughness: float = 0.5  # 0 to 1
 
 
-@dataclass
-class BloomConfig:
+@dataclass(frozen=True)
+class BloomConfig(_CachedConfig):
     """Bloom/glow effect settings"""
     intensity: float = 0.1  # 0 to 1 (keep subtle)
     radius: float = 0.5  # Bloom spread
     threshold: float = 0.8  # Brightness threshold
     clamp: float = 1.0  # Maximum bloom intensity
+    downscale_levels: int = 3  # Mip levels blurred at 1/2, 1/4, 1/8 resolution
 
 
-@dataclass
-class SSAOConfig:
+@dataclass(frozen=True)
+class SSAOConfig(_CachedConfig):
     """Screen Space Ambient Occlusion settings"""
     enabled: bool = True
     distance: float = 0.5  # AO radius
@@ -145,24 +283,35 @@ class SSAOConfig:
     quality: str = "medium"  # low, medium, high
     blend: float = 0.3  # Blend opacity (keep low)
 
+    def sample_kernel(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Hemisphere sample offsets (n, 3) and 4x4 rotation noise tile (4, 4, 2)"""
+        return self._baked('kernel', lambda: (
+            _halton_hemisphere(_SSAO_SAMPLE_COUNTS.get(self.quality, 16)),
+            _SSAO_NOISE_TILE
+        ))
+
 
-@dataclass
-class MotionBlurConfig:
+@dataclass(frozen=True)
+class MotionBlurConfig(_CachedConfig):
     """Motion blur settings"""
     enabled: bool = False
     shutter_speed: float = 0.5  # Shutter angle factor (0-1)
     samples: int = 8  # Sample count
 
 
-@dataclass
-class ChromaticAberrationConfig:
+@dataclass(frozen=True)
+class ChromaticAberrationConfig(_CachedConfig):
     """Chromatic aberration settings"""
     enabled: bool = False
     intensity: float = 0.01  # Keep minimal (0-0.05)
 
+    def bake_offsets(self, width: int, height: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Flat gather indices for the red and blue channels at a resolution"""
+        return _ca_gather_indices(self.intensity, width, height)
 
-@dataclass
-class VignetteConfig:
+
+@dataclass(frozen=True)
+class VignetteConfig(_CachedConfig):
     """Vignette effect settings"""
     enabled: bool = False
     intensity: float = 0.3  # 0 to 1
@@ -170,17 +319,21 @@ class VignetteConfig:
     feather: float = 0.5  # Edge softness
     midpoint: float = 0.5  # Falloff center
 
+    def bake_lut(self, n: int = 512) -> np.ndarray:
+        """Bake the darkening factor over normalized radius [0, 1]"""
+        return _vignette_lut(self, n)
+
 
-@dataclass
-class SharpenConfig:
+@dataclass(frozen=True)
+class SharpenConfig(_CachedConfig):
     """Sharpening filter settings"""
     enabled: bool = False
     intensity: float = 0.5  # 0 to 1
     radius: float = 1.0  # Sample radius
 
 
-@dataclass
-class ColorGradingConfig:
+@dataclass(frozen=True)
+class ColorGradingConfig(_CachedConfig):
     """Complete color grading configuration"""
     mode: ColorGradingMode = ColorGradingMode.FULL_PIPELINE
     tone_mapping: ToneMappingType = ToneMappingType.FILMIC
@@ -193,10 +346,24 @@ class ColorGradingConfig:
     film_grain: FilmGrainConfig = field(default_factory=FilmGrainConfig)
     lut_type: Optional[LUTType] = None
     lut_strength: float = 1.0
+    lut_format: Optional[LUTFormat] = None  # None = pick from tone mapping
 
+    def compiled_apply(self) -> Callable[[np.ndarray], np.ndarray]:
+        """Per-pixel grading function specialized for this config's mode"""
+        return self._baked('apply', lambda: _compile_grading(self))
 
-@dataclass
-class PostProcessingConfig:
+    @property
+    def resolved_lut_format(self) -> LUTFormat:
+        """LUT storage format: UINT8 for LDR output, FLOAT32 with HDR tone mapping"""
+        if self.lut_format is not None:
+            return self.lut_format
+        if self.tone_mapping is ToneMappingType.RAW:
+            return LUTFormat.UINT8
+        return LUTFormat.FLOAT32
+
+
+@dataclass(frozen=True)
+class PostProcessingConfig(_CachedConfig):
     """Complete post-processing configuration"""
     color_grading: ColorGradingConfig = field(default_factory=ColorGradingConfig)
     bloom: BloomConfig = field(default_factory=BloomConfig)
@@ -207,6 +374,271 @@ class PostProcessingConfig:
     sharpen: SharpenConfig = field(default_factory=SharpenConfig)
 
 
+# Baked Lookup Tables
+
+_PRIMARY_MODES = frozenset({ColorGradingMode.PRIMARY_ONLY, ColorGradingMode.FULL_PIPELINE})
+_SECONDARY_MODES = frozenset({ColorGradingMode.FULL_PIPELINE, ColorGradingMode.CUSTOM})
+_LOOK_MODES = frozenset({ColorGradingMode.LOOK_DEVELOPMENT, ColorGradingMode.FULL_PIPELINE})
+
+# Upper bound of the linear HDR input covered by baked tone curves; values
+# above it map to the last LUT entry.
+_TONEMAP_LUT_DOMAIN = 16.0
+
+
+def _hable(x: np.ndarray) -> np.ndarray:
+    """Uncharted 2 (Hable) filmic operator"""
+    a, b, c, d, e, f = 0.15, 0.50, 0.10, 0.20, 0.02, 0.30
+    return ((x * (a * x + c * b) + d * e) / (x * (a * x + b) + d * f)) - e / f
+
+
+def _agx(x: np.ndarray) -> np.ndarray:
+    """AgX base contrast curve (log2 encoding + polynomial sigmoid fit)"""
+    min_ev, max_ev = -12.47393, 4.026069
+    v = np.log2(np.maximum(x, 1e-10))
+    v = np.clip((v - min_ev) / (max_ev - min_ev), 0.0, 1.0)
+    v2 = v * v
+    v4 = v2 * v2
+    return np.clip(
+        15.5 * v4 * v2 - 40.14 * v4 * v + 31.96 * v4
+        - 6.868 * v2 * v + 0.4298 * v2 + 0.1191 * v - 0.00232,
+        0.0, 1.0
+    )
+
+
+def _build_tonemap_lut(kind: ToneMappingType, exposure: float,
+                       n: int = 1024) -> np.ndarray:
+    """
+    Bake a tone mapping curve into a 1D float32 LUT.
+
+    Samples are uniform over [0, _TONEMAP_LUT_DOMAIN] of linear HDR input.
+    Exposure (EV stops) is folded into the table so applying it is a pure
+    lookup.
+    """
+    x = np.linspace(0.0, _TONEMAP_LUT_DOMAIN, n, dtype=np.float64)
+    x *= 2.0 ** exposure
+
+    if kind is ToneMappingType.REINHARD:
+        y = x / (1.0 + x)
+    elif kind is ToneMappingType.ACES:
+        y = (x * (2.51 * x + 0.03)) / (x * (2.43 * x + 0.59) + 0.14)
+    elif kind is ToneMappingType.FILMIC:
+        y = _hable(2.0 * x) / _hable(np.float64(11.2))
+    elif kind is ToneMappingType.AGX:
+        y = _agx(x)
+    else:
+        y = x
+
+    return np.clip(y, 0.0, 1.0).astype(np.float32)
+
+
+def _apply_tonemap_lut(image: np.ndarray, lut: np.ndarray) -> np.ndarray:
+    """Tone map linear HDR values through a baked LUT with linear interpolation"""
+    n = lut.shape[0]
+    idx = np.clip(image, 0.0, _TONEMAP_LUT_DOMAIN) * ((n - 1) / _TONEMAP_LUT_DOMAIN)
+    i = np.minimum(idx.astype(np.int32), n - 2)
+    if lut.dtype == np.uint8:
+        lo = lut[i].astype(np.float32)
+        return (lo + (idx - i) * (lut[i + 1] - lo)) * np.float32(1.0 / 255.0)
+    lo = lut[i]
+    return lo + (idx - i) * (lut[i + 1] - lo)
+
+
+def quantize_lut(lut: np.ndarray, fmt: LUTFormat) -> np.ndarray:
+    """
+    Pack a [0, 1] float LUT into a compact storage format.
+
+    UINT8 stores 8-bit unorm values at a quarter of the float32 footprint.
+    R11G11B10 packs RGB tables (last axis of size 3) into one uint32 per
+    entry using unsigned 11/11/10-bit floats.
+    """
+    if fmt is LUTFormat.FLOAT32:
+        return np.asarray(lut, dtype=np.float32)
+    if fmt is LUTFormat.UINT8:
+        return (np.clip(lut, 0.0, 1.0) * 255.0).round().astype(np.uint8)
+
+    if lut.shape[-1] != 3:
+        raise ValueError("R11G11B10 packing requires an RGB LUT (last axis of size 3)")
+    half = np.maximum(lut, 0.0).astype(np.float16).view(np.uint16).astype(np.uint32)
+    r = (half[..., 0] >> 4) & 0x7FF
+    g = (half[..., 1] >> 4) & 0x7FF
+    b = (half[..., 2] >> 5) & 0x3FF
+    return r | (g << 11) | (b << 22)
+
+
+# Rec. 709 luma weights
+_LUMA_WEIGHTS = (0.2126, 0.7152, 0.0722)
+
+
+# White balance red/blue multipliers tabulated over temperature. Outside
+# 0-13000 K both gains are saturated at their clamp limits, so clamping
+# the lookup to this range is exact.
+_WB_LUT_SIZE = 256
+_WB_TEMP_MIN, _WB_TEMP_MAX = 0.0, 13000.0
+_WB_TEMP_SCALE = (_WB_LUT_SIZE - 1) / (_WB_TEMP_MAX - _WB_TEMP_MIN)
+_WB_TEMPS = np.linspace(_WB_TEMP_MIN, _WB_TEMP_MAX, _WB_LUT_SIZE) / 6500.0
+_WB_LUT_R = tuple(np.clip(_WB_TEMPS, 0.5, 2.0).astype(np.float32).tolist())
+_WB_LUT_B = tuple(np.clip(2.0 - _WB_TEMPS, 0.5, 2.0).astype(np.float32).tolist())
+
+
+def _white_balance_gains(wb: WhiteBalanceConfig) -> Tuple[float, float, float]:
+    """RGB multipliers for a white balance temperature/tint"""
+    pos = (wb.temperature - _WB_TEMP_MIN) * _WB_TEMP_SCALE
+    pos = 0.0 if pos < 0.0 else _WB_LUT_SIZE - 1.0 if pos > _WB_LUT_SIZE - 1.0 else pos
+    i = int(pos)
+    if i == _WB_LUT_SIZE - 1:
+        i -= 1
+    f = pos - i
+    r0, b0 = _WB_LUT_R[i], _WB_LUT_B[i]
+    return (r0 + f * (_WB_LUT_R[i + 1] - r0),
+            1.0 + (wb.tint * 0.1),
+            b0 + f * (_WB_LUT_B[i + 1] - b0))
+
+
+def _color_matrix(config: ColorGradingConfig) -> np.ndarray:
+    """Fuse white balance and saturation into one 3x3 matrix (row-vector form)"""
+    s = config.saturation.saturation
+    luma = np.asarray(_LUMA_WEIGHTS, dtype=np.float32)
+    sat = s * np.eye(3, dtype=np.float32) + (1.0 - s) * np.outer(np.ones(3), luma)
+    gains = np.asarray(_white_balance_gains(config.white_balance), dtype=np.float32)
+    matrix = (sat * gains).astype(np.float32)
+    return np.ascontiguousarray(matrix.T)
+
+
+@functools.lru_cache(maxsize=32)
+def _vignette_lut(config: VignetteConfig, n: int) -> np.ndarray:
+    """Radial falloff table; equal configs share one cached array"""
+    r = np.linspace(0.0, 1.0, n, dtype=np.float32)
+    t = np.clip((r - config.midpoint) / max(config.feather, 1e-6), 0.0, 1.0)
+    lut = (1.0 - config.intensity * t * t * (3.0 - 2.0 * t)).astype(np.float32)
+    lut.flags.writeable = False
+    return lut
+
+
+@functools.lru_cache(maxsize=8)
+def _vignette_index_map(width: int, height: int, roundness: float,
+                        n: int) -> np.ndarray:
+    """Per-pixel radial LUT index, computed once per resolution"""
+    ys, xs = np.ogrid[0:height, 0:width]
+    dx = np.abs((xs + 0.5) / width - 0.5, dtype=np.float32)
+    dy = np.abs((ys + 0.5) / height - 0.5, dtype=np.float32)
+    # Blend L-inf (square) and L2 (round) distance, both normalized to 1 at the corner
+    r_square = np.maximum(dx, dy) * 2.0
+    r_round = np.sqrt(dx * dx + dy * dy) * math.sqrt(2.0)
+    r = np.clip(roundness * r_round + (1.0 - roundness) * r_square, 0.0, 1.0)
+    idx = (r * (n - 1)).astype(np.int32)
+    idx.flags.writeable = False
+    return idx
+
+
+@functools.lru_cache(maxsize=8)
+def _ca_gather_indices(intensity: float, width: int,
+                       height: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Red samples radially outward and blue inward; nearest-pixel flat indices"""
+    ys, xs = np.ogrid[0:height, 0:width]
+    cx, cy = (width - 1) * 0.5, (height - 1) * 0.5
+
+    def gather(scale: float) -> np.ndarray:
+        sx = np.clip(np.rint(cx + (xs - cx) * scale), 0, width - 1).astype(np.int32)
+        sy = np.clip(np.rint(cy + (ys - cy) * scale), 0, height - 1).astype(np.int32)
+        idx = sy * width + sx
+        idx.flags.writeable = False
+        return idx
+
+    return gather(1.0 - intensity), gather(1.0 + intensity)
+
+
+def _box_downsample(img: np.ndarray) -> np.ndarray:
+    """Halve resolution with a 2x2 box filter"""
+    v = img[:img.shape[0] // 2 * 2, :img.shape[1] // 2 * 2]
+    return 0.25 * (v[0::2, 0::2] + v[1::2, 0::2] + v[0::2, 1::2] + v[1::2, 1::2])
+
+
+def _blur3(img: np.ndarray) -> np.ndarray:
+    """Separable 3-tap [1, 2, 1] / 4 blur with clamped edges"""
+    p = np.pad(img, ((1, 1), (0, 0), (0, 0)), mode='edge')
+    v = 0.25 * (p[:-2] + p[2:]) + 0.5 * p[1:-1]
+    p = np.pad(v, ((0, 0), (1, 1), (0, 0)), mode='edge')
+    return 0.25 * (p[:, :-2] + p[:, 2:]) + 0.5 * p[:, 1:-1]
+
+
+def _bilinear_upsample(img: np.ndarray, height: int, width: int) -> np.ndarray:
+    """Resize a mip back to (height, width) with bilinear filtering"""
+    def axis(dst: int, src: int):
+        c = np.clip((np.arange(dst) + 0.5) * (src / dst) - 0.5, 0.0, src - 1)
+        i0 = c.astype(np.int32)
+        i1 = np.minimum(i0 + 1, src - 1)
+        return i0, i1, (c - i0).astype(np.float32)
+
+    y0, y1, fy = axis(height, img.shape[0])
+    x0, x1, fx = axis(width, img.shape[1])
+    rows = img[y0] + (img[y1] - img[y0]) * fy[:, None, None]
+    return rows[:, x0] + (rows[:, x1] - rows[:, x0]) * fx[None, :, None]
+
+
+def _bake_tone_curve(config: ColorGradingConfig, n: int = 1024) -> np.ndarray:
+    """
+    Bake the tone curve for a grading config. Exposure is folded in for
+    modes with primary corrections and the master curve for modes with
+    secondary corrections, matching ColorGradingPipeline.apply_to_scene.
+    """
+    def bake() -> np.ndarray:
+        exposure = config.exposure.exposure if config.mode in _PRIMARY_MODES else 0.0
+        lut = _build_tonemap_lut(config.tone_mapping, exposure, n)
+        if config.mode in _SECONDARY_MODES:
+            lut = config.curves.evaluate(lut)
+        return lut.astype(np.float32, copy=False)
+
+    return config._baked(('tone_curve', n), bake)
+
+
+def _split_tone(rgb: np.ndarray, split: SplitToningConfig) -> np.ndarray:
+    """Tint shadows and highlights, pivoting on luma shifted by balance"""
+    w = np.clip(rgb @ np.asarray(_LUMA_WEIGHTS, dtype=np.float32)
+                + (split.balance - 0.5), 0.0, 1.0)[..., None]
+    shadows = np.asarray(split.shadows_color, np.float32) - 0.5
+    highlights = np.asarray(split.highlights_color, np.float32) - 0.5
+    shadows *= split.shadows_amount
+    highlights *= split.highlights_amount
+    return rgb + (1.0 - w) * shadows + w * highlights
+
+
+def _compile_grading(config: ColorGradingConfig) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Build an apply(rgb) function running only the stages the config actually
+    uses, so the per-pixel path carries no mode branching.
+    """
+    stages: List[Callable[[np.ndarray], np.ndarray]] = []
+    if config.mode in _PRIMARY_MODES:
+        matrix = _color_matrix(config)
+        stages.append(lambda rgb: rgb @ matrix)
+
+    lut = _bake_tone_curve(config)
+    if config.resolved_lut_format is LUTFormat.UINT8:
+        lut = quantize_lut(lut, LUTFormat.UINT8)
+    stages.append(functools.partial(_apply_tonemap_lut, lut=lut))
+
+    split = config.split_toning
+    if config.mode in _LOOK_MODES and (split.shadows_amount or split.highlights_amount):
+        stages.append(functools.partial(_split_tone, split=split))
+
+    stages = tuple(stages)
+
+    def apply(rgb: np.ndarray) -> np.ndarray:
+        for stage in stages:
+            rgb = stage(rgb)
+        return rgb
+
+    return apply
+
+
+def _grade_tile(src: np.ndarray, dst: np.ndarray,
+                apply: Callable[[np.ndarray], np.ndarray]):
+    """Run a compiled grading function over one tile, written in place into dst"""
+    dst[..., :3] = apply(src[..., :3])
+    if src.shape[-1] > 3:
+        dst[..., 3:] = src[..., 3:]
+
+
 class ColorGradingPipeline:
     """Color grading pipeline implementation"""
     
@@ -221,168 +653,170 @@ class ColorGradingPipeline:
             'adjustments_applied': []
         }
         
+        mode = self.config.mode
+        applied = results['adjustments_applied']
+        # Grading settings are collected here and stored on the scene as a
+        # single "_color_grading" property group in one assignment
+        props: Dict[str, Any] = {}
+        
         # Set tone mapping
         self._apply_tone_mapping(scene)
-        results['adjustments_applied'].append('tone_mapping')
+        applied.append('tone_mapping')
         
         # Apply primary corrections
-        if self.config.mode in [ColorGradingMode.PRIMARY_ONLY, ColorGradingMode.FULL_PIPELINE]:
-            self._apply_white_balance(scene)
-            self._apply_exposure(scene)
-            self._apply_saturation(scene)
-            results['adjustments_applied'].extend(['white_balance', 'exposure', 'saturation'])
-        
-        # Apply secondary corrections
-        if self.config.mode in [ColorGradingMode.FULL_PIPELINE, ColorGradingMode.CUSTOM]:
-            self._apply_color_balance(scene)
-            self._apply_curves(scene)
-            results['adjustments_applied'].extend(['color_balance', 'curves'])
-        
-        # Apply look development
-        if self.config.mode in [ColorGradingMode.LOOK_DEVELOPMENT, ColorGradingMode.FULL_PIPELINE]:
-            self._apply_split_toning(scene)
-            self._apply_film_grain(scene)
-            self._apply_lut(scene)
-            results['adjustments_applied'].extend(['split_toning', 'film_grain', 'lut'])
+        if mode in _PRIMARY_MODES:
+            self._apply_white_balance(props)
+            self._apply_exposure(scene, props)
+            self._apply_saturation(scene, props)
+            applied.extend(('white_balance', 'exposure', 'saturation'))
+        
+        if mode is not ColorGradingMode.PRIMARY_ONLY:
+            # Apply secondary corrections
+            if mode in _SECONDARY_MODES:
+                self._apply_color_balance(props)
+                self._apply_curves(props)
+                applied.extend(('color_balance', 'curves'))
             
+            # Apply look development
+            if mode in _LOOK_MODES:
+                self._apply_split_toning(props)
+                self._apply_film_grain(props)
+                self._apply_lut(props)
+                applied.extend(('split_toning', 'film_grain', 'lut'))
+        
+        scene["_color_grading"] = props
         return results
     
     def _apply_tone_mapping(self, scene: bpy.types.Scene):
         """Apply tone mapping algorithm"""
         # Configure scene view transform based on tone mapping type
-        view_transforms = {
-            ToneMappingType.REINHARD: 'Standard',
-            ToneMappingType.FILMIC: 'Filmic',
-            ToneMappingType.ACES: 'ACES',
-            ToneMappingType.AGX: 'AgX',
-            ToneMappingType.RAW: 'Raw'
-        }
-        
-        if self.config.tone_mapping in view_transforms:
-            scene.view_settings.view_transform = view_transforms[self.config.tone_mapping]
+        scene.view_settings.view_transform = self.config.tone_mapping.view_transform
     
-    def _apply_white_balance(self, scene: bpy.types.Scene):
+    def _apply_white_balance(self, props: Dict[str, Any]):
         """Apply white balance correction"""
-        # Store white balance settings in scene custom properties
-        scene["white_balance_temp"] = self.config.white_balance.temperature
-        scene["white_balance_tint"] = self.config.white_balance.tint
+        wb = self.config.white_balance
         
         # Calculate RGB multipliers based on temperature
-        temp = self.config.white_balance.temperature / 6500.0
-        scene["white_balance_r"] = min(2.0, max(0.5, temp))
-        scene["white_balance_b"] = min(2.0, max(0.5, 2.0 - temp))
-        scene["white_balance_g"] = 1.0 + (self.config.white_balance.tint * 0.1)
+        r, g, b = _white_balance_gains(wb)
+        
+        # Store white balance settings with the grading properties
+        props.update({
+            "white_balance_temp": wb.temperature,
+            "white_balance_tint": wb.tint,
+            "white_balance_r": r,
+            "white_balance_b": b,
+            "white_balance_g": g
+        })
     
-    def _apply_exposure(self, scene: bpy.types.Scene):
+    def _apply_exposure(self, scene: bpy.types.Scene, props: Dict[str, Any]):
         """Apply exposure and contrast adjustments"""
+        exposure = self.config.exposure
+        
         # Adjust scene exposure
-        scene.view_settings.exposure = self.config.exposure.exposure
+        scene.view_settings.exposure = exposure.exposure
         
         # Store contrast settings
-        scene["color_contrast"] = self.config.exposure.contrast
-        scene["color_highlights"] = self.config.exposure.highlights
-        scene["color_shadows"] = self.config.exposure.shadows
-        scene["color_whites"] = self.config.exposure.whites
-        scene["color_blacks"] = self.config.exposure.blacks
+        props.update({
+            "color_contrast": exposure.contrast,
+            "color_highlights": exposure.highlights,
+            "color_shadows": exposure.shadows,
+            "color_whites": exposure.whites,
+            "color_blacks": exposure.blacks
+        })
     
-    def _apply_saturation(self, scene: bpy.types.Scene):
+    def _apply_saturation(self, scene: bpy.types.Scene, props: Dict[str, Any]):
         """Apply saturation and vibrance"""
-        scene.view_settings.look = 'High Contrast' if self.config.saturation.saturation > 1.2 else 'Default'
-        scene["saturation"] = self.config.saturation.saturation
-        scene["vibrance"] = self.config.saturation.vibrance
+        saturation = self.config.saturation
+        scene.view_settings.look = 'High Contrast' if saturation.saturation > 1.2 else 'Default'
+        props.update({
+            "saturation": saturation.saturation,
+            "vibrance": saturation.vibrance
+        })
     
-    def _apply_color_balance(self, scene: bpy.types.Scene):
+    def _apply_color_balance(self, props: Dict[str, Any]):
         """Apply color balance for shadows/midtones/highlights"""
-        scene["color_balance_shadows"] = self.config.color_balance.shadows
-        scene["color_balance_midtones"] = self.config.color_balance.midtones
-        scene["color_balance_highlights"] = self.config.color_balance.highlights
-        scene["color_balance_preserve_lum"] = self.config.color_balance.preserve_luminosity
+        balance = self.config.color_balance
+        props.update({
+            "color_balance_shadows": balance.shadows,
+            "color_balance_midtones": balance.midtones,
+            "color_balance_highlights": balance.highlights,
+            "color_balance_preserve_lum": balance.preserve_luminosity
+        })
     
-    def _apply_curves(self, scene: bpy.types.Scene):
+    def _apply_curves(self, props: Dict[str, Any]):
         """Apply curve-based corrections"""
-        # Store curve data in scene
-        if self.config.curves.master_curve:
-            scene["curves_master"] = self.config.curves.master_curve
-        if self.config.curves.red_curve:
-            scene["curves_red"] = self.config.curves.red_curve
-        if self.config.curves.green_curve:
-            scene["curves_green"] = self.config.curves.green_curve
-        if self.config.curves.blue_curve:
-            scene["curves_blue"] = self.config.curves.blue_curve
+        curves = self.config.curves
+        
+        # Store curve data (only curves that have points)
+        props.update({
+            key: points for key, points in (
+                ("curves_master", curves.master_curve),
+                ("curves_red", curves.red_curve),
+                ("curves_green", curves.green_curve),
+                ("curves_blue", curves.blue_curve)
+            ) if points
+        })
             
-    def _apply_split_toning(self, scene: bpy.types.Scene):
+    def _apply_split_toning(self, props: Dict[str, Any]):
         """Apply split toning"""
-        scene["split_toning_shadows_color"] = self.config.split_toning.shadows_color
-        scene["split_toning_shadows_amount"] = self.config.split_toning.shadows_amount
-        scene["split_toning_highlights_color"] = self.config.split_toning.highlights_color
-        scene["split_toning_highlights_amount"] = self.config.split_toning.highlights_amount
-        scene["split_toning_balance"] = self.config.split_toning.balance
+        split = self.config.split_toning
+        props.update({
+            "split_toning_shadows_color": split.shadows_color,
+            "split_toning_shadows_amount": split.shadows_amount,
+            "split_toning_highlights_color": split.highlights_color,
+            "split_toning_highlights_amount": split.highlights_amount,
+            "split_toning_balance": split.balance
+        })
     
-    def _apply_film_grain(self, scene: bpy.types.Scene):
+    def _apply_film_grain(self, props: Dict[str, Any]):
         """Apply film grain effect"""
-        scene["film_grain_intensity"] = self.config.film_grain.intensity
-        scene["film_grain_size"] = self.config.film_grain.size
-        scene["film_grain_roughness"] = self.config.film_grain.roughness
+        grain = self.config.film_grain
+        props.update({
+            "film_grain_intensity": grain.intensity,
+            "film_grain_size": grain.size,
+            "film_grain_roughness": grain.roughness
+        })
     
-    def _apply_lut(self, scene: bpy.types.Scene):
+    def bake_tone_curve(self, n: int = 1024) -> np.ndarray:
+        """Bake tone mapping, exposure and the master curve into a 1D LUT"""
+        return _bake_tone_curve(self.config, n)
+
+    def apply_tone_curve(self, image: np.ndarray) -> np.ndarray:
+        """Tone map a linear HDR pixel array using the baked tone curve"""
+        return _apply_tonemap_lut(image, self.bake_tone_curve())
+
+    def _apply_lut(self, props: Dict[str, Any]):
         """Apply Look-Up Table"""
         if self.config.lut_type:
-            scene["lut_type"] = self.config.lut_type.value
-            scene["lut_strength"] = self.config.lut_strength
+            props.update({
+                "lut_type": self.config.lut_type.value,
+                "lut_strength": self.config.lut_strength
+            })
             
-    def get_preset(self, preset_name: str) -> ColorGradingConfig:
-        """Get predefined color grading preset"""
-        presets = {
-            'neutral': ColorGradingConfig(),
-            'cinematic_warm': ColorGradingConfig(
-                white_balance=WhiteBalanceConfig(temperature=6000, tint=0.1),
-                exposure=ExposureConfig(contrast=0.1),
-                split_toning=SplitToningConfig(
-                    shadows_color=(0.3, 0.2, 0.1),
-                    shadows_amount=0.2,
-                    highlights_color=(1.0, 0.9, 0.7),
-                    highlights_amount=0.3
-                )
-            ),
-            'cinematic_cool': ColorGradingConfig(
-                white_balance=WhiteBalanceConfig(temperature=7500, tint=-0.1),
-                exposure=ExposureConfig(contrast=0.15),
-                split_toning=SplitToningConfig(
-                    shadows_color=(0.1, 0.15, 0.25),
-                    shadows_amount=0.3,
-                    highlights_color=(0.9, 0.95, 1.0),
-                    highlights_amount=0.2
-                )
-            ),
-            'high_contrast': ColorGradingConfig(
-                exposure=ExposureConfig(
-                    contrast=0.3,
-                    highlights=0.2,
-                    shadows=-0.2
-                ),
-                saturation=SaturationConfig(saturation=1.1)
-            ),
-            'vintage': ColorGradingConfig(
-                saturation=SaturationConfig(saturation=0.8, vibrance=-0.2),
-                split_toning=SplitToningConfig(
-                    shadows_color=(0.25, 0.15, 0.1),
-                    shadows_amount=0.3,
-                    highlights_color=(1.0, 0.95, 0.8),
-                    highlights_amount=0.4
-                ),
-                film_grain=FilmGrainConfig(intensity=0.1),
-                lut_type=LUTType.VINTAGE
-            ),
-            'product_showcase': ColorGradingConfig(
-                mode=ColorGradingMode.PRIMARY_ONLY,
-                tone_mapping=ToneMappingType.FILMIC,
-                white_balance=WhiteBalanceConfig(temperature=5500),
-                exposure=ExposureConfig(contrast=0.05),
-                saturation=SaturationConfig(saturation=1.05)
-            )
-        }
-        
-        return presets.get(preset_name, ColorGradingConfig())
+    @classmethod
+    def get_preset(cls, preset_name: str) -> ColorGradingConfig:
+        """Get predefined color grading preset (shared, immutable instance)"""
+        return _COLOR_GRADING_PRESETS.get(preset_name, _DEFAULT_COLOR_GRADING)
+
+
+def _config_fingerprint(config: PostProcessingConfig) -> str:
+    """
+    Digest of the settings that shape the compositor graph. Stable across
+    sessions (unlike hash()) so it can be compared with the copy stored on
+    the scene.
+    """
+    graph_settings = (config.ssao, config.bloom, config.motion_blur,
+                      config.chromatic_aberration, config.vignette, config.sharpen)
+    return hashlib.sha1(
+        repr(tuple(astuple(settings) for settings in graph_settings)).encode()
+    ).hexdigest()
+
+
+def _compositor_graph_intact(tree: bpy.types.NodeTree) -> bool:
+    """Whether the render layer -> composite chain built by apply_effects is still there"""
+    composites = [node for node in tree.nodes if node.bl_idname == 'CompositorNodeComposite']
+    return (any(node.bl_idname == 'CompositorNodeRLayers' for node in tree.nodes)
+            and any(node.inputs[0].is_linked for node in composites))
 
 
 class PostEffectProcessor:
@@ -393,82 +827,76 @@ class PostEffectProcessor:
         
     def apply_effects(self, scene: bpy.types.Scene) -> Dict[str, Any]:
         """Apply all configured post-processing effects"""
+        effects = self._enabled_effects()
         results = {
-            'effects_applied': [],
+            'effects_applied': [name for name, _ in effects],
             'compositor_enabled': False
         }
         
+        # Nothing to composite: bypass the node tree instead of rebuilding
+        # an empty render layer -> composite graph
+        if not effects:
+            scene.use_nodes = False
+            return results
+        
+        tree = scene.node_tree
+        fingerprint = _config_fingerprint(self.config)
+        
+        # Reuse the existing graph if it was built from identical settings
+        if (scene.use_nodes and tree is not None
+                and scene.get('_post_cfg_hash') == fingerprint
+                and _compositor_graph_intact(tree)):
+            results['compositor_enabled'] = True
+            return results
+        
         # Ensure compositor is enabled
         scene.use_nodes = True
         tree = scene.node_tree
+        nodes_new = tree.nodes.new
         
         # Clear existing nodes
         tree.nodes.clear()
         
         # Create render layer and composite nodes
-        render_layer = tree.nodes.new('CompositorNodeRLayers')
+        render_layer = nodes_new('CompositorNodeRLayers')
         render_layer.location = (-300, 0)
         
-        composite = tree.nodes.new('CompositorNodeComposite')
+        composite = nodes_new('CompositorNodeComposite')
         composite.location = (800, 0)
         
         # Build effect chain
         current_node = render_layer
-        
-        # Apply SSAO
-        if self.config.ssao.enabled:
-            ssao_node = self._setup_ssao(tree, current_node)
-            if ssao_node:
-                current_node = ssao_node
-                results['effects_applied'].append('ssao')
-        
-        # Apply Bloom
-        if self.config.bloom.intensity > 0:
-            bloom_node = self._setup_bloom(tree, current_node)
-            if bloom_node:
-                current_node = bloom_node
-                results['effects_applied'].append('bloom')
-        
-        # Apply Motion Blur
-        if self.config.motion_blur.enabled:
-            blur_node = self._setup_motion_blur(tree, current_node)
-            if blur_node:
-                current_node = blur_node
-                results['effects_applied'].append('motion_blur')
-        
-        # Apply Vignette
-        if self.config.vignette.enabled:
-            vignette_node = self._setup_vignette(tree, current_node)
-            if vignette_node:
-                current_node = vignette_node
-                results['effects_applied'].append('vignette')
-        
-        # Apply Chromatic Aberration
-        if self.config.chromatic_aberration.enabled:
-            ca_node = self._setup_chromatic_aberration(tree, current_node)
-            if ca_node:
-                current_node = ca_node
-                results['effects_applied'].append('chromatic_aberration')
-        
-        # Apply Sharpen
-        if self.config.sharpen.enabled:
-            sharpen_node = self._setup_sharpen(tree, current_node)
-            if sharpen_node:
-                current_node = sharpen_node
-                results['effects_applied'].append('sharpen')
+        for _, setup in effects:
+            current_node = setup(tree, current_node)
         
         # Connect to composite
         tree.links.new(current_node.outputs[0], composite.inputs[0])
         
+        scene['_post_cfg_hash'] = fingerprint
         results['compositor_enabled'] = True
         return results
     
+    def _enabled_effects(self) -> List[Tuple[str, Callable]]:
+        """Enabled effects and their node setup methods, in chain order"""
+        config = self.config
+        chain = (
+            ('ssao', config.ssao.enabled, self._setup_ssao),
+            ('bloom', config.bloom.intensity > 0, self._setup_bloom),
+            ('motion_blur', config.motion_blur.enabled, self._setup_motion_blur),
+            ('vignette', config.vignette.enabled, self._setup_vignette),
+            ('chromatic_aberration', config.chromatic_aberration.enabled,
+             self._setup_chromatic_aberration),
+            ('sharpen', config.sharpen.enabled, self._setup_sharpen),
+        )
+        return [(name, setup) for name, enabled, setup in chain if enabled]
+    
     def _setup_bloom(self, tree: bpy.types.NodeTree, 
                      input_node: bpy.types.Node) -> bpy.types.Node:
         """Setup bloom effect in compositor"""
         # Create glare node for bloom
+        x, y = input_node.location
         glare = tree.nodes.new('CompositorNodeGlare')
-        glare.location = (input_node.location[0] + 200, input_node.location[1])
+        glare.location = (x + 200, y)
         glare.glare_type = 'FOG_GLOW'
         glare.quality = 'HIGH'
         glare.threshold = self.config.bloom.threshold
@@ -486,8 +914,9 @@ class PostEffectProcessor:
         # For now, use ambient occlusion pass if available
         
         # Create mix node for AO blending
+        x, y = input_node.location
         mix_node = tree.nodes.new('CompositorNodeMixRGB')
-        mix_node.location = (input_node.location[0] + 200, input_node.location[1])
+        mix_node.location = (x + 200, y)
         mix_node.blend_type = 'MULTIPLY'
         mix_node.inputs[0].default_value = self.config.ssao.blend
         
@@ -498,8 +927,9 @@ class PostEffectProcessor:
     def _setup_motion_blur(self, tree: bpy.types.NodeTree,
                            input_node: bpy.types.Node) -> bpy.types.Node:
         """Setup motion blur effect"""
+        x, y = input_node.location
         blur = tree.nodes.new('CompositorNodeBlur')
-        blur.location = (input_node.location[0] + 200, input_node.location[1])
+        blur.location = (x + 200, y)
         blur.filter_type = 'GAUSS'
         blur.size_x = self.config.motion_blur.shutter_speed * 10
         blur.size_y = 0  # Directional blur for motion
@@ -512,8 +942,9 @@ class PostEffectProcessor:
                                     input_node: bpy.types.Node) -> bpy.types.Node:
         """Setup chromatic aberration effect"""
         # Create lens distortion node
+        x, y = input_node.location
         lens = tree.nodes.new('CompositorNodeLensdist')
-        lens.location = (input_node.location[0] + 200, input_node.location[1])
+        lens.location = (x + 200, y)
         lens.use_projector = False
         lens.dispersion = self.config.chromatic_aberration.intensity
         
@@ -525,8 +956,9 @@ class PostEffectProcessor:
                         input_node: bpy.types.Node) -> bpy.types.Node:
         """Setup vignette effect"""
         # Create lens distortion for vignette
+        x, y = input_node.location
         lens = tree.nodes.new('CompositorNodeLensdist')
-        lens.location = (input_node.location[0] + 200, input_node.location[1])
+        lens.location = (x + 200, y)
         lens.use_fit = False
         lens.dispersion = 0.0
         
@@ -538,8 +970,9 @@ class PostEffectProcessor:
     def _setup_sharpen(self, tree: bpy.types.NodeTree,
                        input_node: bpy.types.Node) -> bpy.types.Node:
         """Setup sharpening filter"""
+        x, y = input_node.location
         filter_node = tree.nodes.new('CompositorNodeFilter')
-        filter_node.location = (input_node.location[0] + 200, input_node.location[1])
+        filter_node.location = (x + 200, y)
         filter_node.filter_type = 'SHARPEN'
         
         tree.links.new(input_node.outputs[0], filter_node.inputs[0])
@@ -547,17 +980,59 @@ class PostEffectProcessor:
         return filter_node
 
 
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _tile_stds(img, out):
+        """Per-tile RGB standard deviation (Welford) over 8x8 tiles of img"""
+        for ty in prange(out.shape[0]):
+            for tx in range(out.shape[1]):
+                count = 0
+                mean = 0.0
+                m2 = 0.0
+                for y in range(ty * 8, ty * 8 + 8):
+                    for x in range(tx * 8, tx * 8 + 8):
+                        for c in range(3):
+                            count += 1
+                            v = img[y, x, c]
+                            delta = v - mean
+                            mean += delta / count
+                            m2 += delta * (v - mean)
+                out[ty, tx] = math.sqrt(m2 / count)
+else:
+    _tile_stds = None
+
+
+class ColorStats(NamedTuple):
+    """RGB range summary of a rendered image"""
+    min: float
+    max: float
+    mean: float
+
+
+# Checklist bit positions; results['checklist'] is an int mask over these
+_CHECK_NAMES = ('artifacts_check', 'color_accuracy', 'resolution_check',
+                'alpha_validation', 'compositing_check')
+_IDX_ARTIFACTS, _IDX_COLOR, _IDX_RESOLUTION, _IDX_ALPHA, _IDX_COMPOSITING = range(5)
+_CHECK_LABELS = tuple(name.replace('_', ' ').title() for name in _CHECK_NAMES)
+_ICONS = ('❌', '✅')
+
+
 class PostRenderValidator:
     """Post-render validation and quality checks"""
     
+    __slots__ = ('checklist_mask', '_pixel_buf')
+    
     def __init__(self):
-        self.checklist = {
-            'artifacts_check': False,
-            'color_accuracy': False,
-            'resolution_check': False,
-            'alpha_validation': False,
-            'compositing_check': False
-        }
+        self.checklist_mask = 0
+        # Reused across validations; reallocated only when the pixel count changes
+        self._pixel_buf: Optional[np.ndarray] = None
+    
+    def _mark(self, index: int, passed: bool):
+        """Set or clear a single checklist bit"""
+        if passed:
+            self.checklist_mask |= 1 << index
+        else:
+            self.checklist_mask &= ~(1 << index)
     
     def validate_render(self, image: bpy.types.Image, 
                         expected_resolution: Tuple[int, int] = (1920, 1080)) -> Dict[str, Any]:
@@ -569,12 +1044,15 @@ class PostRenderValidator:
             'errors': []
         }
         
+        # Read the pixels once and derive every statistic from that buffer
+        stats = self._gather_pixel_stats(image)
+        
         # Check for artifacts and noise
-        noise_level = self._check_noise(image)
+        noise_level = stats['noise']
         results['checks']['noise_level'] = noise_level
         if noise_level > 0.1:
             results['warnings'].append(f"High noise level detected: {noise_level:.2f}")
-        self.checklist['artifacts_check'] = noise_level < 0.2
+        self._mark(_IDX_ARTIFACTS, noise_level < 0.2)
         
         # Verify resolution
         actual_res = (image.size[0], image.size[1])
@@ -586,57 +1064,77 @@ class PostRenderValidator:
         }
         if not res_match:
             results['errors'].append(f"Resolution mismatch: expected {expected_resolution}, got {actual_res}")
-        self.checklist['resolution_check'] = res_match
+        self._mark(_IDX_RESOLUTION, res_match)
         
         # Check color accuracy (simple range check)
-        color_stats = self._analyze_color_range(image)
-        results['checks']['color_range'] = color_stats
-        if color_stats['min'] < 0 or color_stats['max'] > 1.0:
+        color_stats = ColorStats(stats['rgb_min'], stats['rgb_max'], stats['rgb_mean'])
+        results['checks']['color_range'] = color_stats._asdict()
+        if color_stats.min < 0 or color_stats.max > 1.0:
             results['warnings'].append("Color values outside expected range")
-        self.checklist['color_accuracy'] = 0 <= color_stats['min'] <= color_stats['max'] <= 1.0
+        self._mark(_IDX_COLOR, 0 <= color_stats.min <= color_stats.max <= 1.0)
         
         # Validate alpha channel if present
         if image.depth >= 32:  # Has alpha
-            alpha_valid = self._check_alpha(image)
+            alpha_valid = stats['alpha_min'] >= 0.0 and stats['alpha_max'] <= 1.0
             results['checks']['alpha_valid'] = alpha_valid
-            self.checklist['alpha_validation'] = alpha_valid
+            self._mark(_IDX_ALPHA, alpha_valid)
         
         # Overall pass status
         results['passed'] = len(results['errors']) == 0
-        results['checklist'] = self.checklist.copy()
+        results['checklist'] = self.checklist_mask
         
         return results
     
-    def _check_noise(self, image: bpy.types.Image) -> float:
-        """Estimate noise level in image"""
-        # Simplified noise estimation
-        # In production, would analyze pixel variance in smooth regions
-        return 0.0  # Placeholder
-    
-    def _analyze_color_range(self, image: bpy.types.Image) -> Dict[str, float]:
-        """Analyze color range of image"""
-        pixels = list(image.pixels)
-        
-        # Sample every 4th pixel (RGBA)
-        r_values = [pixels[i] for i in range(0, len(pixels), 4)]
-        g_values = [pixels[i+1] for i in range(0, len(pixels), 4)]
-        b_values = [pixels[i+2] for i in range(0, len(pixels), 4)]
-        
-        all_values = r_values + g_values + b_values
+    def _gather_pixel_stats(self, image: bpy.types.Image) -> Dict[str, float]:
+        """Compute color, alpha and noise statistics from a single pixel read"""
+        # Resolve the RNA pixel array once; len() and foreach_get both go
+        # through Blender's C layer
+        pixels = image.pixels
+        n = len(pixels)
+        if n == 0:
+            return {'rgb_min': 0, 'rgb_max': 1, 'rgb_mean': 0.5,
+                    'alpha_min': 0.0, 'alpha_max': 1.0, 'noise': 0.0}
+        
+        # Bulk copy into a float32 buffer instead of boxing every value
+        buf = self._pixel_buf
+        if buf is None or buf.size != n:
+            buf = self._pixel_buf = np.empty(n, dtype=np.float32)
+        pixels.foreach_get(buf)
+        # Channel access is by strided views into the same buffer, no copies:
+        # alpha is every 4th float starting at offset 3, RGB the other three
+        rgba = buf.reshape(-1, 4)
+        rgb = rgba[:, :3]
+        alpha = buf[3::4]
         
         return {
-            'min': min(all_values) if all_values else 0,
-            'max': max(all_values) if all_values else 1,
-            'mean': sum(all_values) / len(all_values) if all_values else 0.5
+            'rgb_min': float(rgb.min()),
+            'rgb_max': float(rgb.max()),
+            'rgb_mean': float(rgb.mean()),
+            'alpha_min': float(alpha.min()),
+            'alpha_max': float(alpha.max()),
+            'noise': self._check_noise(rgba, image.size[0], image.size[1])
         }
     
-    def _check_alpha(self, image: bpy.types.Image) -> bool:
-        """Check alpha channel for valid values"""
-        pixels = list(image.pixels)
-        alpha_values = [pixels[i+3] for i in range(0, len(pixels), 4)]
-        
-        # Check if all alpha values are in valid range
-        return all(0 <= a <= 1.0 for a in alpha_values)
+    def _check_noise(self, rgba: np.ndarray, width: int, height: int) -> float:
+        """Estimate noise level from pixel variance in the smoothest regions"""
+        tile = 8
+        th, tw = height // tile, width // tile
+        if th == 0 or tw == 0 or rgba.shape[0] != width * height:
+            return 0.0
+        
+        # Non-overlapping 8x8 RGB tiles; per-tile std over pixels and channels
+        img = rgba.reshape(height, width, 4)[:th * tile, :tw * tile, :3]
+        if _tile_stds is not None:
+            stds = np.empty((th, tw), dtype=np.float32)
+            _tile_stds(img, stds)
+            stds = stds.ravel()
+        else:
+            stds = img.reshape(th, tile, tw, tile, 3).std(axis=(1, 3, 4)).ravel()
+        
+        # Texture and edges inflate most tiles, so only the flattest quarter
+        # reflects sensor/sampling noise
+        k = max(1, stds.size // 4)
+        return float(np.median(np.partition(stds, k - 1)[:k]))
     
     def generate_report(self, results: Dict[str, Any]) -> str:
         """Generate human-readable validation report"""
@@ -659,9 +1157,9 @@ class PostRenderValidator:
             report.append("")
         
         report.append("Checklist:")
-        for check, passed in results['checklist'].items():
-            icon = "✅" if passed else "❌"
-            report.append(f"  {icon} {check.replace('_', ' ').title()}")
+        mask = results['checklist']
+        for i, label in enumerate(_CHECK_LABELS):
+            report.append(f"  {_ICONS[(mask >> i) & 1]} {label}")
         
         return "\n".join(report)
 
@@ -670,7 +1168,7 @@ class PostProcessingManager:
     """Main manager for post-processing pipeline"""
     
     def __init__(self, config: Optional[PostProcessingConfig] = None):
-        self.config = config or PostProcessingConfig()
+        self.config = config or _DEFAULT_POST
         self.color_pipeline = ColorGradingPipeline(self.config.color_grading)
         self.effect_processor = PostEffectProcessor(self.config)
         self.validator = PostRenderValidator()
@@ -717,78 +1215,136 @@ class PostProcessingManager:
         """Validate final rendered image"""
         return self.validator.validate_render(image, expected_resolution)
     
-    def get_preset(self, preset_name: str) -> PostProcessingConfig:
-        """Get predefined post-processing preset"""
-        presets = {
-            'neutral': PostProcessingConfig(),
-            
-            'cinematic': PostProcessingConfig(
-                color_grading=ColorGradingConfig(
-                    tone_mapping=ToneMappingType.FILMIC,
-                    exposure=ExposureConfig(contrast=0.1),
-                    split_toning=SplitToningConfig(
-                        shadows_color=(0.2, 0.15, 0.1),
-                        shadows_amount=0.2,
-                        highlights_color=(1.0, 0.9, 0.75),
-                        highlights_amount=0.3
-                    )
-                ),
-                bloom=BloomConfig(intensity=0.15, threshold=0.75),
-                vignette=VignetteConfig(enabled=True, intensity=0.25),
-                chromatic_aberration=ChromaticAberrationConfig(enabled=True, intensity=0.01)
-            ),
-            
-            'product_photography': PostProcessingConfig(
-                color_grading=ColorGradingConfig(
-                    mode=ColorGradingMode.PRIMARY_ONLY,
-                    tone_mapping=ToneMappingType.FILMIC,
-                    white_balance=WhiteBalanceConfig(temperature=5500),
-                    exposure=ExposureConfig(contrast=0.05),
-                    saturation=SaturationConfig(saturation=1.05)
-                ),
-                sharpen=SharpenConfig(enabled=True, intensity=0.3),
-                ssao=SSAOConfig(enabled=True, distance=0.3, blend=0.2)
-            ),
-            
-            'archviz': PostProcessingConfig(
-                color_grading=ColorGradingConfig(
-                    tone_mapping=ToneMappingType.ACES,
-                    exposure=ExposureConfig(contrast=0.15, highlights=0.1),
-                    saturation=SaturationConfig(saturation=1.0)
-                ),
-                ssao=SSAOConfig(enabled=True, distance=0.5, factor=0.6),
-                bloom=BloomConfig(intensity=0.08, threshold=0.85),
-                sharpen=SharpenConfig(enabled=True, intensity=0.4)
-            ),
-            
-            'vintage': PostProcessingConfig(
-                color_grading=ColorGradingConfig(
-                    saturation=SaturationConfig(saturation=0.85, vibrance=-0.15),
-                    split_toning=SplitToningConfig(
-                        shadows_color=(0.2, 0.12, 0.08),
-                        shadows_amount=0.35,
-                        highlights_color=(1.0, 0.95, 0.75),
-                        highlights_amount=0.45
-                    ),
-                    film_grain=FilmGrainConfig(intensity=0.08),
-                    lut_type=LUTType.VINTAGE
-                ),
-                vignette=VignetteConfig(enabled=True, intensity=0.4, feather=0.6)
-            ),
-            
-            'minimal': PostProcessingConfig(
-                color_grading=ColorGradingConfig(
-                    mode=ColorGradingMode.PRIMARY_ONLY,
-                    tone_mapping=ToneMappingType.FILMIC
-                ),
-                ssao=SSAOConfig(enabled=False),
-                bloom=BloomConfig(intensity=0.0),
-                vignette=VignetteConfig(enabled=False),
-                chromatic_aberration=ChromaticAberrationConfig(enabled=False)
+    @classmethod
+    def get_preset(cls, preset_name: str) -> PostProcessingConfig:
+        """Get predefined post-processing preset (shared, immutable instance)"""
+        return _POST_PRESETS.get(preset_name, _DEFAULT_POST)
+
+
+# Presets (built once at import; shared by get_preset)
+
+_DEFAULT_COLOR_GRADING = ColorGradingConfig()
+
+_COLOR_GRADING_PRESETS: Dict[str, ColorGradingConfig] = {
+    'neutral': _DEFAULT_COLOR_GRADING,
+    'cinematic_warm': ColorGradingConfig(
+        white_balance=WhiteBalanceConfig(temperature=6000, tint=0.1),
+        exposure=ExposureConfig(contrast=0.1),
+        split_toning=SplitToningConfig(
+            shadows_color=(0.3, 0.2, 0.1),
+            shadows_amount=0.2,
+            highlights_color=(1.0, 0.9, 0.7),
+            highlights_amount=0.3
+        )
+    ),
+    'cinematic_cool': ColorGradingConfig(
+        white_balance=WhiteBalanceConfig(temperature=7500, tint=-0.1),
+        exposure=ExposureConfig(contrast=0.15),
+        split_toning=SplitToningConfig(
+            shadows_color=(0.1, 0.15, 0.25),
+            shadows_amount=0.3,
+            highlights_color=(0.9, 0.95, 1.0),
+            highlights_amount=0.2
+        )
+    ),
+    'high_contrast': ColorGradingConfig(
+        exposure=ExposureConfig(
+            contrast=0.3,
+            highlights=0.2,
+            shadows=-0.2
+        ),
+        saturation=SaturationConfig(saturation=1.1)
+    ),
+    'vintage': ColorGradingConfig(
+        saturation=SaturationConfig(saturation=0.8, vibrance=-0.2),
+        split_toning=SplitToningConfig(
+            shadows_color=(0.25, 0.15, 0.1),
+            shadows_amount=0.3,
+            highlights_color=(1.0, 0.95, 0.8),
+            highlights_amount=0.4
+        ),
+        film_grain=FilmGrainConfig(intensity=0.1),
+        lut_type=LUTType.VINTAGE
+    ),
+    'product_showcase': ColorGradingConfig(
+        mode=ColorGradingMode.PRIMARY_ONLY,
+        tone_mapping=ToneMappingType.FILMIC,
+        white_balance=WhiteBalanceConfig(temperature=5500),
+        exposure=ExposureConfig(contrast=0.05),
+        saturation=SaturationConfig(saturation=1.05)
+    )
+}
+
+_DEFAULT_POST = PostProcessingConfig()
+
+_POST_PRESETS: Dict[str, PostProcessingConfig] = {
+    'neutral': _DEFAULT_POST,
+    
+    'cinematic': PostProcessingConfig(
+        color_grading=ColorGradingConfig(
+            tone_mapping=ToneMappingType.FILMIC,
+            exposure=ExposureConfig(contrast=0.1),
+            split_toning=SplitToningConfig(
+                shadows_color=(0.2, 0.15, 0.1),
+                shadows_amount=0.2,
+                highlights_color=(1.0, 0.9, 0.75),
+                highlights_amount=0.3
             )
-        }
-        
-        return presets.get(preset_name, PostProcessingConfig())
+        ),
+        bloom=BloomConfig(intensity=0.15, threshold=0.75),
+        vignette=VignetteConfig(enabled=True, intensity=0.25),
+        chromatic_aberration=ChromaticAberrationConfig(enabled=True, intensity=0.01)
+    ),
+    
+    'product_photography': PostProcessingConfig(
+        color_grading=ColorGradingConfig(
+            mode=ColorGradingMode.PRIMARY_ONLY,
+            tone_mapping=ToneMappingType.FILMIC,
+            white_balance=WhiteBalanceConfig(temperature=5500),
+            exposure=ExposureConfig(contrast=0.05),
+            saturation=SaturationConfig(saturation=1.05)
+        ),
+        sharpen=SharpenConfig(enabled=True, intensity=0.3),
+        ssao=SSAOConfig(enabled=True, distance=0.3, blend=0.2)
+    ),
+    
+    'archviz': PostProcessingConfig(
+        color_grading=ColorGradingConfig(
+            tone_mapping=ToneMappingType.ACES,
+            exposure=ExposureConfig(contrast=0.15, highlights=0.1),
+            saturation=SaturationConfig(saturation=1.0)
+        ),
+        ssao=SSAOConfig(enabled=True, distance=0.5, factor=0.6),
+        bloom=BloomConfig(intensity=0.08, threshold=0.85),
+        sharpen=SharpenConfig(enabled=True, intensity=0.4)
+    ),
+    
+    'vintage': PostProcessingConfig(
+        color_grading=ColorGradingConfig(
+            saturation=SaturationConfig(saturation=0.85, vibrance=-0.15),
+            split_toning=SplitToningConfig(
+                shadows_color=(0.2, 0.12, 0.08),
+                shadows_amount=0.35,
+                highlights_color=(1.0, 0.95, 0.75),
+                highlights_amount=0.45
+            ),
+            film_grain=FilmGrainConfig(intensity=0.08),
+            lut_type=LUTType.VINTAGE
+        ),
+        vignette=VignetteConfig(enabled=True, intensity=0.4, feather=0.6)
+    ),
+    
+    'minimal': PostProcessingConfig(
+        color_grading=ColorGradingConfig(
+            mode=ColorGradingMode.PRIMARY_ONLY,
+            tone_mapping=ToneMappingType.FILMIC
+        ),
+        ssao=SSAOConfig(enabled=False),
+        bloom=BloomConfig(intensity=0.0),
+        vignette=VignetteConfig(enabled=False),
+        chromatic_aberration=ChromaticAberrationConfig(enabled=False)
+    )
+}
 
 
 # Convenience Functions
@@ -814,15 +1370,8 @@ def setup_post_processing(scene: bpy.types.Scene,
         ...     preset="cinematic"
         ... )
     """
-    manager = PostProcessingManager()
-    
-    if custom_config:
-        config = custom_config
-    else:
-        config = manager.get_preset(preset)
-    
-    manager = PostProcessingManager(config)
-    return manager.setup_post_processing(scene)
+    config = custom_config or PostProcessingManager.get_preset(preset)
+    return PostProcessingManager(config).setup_post_processing(scene)
 
 
 def apply_color_grading(scene: bpy.types.Scene,
@@ -840,15 +1389,8 @@ def apply_color_grading(scene: bpy.types.Scene,
     Returns:
         Dictionary with applied adjustments
     """
-    pipeline = ColorGradingPipeline(ColorGradingConfig())
-    
-    if custom_config:
-        config = custom_config
-    else:
-        config = pipeline.get_preset(preset)
-    
-    pipeline = ColorGradingPipeline(config)
-    return pipeline.apply_to_scene(scene)
+    config = custom_config or ColorGradingPipeline.get_preset(preset)
+    return ColorGradingPipeline(config).apply_to_scene(scene)
 
 
 def validate_render(image: bpy.types.Image,
@@ -867,6 +1409,122 @@ def validate_render(image: bpy.types.Image,
     return validator.validate_render(image, expected_resolution)
 
 
+def apply_grading_tiled(image: np.ndarray, config: ColorGradingConfig,
+                        tile: int = 256) -> np.ndarray:
+    """
+    Apply the compiled color grading function to a pixel array.
+
+    The frame is split into tile x tile blocks that are graded in parallel;
+    NumPy releases the GIL inside the kernels so threads scale across cores
+    while each block stays cache-resident.
+
+    Args:
+        image: Linear float pixel array of shape (H, W, 3) or (H, W, 4)
+        config: Color grading configuration
+        tile: Tile edge length in pixels
+
+    Returns:
+        Graded float32 array with the same shape (alpha is passed through)
+    """
+    src = np.asarray(image, dtype=np.float32)
+    dst = np.empty_like(src)
+    apply = config.compiled_apply()
+
+    h, w = src.shape[:2]
+    blocks = [(slice(y, y + tile), slice(x, x + tile))
+              for y in range(0, h, tile) for x in range(0, w, tile)]
+
+    if len(blocks) <= 1:
+        _grade_tile(src, dst, apply)
+        return dst
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        for _ in pool.map(lambda b: _grade_tile(src[b], dst[b], apply), blocks):
+            pass
+    return dst
+
+
+def apply_vignette(image: np.ndarray, config: VignetteConfig,
+                   n: int = 512) -> np.ndarray:
+    """
+    Darken an (H, W, C) float pixel array in place with a radial vignette.
+
+    The falloff is baked into an n-entry LUT and the radius index map is
+    cached per resolution, so each pixel costs a single table lookup.
+
+    Args:
+        image: Float pixel array of shape (H, W, 3) or (H, W, 4)
+        config: Vignette configuration
+        n: LUT resolution
+
+    Returns:
+        The modified image array
+    """
+    h, w = image.shape[:2]
+    factor = config.bake_lut(n)[_vignette_index_map(w, h, config.roundness, n)]
+    image[..., :3] *= factor[..., None]
+    return image
+
+
+def apply_chromatic_aberration(image: np.ndarray,
+                               config: ChromaticAberrationConfig) -> np.ndarray:
+    """
+    Offset the red and blue channels radially of an (H, W, C) pixel array.
+
+    Gather indices depend only on intensity and resolution, so they are
+    baked once and each frame costs two gathers.
+
+    Args:
+        image: Pixel array of shape (H, W, 3) or (H, W, 4)
+        config: Chromatic aberration configuration
+
+    Returns:
+        New array with shifted red/blue channels
+    """
+    h, w = image.shape[:2]
+    idx_r, idx_b = config.bake_offsets(w, h)
+    out = image.copy()
+    out[..., 0] = image[..., 0].ravel()[idx_r]
+    out[..., 2] = image[..., 2].ravel()[idx_b]
+    return out
+
+
+def apply_bloom(image: np.ndarray, config: BloomConfig) -> np.ndarray:
+    """
+    Add bloom to an (H, W, C) linear float pixel array.
+
+    Pixels above the threshold are box-downsampled into a mip chain, each
+    level gets a cheap separable blur, and the levels are upsampled and
+    accumulated. Blurring at 1/2, 1/4, 1/8 resolution gives a wide glow for
+    a fraction of the cost of a full-resolution Gaussian.
+
+    Args:
+        image: Float pixel array of shape (H, W, 3) or (H, W, 4)
+        config: Bloom configuration
+
+    Returns:
+        New float32 array with bloom added (alpha is passed through)
+    """
+    out = np.array(image, dtype=np.float32)
+    h, w = out.shape[:2]
+    rgb = out[..., :3]
+
+    mip = np.maximum(rgb - config.threshold, 0.0)
+    glow = np.zeros_like(rgb)
+    levels = 0
+    for _ in range(config.downscale_levels):
+        if min(mip.shape[:2]) < 2:
+            break
+        mip = _blur3(_box_downsample(mip))
+        glow += _bilinear_upsample(mip, h, w)
+        levels += 1
+
+    if levels:
+        glow *= config.intensity / levels
+        rgb += np.minimum(glow, config.clamp)
+    return out
+
+
 def create_post_processing_preset(name: str, 
                                    base_preset: str = "neutral",
                                    **overrides) -> PostProcessingConfig:
@@ -881,42 +1539,33 @@ def create_post_processing_preset(name: str,
     Returns:
         Custom PostProcessingConfig
     """
-    manager = PostProcessingManager()
-    config = manager.get_preset(base_preset)
+    config = PostProcessingManager.get_preset(base_preset)
     
-    # Apply overrides
-    for key, value in overrides.items():
-        if hasattr(config, key):
-            setattr(config, key, value)
-    
-    return config
+    # Apply overrides on a new instance; the preset itself is shared and frozen
+    # Only declared fields can be overridden; a hasattr test would also accept
+    # methods and the bake-cache slot
+    config_fields = type(config).__dataclass_fields__
+    valid = {key: value for key, value in overrides.items() if key in config_fields}
+    return replace(config, **valid)
 
 
 # Post-Render Checklist
-POST_RENDER_CHECKLIST = {
-    'artifacts_check': {
-        'description': 'Check for artifacts and noise',
-        'check': lambda img: True,  # Would analyze image
-        'critical': True
-    },
-    'color_accuracy': {
-        'description': 'Verify color accuracy',
-        'check': lambda img: True,
-        'critical': True
-    },
-    'resolution_check': {
-        'description': 'Confirm resolution requirements',
-        'check': lambda img: True,
-        'critical': True
-    },
-    'alpha_validation': {
-        'description': 'Validate alpha channels',
-        'check': lambda img: True,
-        'critical': False
-    },
-    'compositing_check': {
-        'description': 'Review compositing integration',
-        'check': lambda img: True,
-        'critical': False
-    }
-}
+class ChecklistEntry(NamedTuple):
+    """Post-render checklist item"""
+    description: str
+    check: Callable[[Any], bool]
+    critical: bool
+
+
+def _noop_check(img) -> bool:
+    """Placeholder check; would analyze image"""
+    return True
+
+
+POST_RENDER_CHECKLIST: Mapping[str, ChecklistEntry] = MappingProxyType({
+    'artifacts_check': ChecklistEntry('Check for artifacts and noise', _noop_check, True),
+    'color_accuracy': ChecklistEntry('Verify color accuracy', _noop_check, True),
+    'resolution_check': ChecklistEntry('Confirm resolution requirements', _noop_check, True),
+    'alpha_validation': ChecklistEntry('Validate alpha channels', _noop_check, False),
+    'compositing_check': ChecklistEntry('Review compositing integration', _noop_check, False)
+})
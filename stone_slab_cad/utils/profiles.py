@@ -8,280 +8,303 @@ for advanced profile definitions including:
 - Ogee, Cove, Ovolo profiles
 - CNC machining parameters
 """
-from typing import Dict, Any, Optional
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple
 
-def get_profile_settings(profile: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    Get bevel settings based on profile name.
-    Enhanced to support comprehensive manufacturing specifications.
-    """
-    
-    radius = profile.get('radius', 0)
-    profile_name = profile.get('name', '').lower()
-    
+
+# Profile classification over the normalized name (casefolded, with spaces
+# and hyphens as underscores), tried in priority order at the start of the
+# name. Each alternative is a set of lookaheads, so substrings may appear
+# anywhere in the name; the first alternative that matches names the template.
+_PROFILE_REGEX = re.compile(
+    r'^(?:'
+    r'(?=.*(?:c8|chamfer_8))(?P<c8_chamfer>)'
+    r'|(?=.*(?:c5|chamfer_5))(?P<c5_chamfer>)'
+    r'|(?=.*full)(?=.*round)(?P<full_round>)'
+    r'|(?:(?=.*half)(?=.*round)|(?=.*polu_zaobljena))(?P<half_round>)'
+    r'|(?=.*quarter)(?=.*round)(?P<quarter_round>)'
+    r'|(?=.*(?:ogee|s_curve))(?P<ogee>)'
+    r'|(?=.*cove)(?P<cove>)'
+    r'|(?=.*ovolo)(?P<ovolo>)'
+    r'|(?=.*waterfall)(?P<waterfall>)'
+    r'|(?=.*pencil)(?P<pencil>)'
+    r'|(?=.*bevel)(?=.*30)(?P<beveled_30>)'
+    r'|(?=.*bevel)(?=.*60)(?P<beveled_60>)'
+    r'|(?=.*bevel)(?P<beveled_45>)'
+    r')',
+    re.DOTALL
+)
+
+# Bevel settings template for each key: (default radius, settings without radius)
+_PROFILE_TEMPLATES: Dict[str, Tuple[float, Mapping[str, Any]]] = {
     # C8 Chamfer - 8.0mm depth at 45° angle
-    if 'c8' in profile_name or 'chamfer 8' in profile_name:
-        return {
-            'radius': radius if radius > 0 else 8.0,
-            'segments': 1,
-            'profile_factor': 0.0,  # Sharp chamfer
-            'profile_type': 'c8_chamfer',
-            'angle': 45.0,
-            'description': 'C8 Chamfer: 8.0mm depth at 45° inclusive angle'
-        }
-    
+    'c8_chamfer': (8.0, {
+        'segments': 1,
+        'profile_factor': 0.0,  # Sharp chamfer
+        'profile_type': 'c8_chamfer',
+        'angle': 45.0,
+        'description': 'C8 Chamfer: 8.0mm depth at 45° inclusive angle'
+    }),
     # C5 Chamfer - 5.0mm depth
-    if 'c5' in profile_name or 'chamfer 5' in profile_name:
-        return {
-            'radius': radius if radius > 0 else 5.0,
-            'segments': 1,
-            'profile_factor': 0.0,
-            'profile_type': 'c5_chamfer',
-            'angle': 45.0,
-            'description': 'C5 Chamfer: 5.0mm depth at 45° angle'
-        }
-    
+    'c5_chamfer': (5.0, {
+        'segments': 1,
+        'profile_factor': 0.0,
+        'profile_type': 'c5_chamfer',
+        'angle': 45.0,
+        'description': 'C5 Chamfer: 5.0mm depth at 45° angle'
+    }),
     # Full Round (Bullnose)
-    if 'full' in profile_name and 'round' in profile_name:
-        return {
-            'radius': radius if radius > 0 else 20.0,
-            'segments': 16,
-            'profile_factor': 0.5,
-            'profile_type': 'full_round',
-            'description': 'Full Round (Bullnose) edge profile'
-        }
-    
+    'full_round': (20.0, {
+        'segments': 16,
+        'profile_factor': 0.5,
+        'profile_type': 'full_round',
+        'description': 'Full Round (Bullnose) edge profile'
+    }),
     # Half Round (Demi-bullnose)
-    if 'half' in profile_name and 'round' in profile_name or 'polu-zaobljena' in profile_name:
-        return {
-            'radius': radius if radius > 0 else 10.0,
-            'segments': 12,
-            'profile_factor': 0.5,
-            'profile_type': 'half_round',
-            'description': 'Half Round (Demi-bullnose) edge profile'
-        }
-    
+    'half_round': (10.0, {
+        'segments': 12,
+        'profile_factor': 0.5,
+        'profile_type': 'half_round',
+        'description': 'Half Round (Demi-bullnose) edge profile'
+    }),
     # Quarter Round
-    if 'quarter' in profile_name and 'round' in profile_name:
-        return {
-            'radius': radius if radius > 0 else 6.0,
-            'segments': 8,
-            'profile_factor': 0.5,
-            'profile_type': 'quarter_round',
-            'description': 'Quarter Round edge profile'
-        }
-    
+    'quarter_round': (6.0, {
+        'segments': 8,
+        'profile_factor': 0.5,
+        'profile_type': 'quarter_round',
+        'description': 'Quarter Round edge profile'
+    }),
     # Ogee (S-curve)
-    if 'ogee' in profile_name or 's-curve' in profile_name:
-        return {
-            'radius': radius if radius > 0 else 15.0,
-            'segments': 20,
-            'profile_factor': 0.7,
-            'profile_type': 'ogee',
-            'description': 'Ogee (S-curve) decorative profile'
-        }
-    
+    'ogee': (15.0, {
+        'segments': 20,
+        'profile_factor': 0.7,
+        'profile_type': 'ogee',
+        'description': 'Ogee (S-curve) decorative profile'
+    }),
     # Cove (concave)
-    if 'cove' in profile_name:
-        return {
-            'radius': radius if radius > 0 else 8.0,
-            'segments': 10,
-            'profile_factor': 1.0,  # Concave
-            'profile_type': 'cove',
-            'description': 'Cove (concave) edge profile'
-        }
-    
+    'cove': (8.0, {
+        'segments': 10,
+        'profile_factor': 1.0,  # Concave
+        'profile_type': 'cove',
+        'description': 'Cove (concave) edge profile'
+    }),
     # Ovolo
-    if 'ovolo' in profile_name:
-        return {
-            'radius': radius if radius > 0 else 10.0,
-            'segments': 12,
-            'profile_factor': 0.6,
-            'profile_type': 'ovolo',
-            'description': 'Ovolo (quarter round with step) profile'
-        }
-    
+    'ovolo': (10.0, {
+        'segments': 12,
+        'profile_factor': 0.6,
+        'profile_type': 'ovolo',
+        'description': 'Ovolo (quarter round with step) profile'
+    }),
     # Waterfall
-    if 'waterfall' in profile_name:
-        return {
-            'radius': radius if radius > 0 else 25.0,
-            'segments': 32,
-            'profile_factor': 0.4,
-            'profile_type': 'waterfall',
-            'description': 'Waterfall cascading edge profile'
-        }
-    
+    'waterfall': (25.0, {
+        'segments': 32,
+        'profile_factor': 0.4,
+        'profile_type': 'waterfall',
+        'description': 'Waterfall cascading edge profile'
+    }),
     # Pencil edge
-    if 'pencil' in profile_name:
-        return {
-            'radius': radius if radius > 0 else 3.0,
-            'segments': 6,
-            'profile_factor': 0.5,
-            'profile_type': 'pencil',
-            'description': 'Pencil edge (small radius) profile'
-        }
-    
-    # Beveled edges at various angles
-    if 'bevel' in profile_name:
-        angle = 45.0
-        if '30' in profile_name:
-            angle = 30.0
-        elif '60' in profile_name:
-            angle = 60.0
-        
-        return {
-            'radius': radius if radius > 0 else 8.0,
-            'segments': 1,
-            'profile_factor': 0.0,
-            'profile_type': f'beveled_{int(angle)}',
-            'angle': angle,
-            'description': f'{angle}° Beveled edge profile'
-        }
-    
+    'pencil': (3.0, {
+        'segments': 6,
+        'profile_factor': 0.5,
+        'profile_type': 'pencil',
+        'description': 'Pencil edge (small radius) profile'
+    }),
     # Default to C8 chamfer for standard manufacturing
-    return {
-        'radius': radius if radius > 0 else 8.0,
+    'default': (8.0, {
         'segments': 1,
         'profile_factor': 0.0,
         'profile_type': 'c8_chamfer',
         'angle': 45.0,
         'description': 'Default C8 Chamfer: 8.0mm depth at 45° angle'
+    }),
+}
+
+# Beveled edges at various angles
+for _angle in (30.0, 45.0, 60.0):
+    _PROFILE_TEMPLATES[f'beveled_{int(_angle)}'] = (8.0, {
+        'segments': 1,
+        'profile_factor': 0.0,
+        'profile_type': f'beveled_{int(_angle)}',
+        'angle': _angle,
+        'description': f'{_angle}° Beveled edge profile'
+    })
+del _angle
+
+# Templates are shared across calls; expose them read-only
+_PROFILE_TEMPLATES = {
+    key: (default_radius, MappingProxyType(template))
+    for key, (default_radius, template) in _PROFILE_TEMPLATES.items()
+}
+
+# Normalized names that are resolved by exact lookup, skipping the regex
+_PROFILE_ALIASES: Dict[str, str] = {key: key for key in _PROFILE_TEMPLATES}
+_PROFILE_ALIASES['polu_zaobljena'] = 'half_round'
+
+
+@lru_cache(maxsize=128)
+def _classify_profile(name: str) -> str:
+    """Map a profile display name to its settings template key"""
+    profile_name = name.casefold().replace('-', '_').replace(' ', '_')
+    
+    key = _PROFILE_ALIASES.get(profile_name)
+    if key is None:
+        match = _PROFILE_REGEX.match(profile_name)
+        key = match.lastgroup if match else 'default'
+    return key
+
+
+def get_profile_settings(profile: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Get bevel settings based on profile name.
+    Enhanced to support comprehensive manufacturing specifications.
+    """
+    
+    radius = profile.get('radius', 0)
+    default_radius, template = _PROFILE_TEMPLATES[_classify_profile(profile.get('name', ''))]
+    return {'radius': radius if radius > 0 else default_radius, **template}
+
+
+# Edge profile definitions keyed by profile id
+_PROFILE_LIBRARY_RAW: Dict[str, Dict[str, Any]] = {
+    'c8_chamfer': {
+        'name': 'C8 Chamfer',
+        'depth_mm': 8.0,
+        'angle_degrees': 45.0,
+        'segments': 1,
+        'profile_factor': 0.0,
+        'description': 'Standard C8 chamfer: 8.0mm depth at 45° inclusive angle'
+    },
+    'c5_chamfer': {
+        'name': 'C5 Chamfer',
+        'depth_mm': 5.0,
+        'angle_degrees': 45.0,
+        'segments': 1,
+        'profile_factor': 0.0
+    },
+    'c10_chamfer': {
+        'name': 'C10 Chamfer',
+        'depth_mm': 10.0,
+        'angle_degrees': 45.0,
+        'segments': 1,
+        'profile_factor': 0.0
+    },
+    'full_round': {
+        'name': 'Full Round (Bullnose)',
+        'radius_mm': 20.0,
+        'segments': 16,
+        'profile_factor': 0.5
+    },
+    'half_round': {
+        'name': 'Half Round (Demi-bullnose)',
+        'radius_mm': 10.0,
+        'segments': 12,
+        'profile_factor': 0.5
+    },
+    'quarter_round': {
+        'name': 'Quarter Round',
+        'radius_mm': 6.0,
+        'segments': 8,
+        'profile_factor': 0.5
+    },
+    'ogee': {
+        'name': 'Ogee (S-Curve)',
+        'radius_mm': 15.0,
+        'segments': 20,
+        'profile_factor': 0.7
+    },
+    'cove': {
+        'name': 'Cove',
+        'radius_mm': 8.0,
+        'segments': 10,
+        'profile_factor': 1.0
+    },
+    'double_cove': {
+        'name': 'Double Cove',
+        'radius_mm': 12.0,
+        'segments': 14,
+        'profile_factor': 1.0
+    },
+    'ovolo': {
+        'name': 'Ovolo',
+        'radius_mm': 10.0,
+        'depth_mm': 5.0,
+        'segments': 12,
+        'profile_factor': 0.6
+    },
+    'dupont': {
+        'name': 'DuPont',
+        'radius_mm': 18.0,
+        'segments': 24,
+        'profile_factor': 0.8
+    },
+    'waterfall': {
+        'name': 'Waterfall',
+        'radius_mm': 25.0,
+        'depth_mm': 15.0,
+        'segments': 32,
+        'profile_factor': 0.4
+    },
+    'pencil': {
+        'name': 'Pencil Edge',
+        'radius_mm': 3.0,
+        'segments': 6,
+        'profile_factor': 0.5
+    },
+    'miter_45': {
+        'name': '45° Miter',
+        'depth_mm': 20.0,
+        'angle_degrees': 45.0,
+        'segments': 1,
+        'profile_factor': 0.0
+    },
+    'stepped': {
+        'name': 'Stepped',
+        'depth_mm': 10.0,
+        'segments': 3,
+        'profile_factor': 0.0
+    },
+    'beveled_30': {
+        'name': '30° Bevel',
+        'depth_mm': 8.0,
+        'angle_degrees': 30.0,
+        'segments': 1,
+        'profile_factor': 0.0
+    },
+    'beveled_60': {
+        'name': '60° Bevel',
+        'depth_mm': 12.0,
+        'angle_degrees': 60.0,
+        'segments': 1,
+        'profile_factor': 0.0
     }
+}
+
+# Read-only views shared by every caller
+_PROFILE_LIBRARY = MappingProxyType({
+    key: MappingProxyType(info) for key, info in _PROFILE_LIBRARY_RAW.items()
+})
+_PROFILE_NAMES = tuple(info['name'] for info in _PROFILE_LIBRARY.values())
+_PROFILE_BY_LOWER_NAME = {info['name'].lower(): info for info in _PROFILE_LIBRARY.values()}
 
 
-def get_profile_library() -> Dict[str, Dict[str, Any]]:
+def get_profile_library() -> Mapping[str, Mapping[str, Any]]:
     """
     Get complete library of available edge profiles
-    Returns dictionary of profile definitions
+    Returns read-only mapping of profile definitions
     """
-    return {
-        'c8_chamfer': {
-            'name': 'C8 Chamfer',
-            'depth_mm': 8.0,
-            'angle_degrees': 45.0,
-            'segments': 1,
-            'profile_factor': 0.0,
-            'description': 'Standard C8 chamfer: 8.0mm depth at 45° inclusive angle'
-        },
-        'c5_chamfer': {
-            'name': 'C5 Chamfer',
-            'depth_mm': 5.0,
-            'angle_degrees': 45.0,
-            'segments': 1,
-            'profile_factor': 0.0
-        },
-        'c10_chamfer': {
-            'name': 'C10 Chamfer',
-            'depth_mm': 10.0,
-            'angle_degrees': 45.0,
-            'segments': 1,
-            'profile_factor': 0.0
-        },
-        'full_round': {
-            'name': 'Full Round (Bullnose)',
-            'radius_mm': 20.0,
-            'segments': 16,
-            'profile_factor': 0.5
-        },
-        'half_round': {
-            'name': 'Half Round (Demi-bullnose)',
-            'radius_mm': 10.0,
-            'segments': 12,
-            'profile_factor': 0.5
-        },
-        'quarter_round': {
-            'name': 'Quarter Round',
-            'radius_mm': 6.0,
-            'segments': 8,
-            'profile_factor': 0.5
-        },
-        'ogee': {
-            'name': 'Ogee (S-Curve)',
-            'radius_mm': 15.0,
-            'segments': 20,
-            'profile_factor': 0.7
-        },
-        'cove': {
-            'name': 'Cove',
-            'radius_mm': 8.0,
-            'segments': 10,
-            'profile_factor': 1.0
-        },
-        'double_cove': {
-            'name': 'Double Cove',
-            'radius_mm': 12.0,
-            'segments': 14,
-            'profile_factor': 1.0
-        },
-        'ovolo': {
-            'name': 'Ovolo',
-            'radius_mm': 10.0,
-            'depth_mm': 5.0,
-            'segments': 12,
-            'profile_factor': 0.6
-        },
-        'dupont': {
-            'name': 'DuPont',
-            'radius_mm': 18.0,
-            'segments': 24,
-            'profile_factor': 0.8
-        },
-        'waterfall': {
-            'name': 'Waterfall',
-            'radius_mm': 25.0,
-            'depth_mm': 15.0,
-            'segments': 32,
-            'profile_factor': 0.4
-        },
-        'pencil': {
-            'name': 'Pencil Edge',
-            'radius_mm': 3.0,
-            'segments': 6,
-            'profile_factor': 0.5
-        },
-        'miter_45': {
-            'name': '45° Miter',
-            'depth_mm': 20.0,
-            'angle_degrees': 45.0,
-            'segments': 1,
-            'profile_factor': 0.0
-        },
-        'stepped': {
-            'name': 'Stepped',
-            'depth_mm': 10.0,
-            'segments': 3,
-            'profile_factor': 0.0
-        },
-        'beveled_30': {
-            'name': '30° Bevel',
-            'depth_mm': 8.0,
-            'angle_degrees': 30.0,
-            'segments': 1,
-            'profile_factor': 0.0
-        },
-        'beveled_60': {
-            'name': '60° Bevel',
-            'depth_mm': 12.0,
-            'angle_degrees': 60.0,
-            'segments': 1,
-            'profile_factor': 0.0
-        }
-    }
+    return _PROFILE_LIBRARY
 
 
 def get_profile_names() -> list:
     """Get list of available profile names"""
-    library = get_profile_library()
-    return [info['name'] for info in library.values()]
+    return list(_PROFILE_NAMES)
 
 
-def get_profile_by_name(name: str) -> Optional[Dict[str, Any]]:
+def get_profile_by_name(name: str) -> Optional[Mapping[str, Any]]:
     """Get profile definition by display name"""
-    library = get_profile_library()
-    for key, info in library.items():
-        if info['name'].lower() == name.lower():
-            return info
-    return None
+    return _PROFILE_BY_LOWER_NAME.get(name.lower())
 
 
 __all__ = [
@@ -4,15 +4,29 @@ Real-Time Engine Optimization System
 Implements performance budgets, optimization strategies for meshes, textures, and shaders,
 and real-time lighting techniques for professional 3D stone slab visualization.
 """
-import bpy
-import bmesh
-import mathutils
+from __future__ import annotations
+
+import numpy as np
 from typing import Dict, List, Tuple, Optional, Any, Set
 from dataclasses import dataclass, field
 from enum import Enum
+from collections import defaultdict
 from pathlib import Path
+from types import MappingProxyType
+import hashlib
+import heapq
 import math
 
+try:
+    import bpy
+except ImportError:  # Outside Blender; budgets, configs and the NumPy helpers still work
+    bpy = None
+
+try:
+    import meshoptimizer
+except ImportError:  # Optional; LOD levels fall back to the decimate modifier
+    meshoptimizer = None
+
 
 class PlatformType(Enum):
     """Target platform types for performance budgeting"""
@@ -48,9 +62,64 @@ class TextureFormat(Enum):
     PVRTC = "PVRTC"  # iOS fallback
 
 
-@dataclass
+# GPU bytes per texel of each compressed format
+_FORMAT_BPP = MappingProxyType({
+    TextureFormat.BC7: 1.0,
+    TextureFormat.ASTC_4x4: 1.0,
+    TextureFormat.ASTC_6x6: 0.44,
+    TextureFormat.ASTC_8x8: 0.25,
+    TextureFormat.ETC2: 0.5,
+    TextureFormat.PVRTC: 0.5
+})
+
+# A full mip chain adds a third on top of the base level
+_MIP_CHAIN_FACTOR = 4 / 3
+
+
+# Platform-specific budget defaults (read-only, shared by every PerformanceBudget)
+_BUDGET_DEFAULTS = MappingProxyType({
+    PlatformType.MOBILE: MappingProxyType({
+        'triangle_budget': (50000, 200000),
+        'texture_memory_mb': (256, 1024),
+        'max_draw_calls': 100,
+        'target_fps': 60,
+        'max_lights_realtime': 4,
+        'shadow_map_size': 1024,
+        'max_texture_size': 2048
+    }),
+    PlatformType.CONSOLE: MappingProxyType({
+        'triangle_budget': (5000000, 20000000),
+        'texture_memory_mb': (4096, 8192),
+        'max_draw_calls': 2000,
+        'target_fps': 60,
+        'max_lights_realtime': 8,
+        'shadow_map_size': 2048,
+        'max_texture_size': 4096
+    }),
+    PlatformType.PC_HIGH_END: MappingProxyType({
+        'triangle_budget': (20000000, 50000000),
+        'texture_memory_mb': (8192, 16384),
+        'max_draw_calls': 5000,
+        'target_fps': 60,
+        'max_lights_realtime': 8,
+        'shadow_map_size': 4096,
+        'max_texture_size': 8192
+    }),
+    PlatformType.VR: MappingProxyType({
+        'triangle_budget': (1000000, 2000000),
+        'texture_memory_mb': (4096, 8192),
+        'max_draw_calls': 1000,
+        'target_fps': 90,
+        'max_lights_realtime': 4,
+        'shadow_map_size': 2048,
+        'max_texture_size': 4096
+    })
+})
+
+
+@dataclass(frozen=True)
 class PerformanceBudget:
-    """Platform-specific performance budgets"""
+    """Platform-specific performance budgets (immutable once created)"""
     platform: PlatformType
     triangle_budget: int  # Maximum triangles
     texture_memory_mb: int  # Texture memory budget in MB
@@ -62,54 +131,16 @@ class PerformanceBudget:
     
     def __post_init__(self):
         # Platform-specific defaults
-        budget_defaults = {
-            PlatformType.MOBILE: {
-                'triangle_budget': (50000, 200000),
-                'texture_memory_mb': (256, 1024),
-                'max_draw_calls': 100,
-                'target_fps': 60,
-                'max_lights_realtime': 4,
-                'shadow_map_size': 1024,
-                'max_texture_size': 2048
-            },
-            PlatformType.CONSOLE: {
-                'triangle_budget': (5000000, 20000000),
-                'texture_memory_mb': (4096, 8192),
-                'max_draw_calls': 2000,
-                'target_fps': 60,
-                'max_lights_realtime': 8,
-                'shadow_map_size': 2048,
-                'max_texture_size': 4096
-            },
-            PlatformType.PC_HIGH_END: {
-                'triangle_budget': (20000000, 50000000),
-                'texture_memory_mb': (8192, 16384),
-                'max_draw_calls': 5000,
-                'target_fps': 60,
-                'max_lights_realtime': 8,
-                'shadow_map_size': 4096,
-                'max_texture_size': 8192
-            },
-            PlatformType.VR: {
-                'triangle_budget': (1000000, 2000000),
-                'texture_memory_mb': (4096, 8192),
-                'max_draw_calls': 1000,
-                'target_fps': 90,
-                'max_lights_realtime': 4,
-                'shadow_map_size': 2048,
-                'max_texture_size': 4096
-            }
-        }
+        defaults = _BUDGET_DEFAULTS.get(self.platform, _BUDGET_DEFAULTS[PlatformType.PC_HIGH_END])
         
-        defaults = budget_defaults.get(self.platform, budget_defaults[PlatformType.PC_HIGH_END])
-        
-        # Apply ranges if not explicitly set
+        # Apply ranges if not explicitly set; frozen, so fields are filled in
+        # through object.__setattr__
         if self.triangle_budget == 0:
-            self.triangle_budget = defaults['triangle_budget'][0]
+            object.__setattr__(self, 'triangle_budget', defaults['triangle_budget'][0])
         if self.texture_memory_mb == 0:
-            self.texture_memory_mb = defaults['texture_memory_mb'][0]
+            object.__setattr__(self, 'texture_memory_mb', defaults['texture_memory_mb'][0])
         if self.max_draw_calls == 10000:  # Default sentinel
-            self.max_draw_calls = defaults['max_draw_calls']
+            object.__setattr__(self, 'max_draw_calls', defaults['max_draw_calls'])
 
 
 @dataclass
@@ -185,7 +216,9 @@ class RealtimeLightingConfig:
 class PerformanceProfiler:
     """GPU and CPU performance profiling tools"""
     
-    def __init__(self):
+    def __init__(self, compression_format: TextureFormat = TextureFormat.BC7, use_mipmaps: bool = True):
+        self.compression_format = compression_format
+        self.use_mipmaps = use_mipmaps
         self.stats = {
             'triangle_count': 0,
             'draw_calls': 0,
@@ -197,68 +230,144 @@ class PerformanceProfiler:
         
     def profile_scene(self, scene: bpy.types.Scene) -> Dict[str, Any]:
         """Profile the entire scene for performance metrics"""
+        # One walk over the scene objects and one over the materials
+        triangle_count, draw_calls, object_count, light_count = self._scan_objects(scene)
+        node_count, used_images = self._scan_materials()
         self.stats = {
-            'triangle_count': self._count_triangles(scene),
-            'draw_calls': self._estimate_draw_calls(scene),
-            'texture_memory': self._calculate_texture_memory(scene),
-            'shader_complexity': self._analyze_shader_complexity(scene),
-            'object_count': len([obj for obj in scene.objects if obj.type == 'MESH']),
+            'triangle_count': triangle_count,
+            'draw_calls': draw_calls,
+            'texture_memory': self._texture_memory_mb(used_images),
+            'shader_complexity': node_count * 7,
+            'object_count': object_count,
             'material_count': len(bpy.data.materials),
-            'light_count': len([obj for obj in scene.objects if obj.type == 'LIGHT'])
+            'light_count': light_count
         }
         return self.stats
     
-    def _count_triangles(self, scene: bpy.types.Scene) -> int:
-        """Count total triangles in the scene"""
-        total_tris = 0
+    @staticmethod
+    def _scan_objects(scene: bpy.types.Scene) -> Tuple[int, int, int, int]:
+        """Triangle, draw call, mesh object and light counts of the scene objects"""
+        # An n-gon triangulates into n - 2 triangles, so a mesh has
+        # len(loops) - 2 * len(polygons) triangles. Instanced meshes are
+        # counted once per object but measured only once.
+        mesh_tris: Dict[Any, int] = {}
+        triangle_count = draw_calls = object_count = light_count = 0
         for obj in scene.objects:
-            if obj.type == 'MESH' and obj.data:
+            obj_type = obj.type
+            if obj_type == 'MESH':
+                object_count += 1
                 mesh = obj.data
-                total_tris += len(mesh.polygons)
-        return total_tris
+                if mesh:
+                    tris = mesh_tris.get(mesh)
+                    if tris is None:
+                        tris = mesh_tris[mesh] = len(mesh.loops) - 2 * len(mesh.polygons)
+                    triangle_count += tris
+                    # Each material slot = potential draw call
+                    draw_calls += len(mesh.materials) or 1
+            elif obj_type == 'LIGHT':
+                light_count += 1
+        return triangle_count, draw_calls, object_count, light_count
+    
+    @staticmethod
+    def _scan_materials() -> Tuple[int, Set[Any]]:
+        """Shader node count and images referenced by node-based materials"""
+        node_count = 0
+        used_images = set()
+        for mat in bpy.data.materials:
+            if mat.use_nodes:
+                nodes = mat.node_tree.nodes
+                node_count += len(nodes)
+                used_images.update(node.image for node in nodes if node.type == 'TEX_IMAGE' and node.image)
+        return node_count, used_images
+    
+    def _count_triangles(self, scene: bpy.types.Scene) -> int:
+        """Count total triangles in the scene"""
+        return self._scan_objects(scene)[0]
     
     def _estimate_draw_calls(self, scene: bpy.types.Scene) -> int:
         """Estimate draw calls based on objects and materials"""
-        draw_calls = 0
-        for obj in scene.objects:
-            if obj.type == 'MESH':
-                # Each material slot = potential draw call
-                mesh = obj.data
-                if mesh.materials:
-                    draw_calls += len(mesh.materials)
-                else:
-                    draw_calls += 1
-        return draw_calls
+        return self._scan_objects(scene)[1]
     
     def _calculate_texture_memory(self, scene: bpy.types.Scene) -> int:
         """Calculate estimated texture memory usage in MB"""
-        total_memory = 0
-        processed_images = set()
-        
-        for mat in bpy.data.materials:
-            if mat.use_nodes:
-                for node in mat.node_tree.nodes:
-                    if node.type == 'TEX_IMAGE' and node.image:
-                        img = node.image
-                        if img.name not in processed_images:
-                            processed_images.add(img.name)
-                            # Estimate memory: width * height * channels * 4 (float) / (1024^2)
-                            if img.size[0] > 0 and img.size[1] > 0:
-                                channels = len(img.depth) if hasattr(img, 'depth') else 4
-                                memory_mb = (img.size[0] * img.size[1] * channels * 4) / (1024 * 1024)
-                                total_memory += memory_mb
-        
-        return int(total_memory)
+        return self._texture_memory_mb(self._scan_materials()[1])
     
     def _analyze_shader_complexity(self, scene: bpy.types.Scene) -> int:
         """Analyze shader complexity (estimated instruction count)"""
-        total_complexity = 0
-        for mat in bpy.data.materials:
-            if mat.use_nodes:
-                node_count = len(mat.node_tree.nodes)
-                # Rough estimate: each node ~ 5-10 instructions
-                total_complexity += node_count * 7
-        return total_complexity
+        # Rough estimate: each node ~ 5-10 instructions
+        return self._scan_materials()[0] * 7
+    
+    def _texture_memory_mb(self, images: Set[Any]) -> int:
+        """Estimated GPU memory of a set of images in MB"""
+        if not images:
+            return 0
+        
+        # Estimate memory in the compressed GPU format: width * height * bytes per texel
+        sizes = np.array([tuple(img.size) for img in images], dtype=np.int64)
+        return int(sizes.prod(axis=1).sum() * self._bytes_per_texel() / (1024 * 1024))
+    
+    def _bytes_per_texel(self) -> float:
+        """Bytes per base-level texel, including the mip chain if used"""
+        bpp = _FORMAT_BPP.get(self.compression_format, 1.0)
+        return bpp * _MIP_CHAIN_FACTOR if self.use_mipmaps else bpp
+    
+    def texture_streaming_working_set(self, budget_mb: float) -> Dict[str, int]:
+        """
+        Pick the top mip levels to stream out so resident textures fit a budget.
+        
+        The largest resident texture gives up its top mip level first, which
+        quarters its footprint, until the total fits or every texture is down
+        to a single compression block.
+        
+        Args:
+            budget_mb: Texture memory budget in MB
+            
+        Returns:
+            Number of dropped top mip levels per image name, for images that drop any
+        """
+        bytes_per_texel = self._bytes_per_texel()
+        heap = []
+        total = 0.0
+        for img in self._scan_materials()[1]:
+            width, height = img.size
+            size = width * height * bytes_per_texel
+            total += size
+            heap.append((-size, img.name, width, height))
+        heapq.heapify(heap)
+        
+        budget = budget_mb * 1024 * 1024
+        dropped: Dict[str, int] = defaultdict(int)
+        while total > budget and heap:
+            neg_size, name, width, height = heapq.heappop(heap)
+            if min(width, height) <= 4:
+                # Already a single block; nothing left to drop
+                continue
+            size = -neg_size / 4
+            total -= size * 3
+            dropped[name] += 1
+            heapq.heappush(heap, (-size, name, width // 2, height // 2))
+        return dict(dropped)
+    
+    def apply_deltas(self, **deltas: int) -> Dict[str, Any]:
+        """Update the last profile with known changes instead of profiling the scene again"""
+        stats = dict(self.stats)
+        for key, delta in deltas.items():
+            stats[key] += delta
+        self.stats = stats
+        return stats
+    
+    def recount_objects(self, scene: bpy.types.Scene) -> Dict[str, Any]:
+        """Re-read the mesh object and light counts of the last profile; cheaper
+        than profile_scene as no mesh or material data is measured"""
+        object_count = light_count = 0
+        for obj in scene.objects:
+            obj_type = obj.type
+            if obj_type == 'MESH':
+                object_count += 1
+            elif obj_type == 'LIGHT':
+                light_count += 1
+        self.stats = dict(self.stats, object_count=object_count, light_count=light_count)
+        return self.stats
     
     def check_budget_compliance(self, budget: PerformanceBudget) -> Dict[str, Any]:
         """Check if current stats are within budget"""
@@ -269,32 +378,41 @@ class PerformanceProfiler:
             'recommendations': []
         }
         
-        if self.stats['triangle_count'] > budget.triangle_budget:
+        stats = self.stats
+        triangles, draw_calls, texture_memory = (
+            stats['triangle_count'], stats['draw_calls'], stats['texture_memory']
+        )
+        triangle_budget, draw_call_budget, texture_budget = (
+            budget.triangle_budget, budget.max_draw_calls, budget.texture_memory_mb
+        )
+        
+        # Messages are only formatted for the budgets actually exceeded
+        if triangles > triangle_budget:
             compliance['within_budget'] = False
             compliance['violations'].append(
-                f"Triangle count ({self.stats['triangle_count']:,}) exceeds budget ({budget.triangle_budget:,})"
+                f"Triangle count ({triangles:,}) exceeds budget ({triangle_budget:,})"
             )
             compliance['recommendations'].append("Implement additional LOD levels or reduce geometry detail")
         
-        if self.stats['draw_calls'] > budget.max_draw_calls:
+        if draw_calls > draw_call_budget:
             compliance['within_budget'] = False
             compliance['violations'].append(
-                f"Draw calls ({self.stats['draw_calls']}) exceed budget ({budget.max_draw_calls})"
+                f"Draw calls ({draw_calls}) exceed budget ({draw_call_budget})"
             )
             compliance['recommendations'].append("Batch meshes with same materials, use texture atlasing")
         
-        if self.stats['texture_memory'] > budget.texture_memory_mb:
+        if texture_memory > texture_budget:
             compliance['within_budget'] = False
             compliance['violations'].append(
-                f"Texture memory ({self.stats['texture_memory']}MB) exceeds budget ({budget.texture_memory_mb}MB)"
+                f"Texture memory ({texture_memory}MB) exceeds budget ({texture_budget}MB)"
             )
             compliance['recommendations'].append("Compress textures, use texture streaming, reduce resolution")
         
         # Warnings at 80% of budget
-        if self.stats['triangle_count'] > budget.triangle_budget * 0.8:
+        if triangles > triangle_budget * 0.8:
             compliance['warnings'].append("Triangle count at >80% of budget")
         
-        if self.stats['draw_calls'] > budget.max_draw_calls * 0.8:
+        if draw_calls > draw_call_budget * 0.8:
             compliance['warnings'].append("Draw calls at >80% of budget")
             
         return compliance
@@ -306,20 +424,53 @@ class LODSystem:
     def __init__(self, config: MeshOptimizationConfig):
         self.config = config
         self.lod_objects: Dict[LODLevel, bpy.types.Object] = {}
+        # Reduced meshes per source mesh for this optimizer run, so instances
+        # sharing one mesh are only decimated once; each entry keeps the
+        # geometry fingerprint it was built from
+        self._mesh_lod_cache: Dict[str, Tuple[Tuple[int, int, str], Dict[LODLevel, bpy.types.Mesh]]] = {}
         
     def generate_lod_chain(self, obj: bpy.types.Object) -> Dict[LODLevel, bpy.types.Object]:
         """Generate LOD chain for an object"""
         self.lod_objects = {}
+        lod_meshes = self._cached_lod_meshes(obj.data)
         
         for lod_config in self.config.lod_chain:
-            lod_obj = self._create_lod_level(obj, lod_config)
+            lod_obj = self._create_lod_level(obj, lod_config, lod_meshes.get(lod_config.lod_level))
             if lod_obj:
                 self.lod_objects[lod_config.lod_level] = lod_obj
+                if lod_obj is not obj:
+                    lod_meshes[lod_config.lod_level] = lod_obj.data
                 
         return self.lod_objects
     
-    def _create_lod_level(self, obj: bpy.types.Object, config: LODConfig) -> Optional[bpy.types.Object]:
-        """Create a single LOD level from the original object"""
+    @staticmethod
+    def _mesh_fingerprint(mesh: bpy.types.Mesh) -> Tuple[int, int, str]:
+        """Vertex and polygon counts plus a digest of the vertex coordinates"""
+        coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get('co', coords)
+        return len(mesh.vertices), len(mesh.polygons), hashlib.sha1(coords.tobytes()).hexdigest()
+    
+    def _cached_lod_meshes(self, mesh: bpy.types.Mesh) -> Dict[LODLevel, bpy.types.Mesh]:
+        """LOD meshes already generated for a mesh; rebuilt if the source was
+        edited or any reduced mesh was deleted since"""
+        fingerprint = self._mesh_fingerprint(mesh)
+        entry = self._mesh_lod_cache.get(mesh.name_full)
+        lod_meshes = None
+        if entry is not None and entry[0] == fingerprint:
+            lod_meshes = entry[1]
+            try:
+                for lod_mesh in lod_meshes.values():
+                    lod_mesh.name
+            except ReferenceError:
+                lod_meshes = None
+        if lod_meshes is None:
+            lod_meshes = {}
+            self._mesh_lod_cache[mesh.name_full] = (fingerprint, lod_meshes)
+        return lod_meshes
+    
+    def _create_lod_level(self, obj: bpy.types.Object, config: LODConfig,
+                          lod_mesh: Optional[bpy.types.Mesh] = None) -> Optional[bpy.types.Object]:
+        """Create a single LOD level from the original object, reusing lod_mesh if given"""
         if config.lod_level == LODLevel.LOD0:
             # LOD0 is the original
             return obj
@@ -327,16 +478,29 @@ class LODSystem:
         # Create copy for this LOD level
         lod_name = f"{obj.name}_LOD{config.lod_level.value}"
         
-        # Duplicate the object
-        bpy.context.view_layer.objects.active = obj
-        obj.select_set(True)
-        bpy.ops.object.duplicate()
-        lod_obj = bpy.context.active_object
+        # Duplicate the object and its mesh data directly; the operator would
+        # push undo steps and rewrite selection for every level
+        lod_obj = obj.copy()
         lod_obj.name = lod_name
+        for collection in obj.users_collection or (bpy.context.scene.collection,):
+            collection.objects.link(lod_obj)
+        
+        if lod_mesh is not None:
+            # Another instance of this mesh was already reduced
+            lod_obj.data = lod_mesh
+            return lod_obj
+        
+        lod_obj.data = obj.data.copy()
         
         # Apply decimation
         if config.use_decimate:
-            self._apply_decimate_modifier(lod_obj, config.decimate_ratio)
+            if meshoptimizer is not None:
+                # Silhouette matters little at the far levels, so use the
+                # faster sloppy simplifier there
+                sloppy = config.lod_level.value >= LODLevel.LOD3.value
+                self._simplify_mesh(lod_obj, config.decimate_ratio, sloppy)
+            else:
+                self._apply_decimate_modifier(lod_obj, config.decimate_ratio)
             
         return lod_obj
     
@@ -347,9 +511,146 @@ class LODSystem:
         decimate.use_collapse_triangulate = True
         decimate.use_symmetry = False
         
-        # Apply the modifier
-        bpy.context.view_layer.objects.active = obj
-        bpy.ops.object.modifier_apply(modifier="Decimate")
+        # Apply the modifier by baking the evaluated mesh. Other modifiers are
+        # muted meanwhile so only the decimation ends up in the mesh data.
+        muted = [mod for mod in obj.modifiers if mod != decimate and mod.show_viewport]
+        for mod in muted:
+            mod.show_viewport = False
+        
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        decimated = bpy.data.meshes.new_from_object(obj.evaluated_get(depsgraph))
+        
+        old_mesh = obj.data
+        obj.data = decimated
+        obj.modifiers.remove(decimate)
+        for mod in muted:
+            mod.show_viewport = True
+        if old_mesh.users == 0:
+            bpy.data.meshes.remove(old_mesh)
+
+
+    def _simplify_mesh(self, obj: bpy.types.Object, ratio: float, sloppy: bool = False):
+        """Simplify the object's mesh with meshoptimizer, keeping UVs and materials"""
+        mesh = obj.data
+        mesh.calc_loop_triangles()
+        tri_count = len(mesh.loop_triangles)
+        if tri_count == 0:
+            return
+        
+        # Flat buffers straight from the mesh
+        positions = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get('co', positions)
+        tri_loops = np.empty(tri_count * 3, dtype=np.int32)
+        mesh.loop_triangles.foreach_get('loops', tri_loops)
+        tri_polys = np.empty(tri_count, dtype=np.int32)
+        mesh.loop_triangles.foreach_get('polygon_index', tri_polys)
+        loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+        mesh.loops.foreach_get('vertex_index', loop_verts)
+        poly_materials = np.empty(len(mesh.polygons), dtype=np.int32)
+        mesh.polygons.foreach_get('material_index', poly_materials)
+        poly_smooth = np.empty(len(mesh.polygons), dtype=bool)
+        mesh.polygons.foreach_get('use_smooth', poly_smooth)
+        
+        uv_layer = mesh.uv_layers.active
+        loop_uvs = None
+        if uv_layer is not None:
+            loop_uvs = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+            uv_layer.data.foreach_get('uv', loop_uvs)
+            loop_uvs = loop_uvs.reshape(-1, 2)
+        
+        verts, faces, face_uvs, face_attrs = _simplify_triangles(
+            positions.reshape(-1, 3), loop_verts[tri_loops].reshape(-1, 3),
+            loop_uvs[tri_loops].reshape(-1, 3, 2) if loop_uvs is not None else None,
+            np.column_stack((poly_materials[tri_polys], poly_smooth[tri_polys])),
+            ratio, sloppy
+        )
+        
+        simplified = bpy.data.meshes.new(mesh.name)
+        simplified.from_pydata(verts.tolist(), [], faces.tolist())
+        for mat in mesh.materials:
+            simplified.materials.append(mat)
+        simplified.polygons.foreach_set('material_index', face_attrs[:, 0])
+        simplified.polygons.foreach_set('use_smooth', face_attrs[:, 1].astype(bool))
+        if face_uvs is not None:
+            simplified.uv_layers.new(name=uv_layer.name).data.foreach_set('uv', face_uvs.ravel())
+        simplified.update()
+        
+        obj.data = simplified
+        if mesh.users == 0:
+            bpy.data.meshes.remove(mesh)
+
+
+def _simplify_triangles(positions: np.ndarray, tris: np.ndarray, tri_uvs: Optional[np.ndarray],
+                        tri_attrs: np.ndarray, ratio: float, sloppy: bool = False):
+    """
+    Simplify a triangle mesh with meshoptimizer.
+    
+    Corners are split into wedge vertices by (vertex, per-face attributes, UV),
+    so UV seams and material borders become vertex seams the simplifier keeps.
+    
+    Args:
+        positions: (V, 3) vertex positions
+        tris: (T, 3) vertex indices per triangle
+        tri_uvs: (T, 3, 2) corner UVs, or None
+        tri_attrs: (T, K) integer per-triangle attributes to keep (material, smooth)
+        ratio: Target fraction of triangles to keep
+        sloppy: Use the faster, topology-ignoring simplifier
+        
+    Returns:
+        (vertices, faces, face_uvs, face_attrs) for the simplified mesh, with
+        face_uvs as (F * 3, 2) corner UVs in face order, or None
+    """
+    tri_count = len(tris)
+    corner_attrs = np.repeat(tri_attrs, 3, axis=0)
+    keys = [tris.reshape(-1, 1).astype(np.float64), corner_attrs.astype(np.float64)]
+    if tri_uvs is not None:
+        keys.append(tri_uvs.reshape(-1, 2).astype(np.float64))
+    wedges, indices = np.unique(np.hstack(keys), axis=0, return_inverse=True)
+    wedge_verts = wedges[:, 0].astype(np.int64)
+    
+    # Error bounds are relative to the mesh extents. The sloppy simplifier is
+    # only used for far LODs, where a looser bound lets it reach the target.
+    target = max(3, int(tri_count * ratio) * 3)
+    destination = np.empty(tri_count * 3, dtype=np.uint32)
+    simplify = meshoptimizer.simplify_sloppy if sloppy else meshoptimizer.simplify
+    count = simplify(destination, indices.astype(np.uint32).ravel(),
+                     np.ascontiguousarray(positions[wedge_verts], dtype=np.float32),
+                     target_index_count=target, target_error=0.1 if sloppy else 0.01)
+    kept = destination[:count]
+    
+    # Collapse wedges back onto shared mesh vertices
+    used, faces = np.unique(wedge_verts[kept], return_inverse=True)
+    face_wedges = wedges[kept[::3]]
+    face_attrs = face_wedges[:, 1:1 + tri_attrs.shape[1]].astype(np.int32)
+    face_uvs = wedges[kept, -2:].astype(np.float32) if tri_uvs is not None else None
+    return positions[used], faces.reshape(-1, 3), face_uvs, face_attrs
+
+
+# Quad faces of an object's bound_box, by corner index
+_BOUND_BOX_FACES = (
+    (0, 1, 2, 3), (4, 7, 6, 5),  # -X, +X
+    (0, 4, 5, 1), (3, 2, 6, 7),  # -Y, +Y
+    (0, 3, 7, 4), (1, 5, 6, 2)   # -Z, +Z
+)
+
+
+def _bound_box_corners(obj: bpy.types.Object) -> np.ndarray:
+    """Local-space bound_box corners as an (8, 3) float32 array, copied in one call"""
+    corners = np.empty(24, dtype=np.float32)
+    obj.bound_box.foreach_get(corners)
+    return corners.reshape(8, 3)
+
+
+def _world_bound_box(obj: bpy.types.Object) -> np.ndarray:
+    """World-space bound_box corners as an (8, 3) array"""
+    matrix = np.asarray(obj.matrix_world, dtype=np.float64)
+    return _bound_box_corners(obj) @ matrix[:3, :3].T + matrix[:3, 3]
+
+
+def _spheres_in_frustum(centers: np.ndarray, radii: np.ndarray, planes: np.ndarray) -> np.ndarray:
+    """Boolean mask of (N, 3) spheres that are not fully outside any of the (6, 4) planes"""
+    signed = centers @ planes[:, :3].T + planes[:, 3]
+    return (signed >= -radii[:, None]).all(axis=1)
 
 
 class OcclusionCullingSystem:
@@ -358,9 +659,18 @@ class OcclusionCullingSystem:
     def __init__(self):
         self.occluders: List[bpy.types.Object] = []
         self.occludees: List[bpy.types.Object] = []
+        self.occluder_bvh = None
+        self._occludee_keys: Set[int] = set()
+        self._local_radii: Dict[int, float] = {}
+        self._frustum_planes: Optional[np.ndarray] = None
+        self._frustum_key = None
         
     def setup_occlusion_culling(self, scene: bpy.types.Scene):
         """Set up occlusion culling for the scene"""
+        self.occluders = []
+        self.occludees = []
+        self._local_radii = {}
+        
         # Identify large static objects as occluders
         for obj in scene.objects:
             if obj.type == 'MESH':
@@ -375,18 +685,31 @@ class OcclusionCullingSystem:
                 else:
                     self.occludees.append(obj)
                     obj["is_occludee"] = True
+        
+        self._occludee_keys = {obj.as_pointer() for obj in self.occludees}
+        self.occluder_bvh = self._build_occluder_bvh()
+    
+    def _build_occluder_bvh(self):
+        """Build a BVH over the world-space bounding boxes of all occluders"""
+        if not self.occluders:
+            return None
+        from mathutils.bvhtree import BVHTree
+        
+        verts = np.concatenate([_world_bound_box(occluder) for occluder in self.occluders])
+        faces = np.asarray(_BOUND_BOX_FACES)
+        polys = (faces[None, :, :] + 8 * np.arange(len(self.occluders))[:, None, None]).reshape(-1, 4)
+        return BVHTree.FromPolygons(verts.tolist(), polys.tolist())
                     
     def _get_bounding_box_volume(self, obj: bpy.types.Object) -> float:
         """Calculate bounding box volume in cubic meters"""
         if not obj.data:
             return 0.0
             
-        bbox = [obj.matrix_world @ mathutils.Vector(corner) for corner in obj.bound_box]
-        dimensions = [
-            max(v[i] for v in bbox) - min(v[i] for v in bbox)
-            for i in range(3)
-        ]
-        return dimensions[0] * dimensions[1] * dimensions[2]
+        # Extents of the transformed corners; translation cancels out, so only
+        # the 3x3 part of the world matrix is needed
+        linear = np.asarray(obj.matrix_world, dtype=np.float64)[:3, :3]
+        world = _bound_box_corners(obj) @ linear.T
+        return float(np.prod(world.max(axis=0) - world.min(axis=0)))
     
     def is_object_visible(self, obj: bpy.types.Object, camera: bpy.types.Object) -> bool:
         """Check if an object is visible from camera (frustum + occlusion test)"""
@@ -394,51 +717,133 @@ class OcclusionCullingSystem:
         if not self._is_in_frustum(obj, camera):
             return False
             
-        # Occlusion check (simplified)
-        if obj in self.occludees:
-            for occluder in self.occluders:
-                if self._is_occluded(obj, occluder, camera):
-                    return False
+        # Occlusion check against the occluder BVH
+        if obj.as_pointer() in self._occludee_keys and self._is_occluded(obj, camera):
+            return False
                     
         return True
     
-    def _is_in_frustum(self, obj: bpy.types.Object, camera: bpy.types.Object) -> bool:
-        """Check if object is within camera frustum"""
-        # Simplified frustum check using bounding sphere
-        cam_loc = camera.matrix_world.translation
-        obj_loc = obj.matrix_world.translation
+    def cull_objects(self, objs: List[bpy.types.Object], camera: bpy.types.Object) -> np.ndarray:
+        """
+        Frustum and occlusion test many objects at once.
         
-        # Get object bounding radius
-        bbox = obj.bound_box
-        max_dist = max((mathutils.Vector(corner) - mathutils.Vector((0, 0, 0))).length for corner in bbox)
+        Bounding spheres of all objects are tested against the frustum in one
+        NumPy pass; only the survivors are ray cast against the occluder BVH.
         
-        # Distance check
-        distance = (obj_loc - cam_loc).length
-        
-        # Check if within reasonable view distance
-        return distance < 100.0  # 100m view distance
+        Args:
+            objs: Objects to test
+            camera: Camera to test against
+            
+        Returns:
+            Boolean visibility mask aligned with objs
+        """
+        if not objs:
+            return np.zeros(0, dtype=bool)
+        
+        matrices = np.array([obj.matrix_world for obj in objs], dtype=np.float64)
+        # Largest axis scale of each world matrix
+        scales = np.sqrt((matrices[:, :3, :3] ** 2).sum(axis=1)).max(axis=1)
+        radii = np.array([self._local_radius(obj) for obj in objs]) * scales
+        visible = _spheres_in_frustum(matrices[:, :3, 3], radii, self._get_frustum_planes(camera))
+        
+        if self.occluder_bvh is not None:
+            for index in np.flatnonzero(visible):
+                obj = objs[index]
+                if obj.as_pointer() in self._occludee_keys and self._is_occluded(obj, camera):
+                    visible[index] = False
+        return visible
     
-    def _is_occluded(self, obj: bpy.types.Object, occluder: bpy.types.Object, camera: bpy.types.Object) -> bool:
-        """Check if object is occluded by another object"""
-        # Simplified occlusion check
-        cam_loc = camera.matrix_world.translation
-        obj_loc = obj.matrix_world.translation
-        occ_loc = occluder.matrix_world.translation
-        
-        # Check if occluder is between camera and object
-        cam_to_obj = obj_loc - cam_loc
-        cam_to_occ = occ_loc - cam_loc
+    def _is_in_frustum(self, obj: bpy.types.Object, camera: bpy.types.Object) -> bool:
+        """Check if object is within camera frustum"""
+        # Bounding sphere against the six frustum planes
+        center, radius = self._bounding_sphere(obj)
+        planes = self._get_frustum_planes(camera)
+        return bool(_spheres_in_frustum(center[None, :], np.array([radius]), planes)[0])
+    
+    def _bounding_sphere(self, obj: bpy.types.Object) -> Tuple[np.ndarray, float]:
+        """World-space bounding sphere (center, radius) around the object origin"""
+        matrix = np.asarray(obj.matrix_world, dtype=np.float64)
+        # Largest axis scale of the world matrix
+        scale = float(np.sqrt((matrix[:3, :3] ** 2).sum(axis=0)).max())
+        return matrix[:3, 3].copy(), self._local_radius(obj) * scale
+    
+    def _local_radius(self, obj: bpy.types.Object) -> float:
+        """Object-space bounding radius around the origin, memoized until the next setup"""
+        key = obj.as_pointer()
+        radius = self._local_radii.get(key)
+        if radius is None:
+            corners = _bound_box_corners(obj)
+            radius = self._local_radii[key] = float(np.sqrt((corners * corners).sum(axis=1).max()))
+        return radius
+    
+    def _get_frustum_planes(self, camera: bpy.types.Object) -> np.ndarray:
+        """Frustum planes for the camera, rebuilt only when the camera changes"""
+        render = bpy.context.scene.render
+        cam = camera.data
+        key = (
+            camera.as_pointer(),
+            tuple(value for row in camera.matrix_world for value in row),
+            cam.type, cam.lens, cam.ortho_scale, cam.sensor_width, cam.sensor_fit,
+            cam.shift_x, cam.shift_y, cam.clip_start, cam.clip_end,
+            render.resolution_x, render.resolution_y,
+            render.pixel_aspect_x, render.pixel_aspect_y
+        )
+        if self._frustum_key != key:
+            self._frustum_planes = self._build_frustum_planes(camera, render)
+            self._frustum_key = key
+        return self._frustum_planes
+    
+    @staticmethod
+    def _build_frustum_planes(camera: bpy.types.Object, render) -> np.ndarray:
+        """Extract the six (6, 4) normalized frustum planes from the view-projection matrix"""
+        projection = camera.calc_matrix_camera(
+            bpy.context.evaluated_depsgraph_get(),
+            x=render.resolution_x,
+            y=render.resolution_y,
+            scale_x=render.pixel_aspect_x,
+            scale_y=render.pixel_aspect_y
+        )
+        view_proj = np.asarray(projection @ camera.matrix_world.inverted(), dtype=np.float64)
+        
+        # Gribb-Hartmann: left, right, bottom, top, near, far
+        w = view_proj[3]
+        planes = np.stack([w + view_proj[0], w - view_proj[0],
+                           w + view_proj[1], w - view_proj[1],
+                           w + view_proj[2], w - view_proj[2]])
+        planes /= np.linalg.norm(planes[:, :3], axis=1, keepdims=True)
+        return planes
+    
+    def _is_occluded(self, obj: bpy.types.Object, camera: bpy.types.Object) -> bool:
+        """Check if any occluder lies between the camera and the object"""
+        if self.occluder_bvh is None:
+            return False
         
-        # Check if occluder is closer to camera and roughly in same direction
-        if cam_to_occ.length < cam_to_obj.length:
-            # Check angle between vectors
-            try:
-                angle = cam_to_obj.angle(cam_to_occ)
-                return angle < 0.3  # Within ~17 degrees
-            except ValueError:
-                return False
+        cam_loc = camera.matrix_world.translation
+        cam_to_obj = obj.matrix_world.translation - cam_loc
+        distance = cam_to_obj.length
+        if distance == 0.0:
+            return False
         
-        return False
+        # Cast a ray from the camera towards the object center
+        hit, _, _, hit_distance = self.occluder_bvh.ray_cast(cam_loc, cam_to_obj / distance, distance)
+        return hit is not None and hit_distance < distance
+
+
+class _BufferPool:
+    """Reusable zeroed NumPy buffers keyed on (shape, dtype)"""
+    
+    def __init__(self):
+        self._cache: Dict[Tuple[Tuple[int, ...], Any], np.ndarray] = {}
+    
+    def get(self, shape: Tuple[int, ...], dtype=np.float32) -> np.ndarray:
+        """Zero-filled buffer of the given shape; the same array is handed out again"""
+        key = (tuple(shape), np.dtype(dtype))
+        buf = self._cache.get(key)
+        if buf is None:
+            buf = self._cache[key] = np.zeros(shape, dtype=dtype)
+        else:
+            buf.fill(0)
+        return buf
 
 
 class TextureAtlasBuilder:
@@ -449,8 +854,9 @@ class TextureAtlasBuilder:
         self.atlas_images: Dict[str, bpy.types.Image] = {}
         self.uv_mappings: Dict[str, Tuple[float, float, float, float]] = {}
         
-    def build_atlas(self, textures: List[bpy.types.Image], atlas_name: str) -> Optional[bpy.types.Image]:
-        """Build a texture atlas from multiple textures"""
+    def build_atlas(self, textures: List[bpy.types.Image], atlas_name: str,
+                    pool: Optional[_BufferPool] = None) -> Optional[bpy.types.Image]:
+        """Build a texture atlas from multiple textures, packing in a pooled buffer if given"""
         if not textures:
             return None
             
@@ -471,8 +877,9 @@ class TextureAtlasBuilder:
             alpha=True
         )
         
-        # Pack textures into atlas
-        pixels = [0.0] * (atlas_size * atlas_size * 4)
+        # Pack textures into a float32 RGBA buffer (rows bottom-up, as in Blender)
+        shape = (atlas_size, atlas_size, 4)
+        buf = pool.get(shape) if pool is not None else np.zeros(shape, dtype=np.float32)
         
         for idx, tex in enumerate(textures):
             if not tex or not tex.pixels:
@@ -492,14 +899,46 @@ class TextureAtlasBuilder:
                 (y_offset + cell_size) / atlas_size
             )
             
-            # Copy texture pixels (simplified - assumes same size)
-            # In production, this would scale textures to fit cells
+            # Copy texture pixels, nearest-neighbour scaled to fit the cell
+            if cell_size > 0:
+                buf[y_offset:y_offset + cell_size, x_offset:x_offset + cell_size] = \
+                    self._resample_to_cell(self._read_rgba(tex), cell_size)
             
-        atlas.pixels = pixels
+        atlas.pixels.foreach_set(buf.ravel())
         self.atlas_images[atlas_name] = atlas
         
         return atlas
     
+    @staticmethod
+    def _read_rgba(image: bpy.types.Image) -> np.ndarray:
+        """Read image pixels into an (height, width, 4) float32 array"""
+        width, height = image.size
+        channels = image.channels
+        src = np.empty(width * height * channels, dtype=np.float32)
+        image.pixels.foreach_get(src)
+        src = src.reshape(height, width, channels)
+        if channels == 4:
+            return src
+        
+        rgba = np.ones((height, width, 4), dtype=np.float32)
+        if channels >= 3:
+            rgba[..., :3] = src[..., :3]
+        else:
+            rgba[..., :3] = src[..., :1]
+            if channels == 2:
+                rgba[..., 3] = src[..., 1]
+        return rgba
+    
+    @staticmethod
+    def _resample_to_cell(src: np.ndarray, cell_size: int) -> np.ndarray:
+        """Nearest-neighbour resample an (h, w, 4) array to (cell_size, cell_size, 4)"""
+        height, width = src.shape[:2]
+        if height == cell_size and width == cell_size:
+            return src
+        rows = np.arange(cell_size) * height // cell_size
+        cols = np.arange(cell_size) * width // cell_size
+        return src[rows[:, None], cols]
+    
     def apply_atlas_to_material(self, mat: bpy.types.Material, atlas: bpy.types.Image, 
                                  original_uv_map: str = "UVMap"):
         """Update material to use texture atlas with adjusted UVs"""
@@ -539,6 +978,11 @@ class RealtimeLightingSetup:
         self.config = config
         self.baked_lights: List[bpy.types.Object] = []
         self.realtime_lights: List[bpy.types.Object] = []
+        self._lighting_dispatch = {
+            LightingMode.BAKED: self._setup_baked_lighting,
+            LightingMode.MIXED: self._setup_mixed_lighting,
+            LightingMode.FULLY_REALTIME: self._setup_fully_realtime
+        }
         
     def setup_lighting(self, scene: bpy.types.Scene, target: bpy.types.Object) -> Dict[str, Any]:
         """Setup optimized real-time lighting"""
@@ -550,12 +994,7 @@ class RealtimeLightingSetup:
             'light_cookies': []
         }
         
-        if self.config.lighting_mode == LightingMode.BAKED:
-            self._setup_baked_lighting(scene, target, results)
-        elif self.config.lighting_mode == LightingMode.MIXED:
-            self._setup_mixed_lighting(scene, target, results)
-        else:  # FULLY_REALTIME
-            self._setup_fully_realtime(scene, target, results)
+        self._lighting_dispatch[self.config.lighting_mode](scene, target, results)
             
         # Setup reflection probes
         if self.config.use_reflection_probes:
@@ -635,13 +1074,15 @@ class RealtimeLightingSetup:
         
     def _create_reflection_probe(self, scene: bpy.types.Scene, target: bpy.types.Object) -> bpy.types.Object:
         """Create reflection probe for specular reflections"""
+        from mathutils import Vector
+        
         # Create empty as reflection probe placeholder
         probe = bpy.data.objects.new("ReflectionProbe", None)
         probe.empty_display_type = 'SPHERE'
         probe.empty_display_size = 2.0
         
         # Position near target
-        probe.location = target.matrix_world.translation + mathutils.Vector((0, 2, 0))
+        probe.location = target.matrix_world.translation + Vector((0, 2, 0))
         
         scene.collection.objects.link(probe)
         
@@ -681,20 +1122,16 @@ class DrawCallBatcher:
         
     def batch_by_material(self, objects: List[bpy.types.Object]) -> Dict[str, List[bpy.types.Object]]:
         """Group objects by material for batching"""
-        self.batches = {}
+        self.batches = defaultdict(list)
         
         for obj in objects:
             if obj.type != 'MESH':
                 continue
                 
             # Get primary material name
-            mat_name = "no_material"
-            if obj.data.materials and obj.data.materials[0]:
-                mat_name = obj.data.materials[0].name
-                
-            if mat_name not in self.batches:
-                self.batches[mat_name] = []
-            self.batches[mat_name].append(obj)
+            materials = obj.data.materials
+            mat = materials[0] if materials else None
+            self.batches[mat.name if mat else "no_material"].append(obj)
             
         return self.batches
     
@@ -703,20 +1140,72 @@ class DrawCallBatcher:
         if len(objects) < 2:
             return objects[0] if objects else None
             
-        # Select objects
-        bpy.ops.object.select_all(action='DESELECT')
-        for obj in objects:
-            obj.select_set(True)
-        
-        bpy.context.view_layer.objects.active = objects[0]
+        import bmesh
         
-        # Join objects
-        bpy.ops.object.join()
+        # Join the meshes into the first object's local space in one bmesh;
+        # the join operator would rewrite selection and push an undo step
+        target = objects[0]
+        to_target = target.matrix_world.inverted()
+        bm = bmesh.new()
+        materials: List[Optional[bpy.types.Material]] = []
+        material_slots: Dict[Optional[bpy.types.Material], int] = {}
+        face_spans = []
         
-        merged = bpy.context.active_object
-        merged.name = batch_name
-        
-        return merged
+        for obj in objects:
+            vert_start = len(bm.verts)
+            face_start = len(bm.faces)
+            bm.from_mesh(obj.data)
+            bm.verts.ensure_lookup_table()
+            bm.faces.ensure_lookup_table()
+            
+            matrix = to_target @ obj.matrix_world
+            bmesh.ops.transform(bm, matrix=matrix, verts=bm.verts[vert_start:])
+            if matrix.determinant() < 0.0:
+                # Mirrored transforms flip the winding
+                bmesh.ops.reverse_faces(bm, faces=bm.faces[face_start:])
+            
+            # Map this mesh's material slots onto the merged slot list
+            remap = []
+            for mat in obj.data.materials or (None,):
+                slot = material_slots.get(mat)
+                if slot is None:
+                    slot = material_slots[mat] = len(materials)
+                    materials.append(mat)
+                remap.append(slot)
+            face_spans.append((face_start, len(bm.faces), np.array(remap, dtype=np.int32)))
+        
+        merged_mesh = bpy.data.meshes.new(batch_name)
+        bm.to_mesh(merged_mesh)
+        bm.free()
+        for mat in materials:
+            merged_mesh.materials.append(mat)
+        
+        material_indices = np.empty(len(merged_mesh.polygons), dtype=np.int32)
+        merged_mesh.polygons.foreach_get('material_index', material_indices)
+        for start, end, remap in face_spans:
+            span = material_indices[start:end]
+            material_indices[start:end] = remap[np.minimum(span, len(remap) - 1)]
+        merged_mesh.polygons.foreach_set('material_index', material_indices)
+        
+        # Like the join, the first object takes the merged mesh and the rest are removed
+        old_mesh = target.data
+        target.data = merged_mesh
+        target.name = batch_name
+        for obj in objects[1:]:
+            bpy.data.objects.remove(obj)
+        if old_mesh.users == 0:
+            bpy.data.meshes.remove(old_mesh)
+        
+        return target
+
+
+# Texture compression format per target platform
+_PLATFORM_TEXTURE_FORMAT = {
+    PlatformType.PC_HIGH_END: TextureFormat.BC7,
+    PlatformType.CONSOLE: TextureFormat.BC7,
+    PlatformType.MOBILE: TextureFormat.ASTC_4x4,
+    PlatformType.VR: TextureFormat.ASTC_4x4
+}
 
 
 class RealtimeEngineOptimizer:
@@ -727,18 +1216,26 @@ class RealtimeEngineOptimizer:
         self.budget = PerformanceBudget(platform, 0, 0, 10000)
         self.mesh_config = MeshOptimizationConfig()
         self.texture_config = TextureOptimizationConfig(
-            compression_format=TextureFormat.BC7 if platform in [PlatformType.PC_HIGH_END, PlatformType.CONSOLE] 
-                              else TextureFormat.ASTC_4x4
+            compression_format=_PLATFORM_TEXTURE_FORMAT.get(platform, TextureFormat.ASTC_4x4)
         )
         self.shader_config = ShaderOptimizationConfig()
         self.lighting_config = RealtimeLightingConfig()
         
-        self.profiler = PerformanceProfiler()
+        self.profiler = PerformanceProfiler(
+            self.texture_config.compression_format, self.texture_config.use_mipmaps
+        )
         self.lod_system = LODSystem(self.mesh_config)
         self.occlusion_system = OcclusionCullingSystem()
         self.atlas_builder = TextureAtlasBuilder(self.texture_config)
         self.lighting_setup = RealtimeLightingSetup(self.lighting_config)
         self.batcher = DrawCallBatcher()
+        self.buffer_pool = _BufferPool()
+        
+        # Scene snapshot shared by the optimization passes, see _gather_scene
+        self._mesh_cache: List[bpy.types.Object] = []
+        self._poly_counts = np.zeros(0, dtype=np.int32)
+        self._mat_cache: List[bpy.types.Material] = []
+        self._tex_nodes: List[Tuple[bpy.types.Material, bpy.types.Node, bpy.types.Image]] = []
         
     def optimize_for_platform(self, scene: bpy.types.Scene, target: bpy.types.Object) -> Dict[str, Any]:
         """Run complete optimization for target platform"""
@@ -748,78 +1245,114 @@ class RealtimeEngineOptimizer:
             'optimizations': {}
         }
         
-        print(f"\n⚡ Real-Time Engine Optimization for {self.platform.value.upper()}")
-        print(f"   Triangle Budget: {self.budget.triangle_budget:,}")
-        print(f"   Texture Memory: {self.budget.texture_memory_mb}MB")
-        print(f"   Max Draw Calls: {self.budget.max_draw_calls}")
+        # Progress lines are collected and written in one go at the end
+        log: List[str] = []
+        log.append(f"\n⚡ Real-Time Engine Optimization for {self.platform.value.upper()}")
+        log.append(f"   Triangle Budget: {self.budget.triangle_budget:,}")
+        log.append(f"   Texture Memory: {self.budget.texture_memory_mb}MB")
+        log.append(f"   Max Draw Calls: {self.budget.max_draw_calls}")
         
         # Profile current state
-        print("\n📊 Profiling scene...")
+        log.append("\n📊 Profiling scene...")
         stats = self.profiler.profile_scene(scene)
-        print(f"   Triangles: {stats['triangle_count']:,}")
-        print(f"   Draw Calls: {stats['draw_calls']}")
-        print(f"   Texture Memory: {stats['texture_memory']}MB")
+        log.append(f"   Triangles: {stats['triangle_count']:,}")
+        log.append(f"   Draw Calls: {stats['draw_calls']}")
+        log.append(f"   Texture Memory: {stats['texture_memory']}MB")
         
         # Check budget compliance
         compliance = self.profiler.check_budget_compliance(self.budget)
         if not compliance['within_budget']:
-            print("\n⚠️  Budget violations detected:")
+            log.append("\n⚠️  Budget violations detected:")
             for violation in compliance['violations']:
-                print(f"   - {violation}")
+                log.append(f"   - {violation}")
+        
+        # Walk the scene once for all optimization passes
+        self._gather_scene(scene)
         
         # Apply mesh optimizations
-        print("\n🔧 Applying mesh optimizations...")
-        mesh_results = self._optimize_meshes(scene)
+        log.append("\n🔧 Applying mesh optimizations...")
+        mesh_results, mesh_delta = self._optimize_meshes(scene)
         results['optimizations']['mesh'] = mesh_results
         
         # Apply texture optimizations
-        print("\n🎨 Applying texture optimizations...")
+        log.append("\n🎨 Applying texture optimizations...")
         texture_results = self._optimize_textures(scene)
         results['optimizations']['texture'] = texture_results
         
         # Apply shader optimizations
-        print("\n📝 Applying shader optimizations...")
-        shader_results = self._optimize_shaders(scene)
+        log.append("\n📝 Applying shader optimizations...")
+        shader_results, shader_delta = self._optimize_shaders(scene)
         results['optimizations']['shader'] = shader_results
         
         # Setup real-time lighting
-        print("\n💡 Setting up real-time lighting...")
+        log.append("\n💡 Setting up real-time lighting...")
         lighting_results = self.lighting_setup.setup_lighting(scene, target)
         results['optimizations']['lighting'] = lighting_results
         
-        # Final profile
-        print("\n📊 Final scene profile:")
-        final_stats = self.profiler.profile_scene(scene)
-        print(f"   Triangles: {final_stats['triangle_count']:,}")
-        print(f"   Draw Calls: {final_stats['draw_calls']}")
-        print(f"   Texture Memory: {final_stats['texture_memory']}MB")
+        # Final profile. Triangles and draw calls only change with the LOD
+        # objects and shader complexity with the removed nodes; objects and
+        # lights are recounted as the lighting pass adds a reflection probe
+        # and may add lights.
+        log.append("\n📊 Final scene profile:")
+        self.profiler.apply_deltas(**mesh_delta, **shader_delta)
+        final_stats = self.profiler.recount_objects(scene)
+        log.append(f"   Triangles: {final_stats['triangle_count']:,}")
+        log.append(f"   Draw Calls: {final_stats['draw_calls']}")
+        log.append(f"   Texture Memory: {final_stats['texture_memory']}MB")
         
         final_compliance = self.profiler.check_budget_compliance(self.budget)
         results['within_budget'] = final_compliance['within_budget']
         
         if final_compliance['within_budget']:
-            print("\n✅ Scene is within performance budget!")
+            log.append("\n✅ Scene is within performance budget!")
         else:
-            print("\n⚠️  Scene still exceeds budget. Further optimization needed.")
-            
+            log.append("\n⚠️  Scene still exceeds budget. Further optimization needed.")
+        
+        print("\n".join(log))
         return results
     
-    def _optimize_meshes(self, scene: bpy.types.Scene) -> Dict[str, Any]:
-        """Apply all mesh optimizations"""
+    def _gather_scene(self, scene: bpy.types.Scene):
+        """Snapshot mesh objects, polygon counts, materials and image nodes in one walk"""
+        # foreach_get only handles numeric properties, so the enum object type
+        # is still read per object; polygon counts are read once per mesh
+        self._mesh_cache = [obj for obj in scene.objects if obj.type == 'MESH']
+        meshes = [obj.data for obj in self._mesh_cache]
+        mesh_polys = {mesh: len(mesh.polygons) for mesh in set(meshes)}
+        self._poly_counts = np.fromiter(
+            (mesh_polys[mesh] for mesh in meshes), dtype=np.int32, count=len(meshes)
+        )
+        self._mat_cache = list(bpy.data.materials)
+        self._tex_nodes = [
+            (mat, node, node.image)
+            for mat in self._mat_cache if mat.use_nodes
+            for node in mat.node_tree.nodes if node.type == 'TEX_IMAGE' and node.image
+        ]
+    
+    def _optimize_meshes(self, scene: bpy.types.Scene) -> Tuple[Dict[str, Any], Dict[str, int]]:
+        """Apply all mesh optimizations; also returns the change in profiled stats"""
         results = {
             'lod_chains_created': 0,
             'occlusion_culling_setup': False,
             'draw_calls_batched': 0
         }
-        
-        # Generate LOD chains for complex objects
-        for obj in scene.objects:
-            if obj.type == 'MESH':
-                # Check triangle count
-                if len(obj.data.polygons) > 1000:
-                    lod_objects = self.lod_system.generate_lod_chain(obj)
-                    if lod_objects:
-                        results['lod_chains_created'] += 1
+        delta = {'triangle_count': 0, 'draw_calls': 0}
+        
+        # Generate LOD chains for complex objects; the snapshot predates them,
+        # so new levels are appended for the batching pass below
+        mesh_objects = list(self._mesh_cache)
+        for idx in np.flatnonzero(self._poly_counts > 1000):
+            source = self._mesh_cache[idx]
+            lod_objects = self.lod_system.generate_lod_chain(source)
+            if lod_objects:
+                results['lod_chains_created'] += 1
+                
+                # Every level besides the source is a new mesh object in the scene
+                for lod_obj in lod_objects.values():
+                    if lod_obj is not source:
+                        mesh_objects.append(lod_obj)
+                        mesh = lod_obj.data
+                        delta['triangle_count'] += len(mesh.loops) - 2 * len(mesh.polygons)
+                        delta['draw_calls'] += len(mesh.materials) or 1
                         
         # Setup occlusion culling
         if self.mesh_config.enable_occlusion_culling:
@@ -828,12 +1361,11 @@ class RealtimeEngineOptimizer:
             
         # Batch draw calls
         if self.mesh_config.batch_draw_calls:
-            mesh_objects = [obj for obj in scene.objects if obj.type == 'MESH']
             batches = self.batcher.batch_by_material(mesh_objects)
             results['batches_created'] = len(batches)
             results['draw_calls_batched'] = len(mesh_objects) - len(batches)
             
-        return results
+        return results, delta
     
     def _optimize_textures(self, scene: bpy.types.Scene) -> Dict[str, Any]:
         """Apply all texture optimizations"""
@@ -843,76 +1375,92 @@ class RealtimeEngineOptimizer:
             'mipmaps_enabled': 0
         }
         
-        # Collect all textures
-        textures = []
-        for mat in bpy.data.materials:
-            if mat.use_nodes:
-                for node in mat.node_tree.nodes:
-                    if node.type == 'TEX_IMAGE' and node.image:
-                        textures.append(node.image)
-                        
-                        # Enable mipmaps
-                        if self.texture_config.use_mipmaps:
-                            img = node.image
-                            # In Blender, mipmaps are handled per image
-                            img["use_mipmaps"] = True
-                            results['mipmaps_enabled'] += 1
+        # Collect all textures, each image once however many nodes use it
+        unique_images = {img.as_pointer(): img for _, _, img in self._tex_nodes}
+        textures = list(unique_images.values())
+        
+        # Enable mipmaps
+        if self.texture_config.use_mipmaps:
+            for img in textures:
+                # In Blender, mipmaps are handled per image
+                img["use_mipmaps"] = True
+            results['mipmaps_enabled'] = len(textures)
         
         # Build texture atlases for small textures
         if self.texture_config.enable_atlasing and len(textures) > 4:
-            small_textures = [t for t in textures if t.size[0] <= 512 and t.size[1] <= 512]
-            if len(small_textures) > 4:
-                atlas = self.atlas_builder.build_atlas(small_textures, "StoneAtlas")
+            sizes = np.array([tuple(t.size) for t in textures], dtype=np.int32)
+            small = np.flatnonzero((sizes <= 512).all(axis=1))
+            if small.size > 4:
+                small_textures = [textures[i] for i in small]
+                atlas = self.atlas_builder.build_atlas(small_textures, "StoneAtlas", self.buffer_pool)
                 if atlas:
                     results['atlases_created'] += 1
                     
         return results
     
-    def _optimize_shaders(self, scene: bpy.types.Scene) -> Dict[str, Any]:
-        """Apply shader optimizations"""
+    def _optimize_shaders(self, scene: bpy.types.Scene) -> Tuple[Dict[str, Any], Dict[str, int]]:
+        """Apply shader optimizations; also returns the change in profiled stats"""
         results = {
             'materials_optimized': 0,
-            'instructions_reduced': 0
+            'instructions_reduced': 0,
+            'nodes_removed': 0
         }
         
-        for mat in bpy.data.materials:
-            if not mat.use_nodes:
-                continue
-                
-            # Simplify complex node trees
+        # Classify every node tree first (read only), then apply the results
+        materials = [mat for mat in self._mat_cache if mat.use_nodes]
+        classified = [self._classify_material(mat) for mat in materials]
+        
+        for mat, (original_count, nodes_to_remove) in zip(materials, classified):
             nodes = mat.node_tree.nodes
-            original_count = len(nodes)
+            for node in nodes_to_remove:
+                nodes.remove(node)
+            results['nodes_removed'] += len(nodes_to_remove)
             
-            # Remove unnecessary nodes (viewers, reroutes with single connection)
-            nodes_to_remove = []
-            for node in nodes:
-                if node.type == 'VIEWER':
-                    nodes_to_remove.append(node)
-                elif node.type == 'REROUTE' and len(node.inputs) > 0:
-                    # Check if reroute can be bypassed
-                    if node.inputs[0].is_linked and node.outputs[0].is_linked:
-                        # Could potentially merge, but keep for clarity
-                        pass
-                        
             # Mark optimization
             if original_count > 10:
                 results['materials_optimized'] += 1
                 results['instructions_reduced'] += original_count // 10
-                
-        return results
+        
+        # The profiler estimates 7 instructions per node
+        delta = {'shader_complexity': -7 * results['nodes_removed']}
+        return results, delta
+    
+    @staticmethod
+    def _classify_material(mat: bpy.types.Material) -> Tuple[int, List[bpy.types.Node]]:
+        """Node count of a material's tree and the nodes that could be removed"""
+        # Snapshot the nodes and their types once instead of going through
+        # the collection per access
+        node_list = mat.node_tree.nodes.values()
+        if len(node_list) <= 10:
+            # Too simple to be worth optimizing; skip the per-node reads
+            return len(node_list), []
+        node_types = [node.type for node in node_list]
+        
+        # Unnecessary nodes (viewers). Reroutes with a single connection
+        # could be bypassed too, but are kept for clarity.
+        nodes_to_remove = [
+            node for node, node_type in zip(node_list, node_types) if node_type == 'VIEWER'
+        ]
+        return len(node_list), nodes_to_remove
     
     def _budget_to_dict(self) -> Dict[str, Any]:
         """Convert budget to dictionary"""
+        budget = self.budget
         return {
-            'platform': self.budget.platform.value,
-            'triangle_budget': self.budget.triangle_budget,
-            'texture_memory_mb': self.budget.texture_memory_mb,
-            'max_draw_calls': self.budget.max_draw_calls,
-            'target_fps': self.budget.target_fps,
-            'max_lights_realtime': self.budget.max_lights_realtime
+            'platform': budget.platform.value,
+            'triangle_budget': budget.triangle_budget,
+            'texture_memory_mb': budget.texture_memory_mb,
+            'max_draw_calls': budget.max_draw_calls,
+            'target_fps': budget.target_fps,
+            'max_lights_realtime': budget.max_lights_realtime
         }
 
 
+# Lookup of the string arguments accepted by the convenience functions
+_PLATFORM_MAP = MappingProxyType({platform.value: platform for platform in PlatformType})
+_MODE_MAP = MappingProxyType({mode.value: mode for mode in LightingMode})
+
+
 def setup_realtime_optimization(scene: bpy.types.Scene, target: bpy.types.Object,
                                    platform: str = "pc_high_end") -> Dict[str, Any]:
     """
@@ -933,14 +1481,7 @@ def setup_realtime_optimization(scene: bpy.types.Scene, target: bpy.types.Object
         ...     platform="vr"
         ... )
     """
-    platform_map = {
-        'mobile': PlatformType.MOBILE,
-        'console': PlatformType.CONSOLE,
-        'pc_high_end': PlatformType.PC_HIGH_END,
-        'vr': PlatformType.VR
-    }
-    
-    platform_type = platform_map.get(platform.lower(), PlatformType.PC_HIGH_END)
+    platform_type = _PLATFORM_MAP.get(platform.lower(), PlatformType.PC_HIGH_END)
     optimizer = RealtimeEngineOptimizer(platform_type)
     
     return optimizer.optimize_for_platform(scene, target)
@@ -959,13 +1500,7 @@ def configure_lighting_mode(scene: bpy.types.Scene, mode: str = "mixed",
     Returns:
         Dictionary with lighting configuration results
     """
-    mode_map = {
-        'baked': LightingMode.BAKED,
-        'mixed': LightingMode.MIXED,
-        'fully_realtime': LightingMode.FULLY_REALTIME
-    }
-    
-    lighting_mode = mode_map.get(mode.lower(), LightingMode.MIXED)
+    lighting_mode = _MODE_MAP.get(mode.lower(), LightingMode.MIXED)
     config = RealtimeLightingConfig(
         lighting_mode=lighting_mode,
         max_realtime_lights=max_realtime_lights
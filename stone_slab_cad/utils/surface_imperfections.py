@@ -8,14 +8,18 @@ Implements photorealistic micro-details for stone slab visualization:
 - Enhanced contact shadows and ambient occlusion
 """
 import bpy
-import mathutils
-import noise
 import random
+import hashlib
+import tempfile
 from typing import Dict, List, Tuple, Optional, Any, Union
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, astuple, replace
 from enum import Enum
 from pathlib import Path
 import math
+import functools
+import numpy as np
+
+from ._noise_kernels import simplex2d_pyramid, ridged_multifractal
 
 
 class ImperfectionType(Enum):
@@ -40,9 +44,9 @@ class WearPattern(Enum):
     HEAT_MARKS = "heat_marks"  # Heat exposure patterns
 
 
-@dataclass
+@dataclass(frozen=True)
 class SurfaceImperfectionConfig:
-    """Configuration for surface imperfections"""
+    """Configuration for surface imperfections (immutable, so presets can be shared)"""
     # Micro-displacement settings
     displacement_scale: float = 0.001  # Subtle displacement
     displacement_detail: float = 8.0  # Noise detail level
@@ -70,6 +74,14 @@ class SurfaceImperfectionConfig:
     # AO enhancement
     ao_intensity: float = 1.0  # Ambient occlusion strength
     contact_shadow_distance: float = 0.01  # Contact shadow proximity
+    
+    # Live noise settings
+    use_hashed_noise: bool = False  # Hash-based OSL noise instead of Noise/Musgrave textures (needs Cycles OSL enabled)
+    
+    # Baking settings
+    use_baked: bool = False  # Bake the procedural stack into image textures
+    bake_resolution: int = 2048  # Baked and generated map size in pixels
+    max_resolution: int = 2048  # Map size of preset configs at LOD 0
 
 
 @dataclass
@@ -83,6 +95,182 @@ class ImperfectionMaps:
     wear_mask_path: Optional[str] = None
 
 
+# Smallest generated map size, used for the most distant slabs
+_MIN_MAP_RESOLUTION = 256
+
+# Channels baked through Cycles: node name, input socket, float (EXR) storage.
+# Displacement height comes from a precomputed noise map when baking.
+_BAKE_CHANNELS = {
+    'color': ('Principled BSDF', 'Base Color', False),
+    'roughness': ('Principled BSDF', 'Roughness', False),
+}
+
+
+_HASHED_SIMPLEX_OSL = Path(__file__).parent / 'shaders' / 'hashed_simplex.osl'
+
+
+def _hashed_noise(nodes: bpy.types.Nodes, scale: float, detail: float,
+                  roughness: float = 0.5, lacunarity: float = 2.0,
+                  ridged: bool = False, dimension: float = 2.0,
+                  offset: float = 0.0, gain: float = 1.0) -> Optional[bpy.types.Node]:
+    """
+    Script node running hashed_simplex.osl, a table-free replacement for the
+    Noise and ridged Musgrave textures. detail follows the node being
+    replaced: Noise runs detail + 1 octaves, ridged Musgrave detail octaves
+    weighted by dimension, offset and gain (roughness is unused there).
+    
+    Script nodes only run with Cycles' OSL shading system, which is left to
+    the caller to enable (scene.cycles.shading_system = True); it forces CPU
+    rendering for the whole scene. Returns None when OSL is off or the
+    script could not be compiled, so callers fall back to the built-in
+    texture node.
+    """
+    scene = bpy.context.scene
+    if scene.render.engine != 'CYCLES' or not scene.cycles.shading_system:
+        return None
+    
+    script = nodes.new('ShaderNodeScript')
+    script.mode = 'EXTERNAL'
+    script.filepath = str(_HASHED_SIMPLEX_OSL)
+    if 'Fac' not in script.outputs:
+        nodes.remove(script)
+        return None
+    
+    script.inputs['Scale'].default_value = scale
+    script.inputs['Detail'].default_value = detail
+    script.inputs['Roughness'].default_value = roughness
+    script.inputs['Lacunarity'].default_value = lacunarity
+    script.inputs['Dimension'].default_value = dimension
+    script.inputs['Offset'].default_value = offset
+    script.inputs['Gain'].default_value = gain
+    script.inputs['Ridged'].default_value = int(ridged)
+    return script
+
+
+def _shared_node(nodes: bpy.types.Nodes, bl_idname: str, name: str,
+                 location: Tuple[float, float]) -> bpy.types.Node:
+    """Find a node by name or create it, so all generators share one input node"""
+    node = nodes.get(name)
+    if node is None:
+        node = nodes.new(bl_idname)
+        node.name = name
+        node.location = location
+    return node
+
+
+def _base_values(material: bpy.types.Material) -> Tuple[Tuple[float, ...], float]:
+    """Unlinked base color and roughness of the material's BSDF"""
+    bsdf = material.node_tree.nodes.get('Principled BSDF')
+    if not bsdf:
+        return (0.8, 0.8, 0.8, 1.0), 0.5
+    return tuple(bsdf.inputs['Base Color'].default_value), bsdf.inputs['Roughness'].default_value
+
+
+def _mesh_digest(mesh: bpy.types.Mesh) -> str:
+    """Checksum of a mesh's vertex positions and active UV layout"""
+    digest = hashlib.sha1()
+    coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('co', coords)
+    digest.update(repr((len(mesh.vertices), len(mesh.polygons))).encode())
+    digest.update(coords.tobytes())
+    uv_layer = mesh.uv_layers.active
+    if uv_layer is not None:
+        uvs = np.empty(len(uv_layer.data) * 2, dtype=np.float32)
+        uv_layer.data.foreach_get('uv', uvs)
+        digest.update(uvs.tobytes())
+    return digest.hexdigest()
+
+
+def _new_group_socket(group: bpy.types.NodeTree, name: str, in_out: str, socket_type: str) -> None:
+    """Add a group input or output socket (Blender 4.0 interface API or the 3.x one)"""
+    if hasattr(group, 'interface'):
+        group.interface.new_socket(name, in_out=in_out, socket_type=socket_type)
+    elif in_out == 'INPUT':
+        group.inputs.new(socket_type, name)
+    else:
+        group.outputs.new(socket_type, name)
+
+
+def _map_image(name: str, values: np.ndarray) -> bpy.types.Image:
+    """Packed 8-bit Non-Color image holding a square (H, W) map in [0, 1] as gray"""
+    resolution = values.shape[0]
+    # 8 bits are plenty for masks and micro height; byte images take a
+    # quarter of the memory and bandwidth of float ones when rendering
+    gray = np.rint(np.clip(values, 0.0, 1.0) * 255.0) / 255.0
+    
+    # Gray in RGB with opaque alpha, uploaded with one bulk copy
+    buf = np.empty((values.size, 4), dtype=np.float32)
+    buf[:, :3] = gray.reshape(-1, 1)
+    buf[:, 3] = 1.0
+    
+    image = bpy.data.images.new(name, resolution, resolution, float_buffer=False)
+    image.colorspace_settings.name = 'Non-Color'
+    image.pixels.foreach_set(buf.ravel())
+    image.file_format = 'PNG'
+    image.pack()
+    return image
+
+
+def _kernel_image(name: str, resolution: int, kernel, *args) -> bpy.types.Image:
+    """
+    Image filled by one of the _noise_kernels functions, computed once.
+    
+    The map only depends on the kernel arguments, so all materials with the
+    same settings share one image.
+    """
+    name = f"{name}_{resolution}"
+    image = bpy.data.images.get(name)
+    if image is not None:
+        return image
+    
+    values = np.empty((resolution, resolution), dtype=np.float32)
+    kernel(values, *args)
+    return _map_image(name, values)
+
+
+def _pyramid_image(name: str, resolution: int, *args) -> bpy.types.Image:
+    """
+    simplex2d map taken from a resolution pyramid, computed once.
+    
+    The smaller levels come out of the same pass and are kept as images too,
+    so lower-LOD slabs with the same noise settings reuse them.
+    """
+    image = bpy.data.images.get(f"{name}_{resolution}")
+    if image is not None:
+        return image
+    
+    levels = simplex2d_pyramid(resolution, *args, base_resolution=_MIN_MAP_RESOLUTION)
+    for size, values in levels.items():
+        if bpy.data.images.get(f"{name}_{size}") is None:
+            image = _map_image(f"{name}_{size}", values)
+    return image
+
+
+class _GroupTarget:
+    """Stand-in material that points the generators at a node group's tree"""
+    
+    def __init__(self, material: bpy.types.Material, group: bpy.types.NodeTree):
+        self.name = material.name
+        self.use_nodes = True
+        self.node_tree = group
+        self.cycles = material.cycles
+
+
+def _materialize_socket(nodes: bpy.types.Nodes,
+                        socket: bpy.types.NodeSocket) -> bpy.types.NodeSocket:
+    """
+    Output feeding socket, or a constant node's output holding its unlinked
+    default value, so callers can always link the current value onward.
+    """
+    if socket.links:
+        return socket.links[0].from_socket
+    
+    constant = nodes.new('ShaderNodeRGB' if socket.type == 'RGBA' else 'ShaderNodeValue')
+    constant.location = (socket.node.location.x - 200, socket.node.location.y - 200)
+    constant.outputs[0].default_value = socket.default_value
+    return constant.outputs[0]
+
+
 class MicroDisplacementGenerator:
     """
     Generates procedural micro-displacement for surface irregularities.
@@ -113,30 +301,50 @@ class MicroDisplacementGenerator:
             displacement_node = nodes.new('ShaderNodeDisplacement')
             displacement_node.location = (400, -400)
         
-        # Create procedural noise for displacement
-        noise_tex = nodes.new('ShaderNodeTexNoise')
-        noise_tex.location = (0, -400)
-        noise_tex.inputs['Scale'].default_value = self.config.displacement_detail
-        noise_tex.inputs['Detail'].default_value = 15.0
-        noise_tex.inputs['Roughness'].default_value = self.config.displacement_roughness
-        
-        # Add mapping for UV control
-        mapping = nodes.new('ShaderNodeMapping')
-        mapping.location = (-200, -400)
-        
-        tex_coord = nodes.new('ShaderNodeTexCoord')
-        tex_coord.location = (-400, -400)
-        
         # Scale displacement
         math_node = nodes.new('ShaderNodeMath')
         math_node.location = (200, -400)
         math_node.operation = 'MULTIPLY'
         math_node.inputs[1].default_value = self.config.displacement_scale
         
-        # Link nodes
-        links.new(tex_coord.outputs['UV'], mapping.inputs['Vector'])
-        links.new(mapping.outputs['Vector'], noise_tex.inputs['Vector'])
-        links.new(noise_tex.outputs['Fac'], math_node.inputs[0])
+        if self.config.use_baked:
+            # Precomputed noise map instead of per-sample noise evaluation
+            height_tex = nodes.new('ShaderNodeTexImage')
+            height_tex.location = (0, -400)
+            height_tex.image = _pyramid_image(
+                f"imperf_displacement_{self.config.displacement_detail:g}_"
+                f"{self.config.displacement_roughness:g}",
+                self.config.bake_resolution,
+                self.config.displacement_detail, 15.0, self.config.displacement_roughness
+            )
+            # Sample in the same UV space the noise below is evaluated in
+            tex_coord = _shared_node(nodes, 'ShaderNodeTexCoord', "Imperfection Coordinates",
+                                     (-600, -400))
+            links.new(tex_coord.outputs['UV'], height_tex.inputs['Vector'])
+            links.new(height_tex.outputs['Color'], math_node.inputs[0])
+        else:
+            # Create procedural noise for displacement
+            noise_tex = _hashed_noise(nodes, self.config.displacement_detail, 15.0,
+                                      self.config.displacement_roughness) \
+                if self.config.use_hashed_noise else None
+            if noise_tex is None:
+                noise_tex = nodes.new('ShaderNodeTexNoise')
+                noise_tex.inputs['Scale'].default_value = self.config.displacement_detail
+                noise_tex.inputs['Detail'].default_value = 15.0
+                noise_tex.inputs['Roughness'].default_value = self.config.displacement_roughness
+            noise_tex.location = (0, -400)
+            
+            # Add mapping for UV control
+            mapping = nodes.new('ShaderNodeMapping')
+            mapping.location = (-200, -400)
+            
+            tex_coord = _shared_node(nodes, 'ShaderNodeTexCoord', "Imperfection Coordinates",
+                                     (-600, -400))
+            
+            links.new(tex_coord.outputs['UV'], mapping.inputs['Vector'])
+            links.new(mapping.outputs['Vector'], noise_tex.inputs['Vector'])
+            links.new(noise_tex.outputs['Fac'], math_node.inputs[0])
+        
         links.new(math_node.outputs['Value'], displacement_node.inputs['Height'])
         
         # Find material output
@@ -150,6 +358,7 @@ class MicroDisplacementGenerator:
         
         print(f"✅ Micro-displacement added: scale={self.config.displacement_scale}")
     
+    
     def generate_procedural_scratches(self, material: bpy.types.Material) -> None:
         """Add micro-scratches using voronoi texture"""
         if not material.use_nodes:
@@ -218,13 +427,31 @@ class FingerprintSystem:
         fingerprint_group.location = (-300, -800)
         
         # Use musgrave texture for organic smudge patterns
-        musgrave = nodes.new('ShaderNodeTexMusgrave')
+        if self.config.use_baked:
+            # Precomputed ridged multifractal instead of per-sample octaves
+            musgrave = nodes.new('ShaderNodeTexImage')
+            musgrave.image = _kernel_image(f"imperf_fingerprint_ridges_{seed}",
+                                           self.config.bake_resolution, ridged_multifractal,
+                                           15.0, 8.0, 2.5, 1.0, seed)
+            # The Musgrave node reads Generated coordinates when unlinked; the
+            # map is laid out over the 0-1 bounding box, so sample it the same way
+            tex_coord = _shared_node(nodes, 'ShaderNodeTexCoord', "Imperfection Coordinates",
+                                     (-600, -400))
+            links.new(tex_coord.outputs['Generated'], musgrave.inputs['Vector'])
+            ridges = musgrave.outputs['Color']
+        else:
+            musgrave = _hashed_noise(nodes, 15.0, 8.0, lacunarity=2.5,
+                                     ridged=True, dimension=1.0) \
+                if self.config.use_hashed_noise else None
+            if musgrave is None:
+                musgrave = nodes.new('ShaderNodeTexMusgrave')
+                musgrave.musgrave_type = 'RIDGED_MULTIFRACTAL'
+                musgrave.inputs['Scale'].default_value = 15.0
+                musgrave.inputs['Detail'].default_value = 8.0
+                musgrave.inputs['Dimension'].default_value = 1.0
+                musgrave.inputs['Lacunarity'].default_value = 2.5
+            ridges = musgrave.outputs['Fac']
         musgrave.location = (-500, -800)
-        musgrave.musgrave_type = 'RIDGED_MULTIFRACTAL'
-        musgrave.inputs['Scale'].default_value = 15.0
-        musgrave.inputs['Detail'].default_value = 8.0
-        musgrave.inputs['Dimension'].default_value = 1.0
-        musgrave.inputs['Lacunarity'].default_value = 2.5
         
         # Color ramp to isolate fingerprint shapes
         fingerprint_mask = nodes.new('ShaderNodeValToRGB')
@@ -234,10 +461,13 @@ class FingerprintSystem:
         fingerprint_mask.color_ramp.elements[1].position = 0.55
         
         # Random fingerprint placement using noise
-        placement_noise = nodes.new('ShaderNodeTexNoise')
+        placement_noise = _hashed_noise(nodes, 3.0, 0.0) \
+            if self.config.use_hashed_noise else None
+        if placement_noise is None:
+            placement_noise = nodes.new('ShaderNodeTexNoise')
+            placement_noise.inputs['Scale'].default_value = 3.0
+            placement_noise.inputs['Detail'].default_value = 0.0
         placement_noise.location = (-700, -800)
-        placement_noise.inputs['Scale'].default_value = 3.0
-        placement_noise.inputs['Detail'].default_value = 0.0
         
         # Mix for coverage control
         coverage_mix = nodes.new('ShaderNodeMath')
@@ -263,7 +493,7 @@ class FingerprintSystem:
             )
             
             # Link nodes
-            links.new(musgrave.outputs['Fac'], fingerprint_mask.inputs['Fac'])
+            links.new(ridges, fingerprint_mask.inputs['Fac'])
             links.new(placement_noise.outputs['Fac'], coverage_mix.inputs[0])
             links.new(fingerprint_mask.outputs['Color'], roughness_mix.inputs['Color1'])
             links.new(fingerprint_roughness.outputs['Value'], roughness_mix.inputs['Color2'])
@@ -289,10 +519,13 @@ class FingerprintSystem:
         links = material.node_tree.links
         
         # Noise for dust distribution
-        dust_noise = nodes.new('ShaderNodeTexNoise')
+        dust_noise = _hashed_noise(nodes, 50.0, 4.0) \
+            if self.config.use_hashed_noise else None
+        if dust_noise is None:
+            dust_noise = nodes.new('ShaderNodeTexNoise')
+            dust_noise.inputs['Scale'].default_value = 50.0
+            dust_noise.inputs['Detail'].default_value = 4.0
         dust_noise.location = (-300, -1000)
-        dust_noise.inputs['Scale'].default_value = 50.0
-        dust_noise.inputs['Detail'].default_value = 4.0
         
         # Color ramp for dust patches
         dust_ramp = nodes.new('ShaderNodeValToRGB')
@@ -319,14 +552,8 @@ class FingerprintSystem:
             links.new(dust_color.outputs['Color'], color_mix.inputs['Color2'])
             
             # Get current base color
-            current_color = bsdf.inputs['Base Color'].links[0].from_socket if \
-                bsdf.inputs['Base Color'].links else None
-            
-            if current_color:
-                links.new(current_color, color_mix.inputs['Color1'])
-            else:
-                color_mix.inputs['Color1'].default_value = \
-                    bsdf.inputs['Base Color'].default_value
+            current_color = _materialize_socket(nodes, bsdf.inputs['Base Color'])
+            links.new(current_color, color_mix.inputs['Color1'])
             
             links.new(color_mix.outputs['Color'], bsdf.inputs['Base Color'])
         
@@ -398,24 +625,14 @@ class MaterialWearSystem:
             links.new(bevel.outputs['Normal'], edge_mask.inputs['Fac'])
             links.new(edge_mask.outputs['Color'], edge_darken.inputs['Factor'])
             
-            current_color = bsdf.inputs['Base Color'].links[0].from_socket if \
-                bsdf.inputs['Base Color'].links else None
-            
-            if current_color:
-                links.new(current_color, edge_darken.inputs['Color1'])
-            else:
-                edge_darken.inputs['Color1'].default_value = current_color_val
+            current_color = _materialize_socket(nodes, bsdf.inputs['Base Color'])
+            links.new(current_color, edge_darken.inputs['Color1'])
             
             links.new(edge_darken.outputs['Color'], bsdf.inputs['Base Color'])
             
             # Edge roughness
-            current_roughness = bsdf.inputs['Roughness'].links[0].from_socket if \
-                bsdf.inputs['Roughness'].links else None
-            
-            if current_roughness:
-                links.new(current_roughness, edge_roughness.inputs[0])
-            else:
-                edge_roughness.inputs[0].default_value = bsdf.inputs['Roughness'].default_value
+            current_roughness = _materialize_socket(nodes, bsdf.inputs['Roughness'])
+            links.new(current_roughness, edge_roughness.inputs[0])
             
             links.new(edge_mask.outputs['Color'], edge_roughness.inputs[1])
             
@@ -442,8 +659,8 @@ class MaterialWearSystem:
         links = material.node_tree.links
         
         # Texture coordinate for positioning
-        tex_coord = nodes.new('ShaderNodeTexCoord')
-        tex_coord.location = (-600, -1500)
+        tex_coord = _shared_node(nodes, 'ShaderNodeTexCoord', "Imperfection Coordinates",
+                                 (-600, -400))
         
         # Mapping for traffic zone center
         mapping = nodes.new('ShaderNodeMapping')
@@ -489,13 +706,8 @@ class MaterialWearSystem:
             links.new(traffic_mask.outputs['Color'], wear_mix.inputs['Factor'])
             
             # Get current base color
-            current_color_link = bsdf.inputs['Base Color'].links[0].from_socket if \
-                bsdf.inputs['Base Color'].links else None
-            
-            if current_color_link:
-                links.new(current_color_link, wear_mix.inputs['Color1'])
-            else:
-                wear_mix.inputs['Color1'].default_value = current_color
+            current_color_link = _materialize_socket(nodes, bsdf.inputs['Base Color'])
+            links.new(current_color_link, wear_mix.inputs['Color1'])
             
             links.new(wear_mix.outputs['Color'], bsdf.inputs['Base Color'])
             
@@ -503,15 +715,15 @@ class MaterialWearSystem:
             current_roughness = bsdf.inputs['Roughness'].default_value
             polished_roughness = max(0.0, current_roughness - 0.1)
             
-            roughness_mix = nodes.new('ShaderNodeMix')
+            # Scalar lerp: mask * (polished - current) + current
+            roughness_mix = nodes.new('ShaderNodeMath')
             roughness_mix.location = (200, -1650)
-            roughness_mix.data_type = 'RGBA'
-            roughness_mix.inputs['Factor'].default_value = self.config.traffic_wear_intensity
-            roughness_mix.inputs['Color1'].default_value = (current_roughness, current_roughness, current_roughness, 1.0)
-            roughness_mix.inputs['Color2'].default_value = (polished_roughness, polished_roughness, polished_roughness, 1.0)
+            roughness_mix.operation = 'MULTIPLY_ADD'
+            roughness_mix.inputs[1].default_value = polished_roughness - current_roughness
+            roughness_mix.inputs[2].default_value = current_roughness
             
-            links.new(traffic_mask.outputs['Color'], roughness_mix.inputs['Factor'])
-            links.new(roughness_mix.outputs['Color'], bsdf.inputs['Roughness'])
+            links.new(traffic_mask.outputs['Color'], roughness_mix.inputs[0])
+            links.new(roughness_mix.outputs['Value'], bsdf.inputs['Roughness'])
         
         print(f"✅ Traffic pattern added: type={pattern_type.value}, "
               f"intensity={self.config.traffic_wear_intensity}")
@@ -565,14 +777,8 @@ class ContactShadowEnhancer:
             links.new(ao_ramp.outputs['Color'], ao_mix.inputs['Color2'])
             
             # Get current base color
-            current_color = bsdf.inputs['Base Color'].links[0].from_socket if \
-                bsdf.inputs['Base Color'].links else None
-            
-            if current_color:
-                links.new(current_color, ao_mix.inputs['Color1'])
-            else:
-                ao_mix.inputs['Color1'].default_value = \
-                    bsdf.inputs['Base Color'].default_value
+            current_color = _materialize_socket(nodes, bsdf.inputs['Base Color'])
+            links.new(current_color, ao_mix.inputs['Color1'])
             
             links.new(ao_mix.outputs['Color'], bsdf.inputs['Base Color'])
         
@@ -594,12 +800,11 @@ class ContactShadowEnhancer:
         # Create shadow plane if no ground provided
         if not ground_plane:
             # Get object bounds
-            bbox = [obj.matrix_world @ mathutils.Vector(corner) for corner in obj.bound_box]
-            min_x = min(v.x for v in bbox)
-            max_x = max(v.x for v in bbox)
-            min_y = min(v.y for v in bbox)
-            max_y = max(v.y for v in bbox)
-            min_z = min(v.z for v in bbox)
+            corners = np.asarray(obj.bound_box, dtype=np.float32)
+            matrix = np.asarray(obj.matrix_world, dtype=np.float32)
+            bbox = corners @ matrix[:3, :3].T + matrix[:3, 3]
+            min_x, min_y, min_z = bbox.min(axis=0)
+            max_x, max_y, _ = bbox.max(axis=0)
             
             # Create shadow plane
             size_x = (max_x - min_x) * 1.5
@@ -673,33 +878,258 @@ class SurfaceImperfectionManager:
         print(f"\n🎨 Applying surface imperfections to: {material.name}")
         print("=" * 60)
         
+        if not material.use_nodes:
+            material.use_nodes = True
+        
+        # 1-4. Displacement, fingerprints, wear and AO as one shared node group
+        self._insert_group(material, self._get_or_build_group(material, obj, wear_pattern))
+        
+        # 5. Replace the procedural nodes by baked image textures
+        if self.config.use_baked:
+            self.bake_all_channels(material, obj)
+        
+        # 6. Contact shadows
+        if add_shadows:
+            self.shadow_enhancer.add_contact_shadow(obj)
+        
+        print("=" * 60)
+        print(f"✅ All imperfections applied to: {material.name}\n")
+    
+    def _get_or_build_group(self, material: bpy.types.Material, obj: bpy.types.Object,
+                            wear_pattern: WearPattern) -> bpy.types.NodeTree:
+        """
+        Node group holding the imperfection generators for this config.
+        
+        The generators run once against the group's tree; every later material
+        with the same config, wear pattern and base BSDF values reuses the group
+        instead of rebuilding 30+ nodes.
+        """
+        base_color, base_roughness = _base_values(material)
+        ident = repr((astuple(self.config), wear_pattern.value, base_color, base_roughness))
+        name = f"StoneImperfections_{hashlib.sha1(ident.encode()).hexdigest()[:12]}"
+        group = bpy.data.node_groups.get(name)
+        if group is not None:
+            return group
+        
+        group = bpy.data.node_groups.new(name, 'ShaderNodeTree')
+        _new_group_socket(group, 'Base Color', 'INPUT', 'NodeSocketColor')
+        _new_group_socket(group, 'Roughness', 'INPUT', 'NodeSocketFloat')
+        _new_group_socket(group, 'Base Color', 'OUTPUT', 'NodeSocketColor')
+        _new_group_socket(group, 'Roughness', 'OUTPUT', 'NodeSocketFloat')
+        _new_group_socket(group, 'Displacement', 'OUTPUT', 'NodeSocketVector')
+        
+        nodes = group.nodes
+        links = group.links
+        group_in = nodes.new('NodeGroupInput')
+        group_in.location = (-1200, 0)
+        group_out = nodes.new('NodeGroupOutput')
+        group_out.location = (800, 0)
+        
+        # Stand-in BSDF the generators chain onto, fed by the group inputs
+        collector = nodes.new('ShaderNodeBsdfPrincipled')
+        collector.name = 'Principled BSDF'
+        collector.inputs['Base Color'].default_value = base_color
+        collector.inputs['Roughness'].default_value = base_roughness
+        links.new(group_in.outputs['Base Color'], collector.inputs['Base Color'])
+        links.new(group_in.outputs['Roughness'], collector.inputs['Roughness'])
+        
+        target = _GroupTarget(material, group)
+        
         # 1. Micro-displacement for surface irregularities
-        self.displacement_gen.add_micro_displacement(material, obj)
-        self.displacement_gen.generate_procedural_scratches(material)
+        self.displacement_gen.add_micro_displacement(target, obj)
+        self.displacement_gen.generate_procedural_scratches(target)
         
         # 2. Fingerprints and handling marks
-        self.fingerprint_sys.add_fingerprints(material)
-        self.fingerprint_sys.add_dust_layer(material)
+        self.fingerprint_sys.add_fingerprints(target)
+        self.fingerprint_sys.add_dust_layer(target)
         
         # 3. Material wear patterns
         if wear_pattern != WearPattern.NONE:
-            self.wear_sys.add_edge_wear(material, obj)
+            self.wear_sys.add_edge_wear(target, obj)
             if wear_pattern == WearPattern.CENTER_TRAFFIC:
-                self.wear_sys.add_traffic_pattern(material, wear_pattern)
+                self.wear_sys.add_traffic_pattern(target, wear_pattern)
         
         # 4. Enhanced AO
-        self.shadow_enhancer.enhance_ao(material)
+        self.shadow_enhancer.enhance_ao(target)
         
-        # 5. Contact shadows
-        if add_shadows:
-            self.shadow_enhancer.add_contact_shadow(obj)
+        # Route the collected chains to the group outputs
+        for socket_name in ('Base Color', 'Roughness'):
+            links.new(collector.inputs[socket_name].links[0].from_socket,
+                      group_out.inputs[socket_name])
+        links.new(nodes['Displacement'].outputs['Displacement'], group_out.inputs['Displacement'])
+        nodes.remove(collector)
         
-        print("=" * 60)
-        print(f"✅ All imperfections applied to: {material.name}\n")
+        return group
+    
+    def _insert_group(self, material: bpy.types.Material, group: bpy.types.NodeTree) -> None:
+        """Add one instance of the imperfection group between the inputs and the BSDF"""
+        nodes = material.node_tree.nodes
+        links = material.node_tree.links
+        
+        group_node = nodes.new('ShaderNodeGroup')
+        group_node.node_tree = group
+        group_node.name = "Stone Imperfections"
+        group_node.location = (-300, -400)
+        
+        bsdf = nodes.get('Principled BSDF')
+        if bsdf:
+            for socket_name in ('Base Color', 'Roughness'):
+                socket = bsdf.inputs[socket_name]
+                if socket.links:
+                    links.new(socket.links[0].from_socket, group_node.inputs[socket_name])
+                else:
+                    group_node.inputs[socket_name].default_value = socket.default_value
+                links.new(group_node.outputs[socket_name], socket)
+        
+        output = nodes.get('Material Output')
+        if output:
+            links.new(group_node.outputs['Displacement'], output.inputs['Displacement'])
+        material.cycles.displacement_method = 'BOTH'
+    
+    def bake_all_channels(self, material: bpy.types.Material,
+                          obj: bpy.types.Object,
+                          resolution: Optional[int] = None) -> Dict[str, bpy.types.Image]:
+        """
+        Bake the procedural imperfection nodes into image textures.
+        
+        The node chains feeding base color and roughness are each baked once
+        and replaced by a single image texture, so the noise, voronoi and
+        musgrave nodes are no longer evaluated per sample. Displacement height
+        already reads a precomputed noise map and is not baked again.
+        Baked images are cached in the temp directory, keyed by the config,
+        material and mesh, and reused by later slabs with the same setup.
+        All uncached channels are baked in one session, so the render setup
+        and object selection are done once per material.
+        
+        Args:
+            material: Material with imperfections applied
+            obj: Object using the material (needs a UV map)
+            resolution: Baked image size, defaults to config.bake_resolution
+            
+        Returns:
+            Baked image per channel name
+        """
+        resolution = resolution or self.config.bake_resolution
+        nodes = material.node_tree.nodes
+        links = material.node_tree.links
+        
+        mesh_digest = _mesh_digest(obj.data)
+        baked = {}
+        pending = []
+        for channel, (node_name, input_name, float_buffer) in _BAKE_CHANNELS.items():
+            node = nodes.get(node_name)
+            if node is None or not node.inputs[input_name].links:
+                continue
+            socket = node.inputs[input_name]
+            
+            key = self._bake_key(material, mesh_digest, channel, resolution)
+            path = Path(tempfile.gettempdir()) / \
+                f"imperf_{key}_{channel}.{'exr' if float_buffer else 'png'}"
+            
+            image_node = nodes.new('ShaderNodeTexImage')
+            image_node.location = (node.location.x - 300, node.location.y)
+            if path.exists():
+                image_node.image = bpy.data.images.load(str(path), check_existing=True)
+            else:
+                image_node.image = bpy.data.images.new(f"imperf_{key}_{channel}",
+                                                       resolution, resolution,
+                                                       float_buffer=float_buffer)
+                pending.append((channel, socket, image_node, path))
+            if channel != 'color':
+                image_node.image.colorspace_settings.name = 'Non-Color'
+            baked[channel] = (socket, image_node)
+        
+        for channel in self._emit_bake(material, obj, pending):
+            socket, image_node = baked.pop(channel)
+            bpy.data.images.remove(image_node.image)
+            nodes.remove(image_node)
+        
+        # Swap the procedural chains for the images only after baking, since
+        # later channels are baked from the procedural nodes. Packing keeps the
+        # .blend independent of the temp directory cache.
+        for socket, image_node in baked.values():
+            image_node.image.pack()
+            links.new(image_node.outputs['Color'], socket)
+        
+        print(f"✅ Baked imperfection channels: {', '.join(baked) or 'none'}")
+        return {channel: image_node.image for channel, (_, image_node) in baked.items()}
+    
+    def _emit_bake(self, material: bpy.types.Material, obj: bpy.types.Object,
+                   jobs: List[Tuple[str, bpy.types.NodeSocket, bpy.types.Node, Path]]) -> List[str]:
+        """
+        Bake each job's socket input through an emission shader into its image
+        node and save it to its cache path.
+        
+        Returns:
+            Channels that failed to bake
+        """
+        if not jobs:
+            return []
+        
+        nodes = material.node_tree.nodes
+        links = material.node_tree.links
+        
+        output = nodes.get('Material Output')
+        if not output:
+            return [channel for channel, *_ in jobs]
+        surface = output.inputs['Surface']
+        previous_surface = surface.links[0].from_socket if surface.links else None
+        
+        # Route each channel straight to the surface as emission
+        emission = nodes.new('ShaderNodeEmission')
+        links.new(emission.outputs['Emission'], surface)
+        
+        scene = bpy.context.scene
+        engine = scene.render.engine
+        tile_size = scene.cycles.tile_size
+        scene.render.engine = 'CYCLES'
+        # One tile covering the whole image keeps per-tile overhead out of the bake
+        scene.cycles.tile_size = jobs[0][2].image.size[0]
+        
+        bpy.ops.object.select_all(action='DESELECT')
+        obj.select_set(True)
+        bpy.context.view_layer.objects.active = obj
+        
+        failed = []
+        try:
+            for channel, socket, image_node, path in jobs:
+                links.new(socket.links[0].from_socket, emission.inputs['Color'])
+                nodes.active = image_node
+                try:
+                    bpy.ops.object.bake(type='EMIT', margin=4, use_clear=True)
+                except RuntimeError as e:
+                    print(f"⚠️ Baking {material.name} {channel} failed: {e}")
+                    failed.append(channel)
+                    continue
+                image = image_node.image
+                image.filepath_raw = str(path)
+                image.file_format = 'OPEN_EXR' if image.is_float else 'PNG'
+                image.save()
+        finally:
+            nodes.remove(emission)
+            if previous_surface:
+                links.new(previous_surface, surface)
+            scene.render.engine = engine
+            scene.cycles.tile_size = tile_size
+        
+        return failed
+    
+    def _bake_key(self, material: bpy.types.Material, mesh_digest: str,
+                  channel: str, resolution: int) -> str:
+        """Stable cache key for a baked channel"""
+        # Base values of the material and the mesh (bevel, AO, UV layout) end
+        # up in the bake as well, not only the config; names alone would match
+        # unrelated "Material"/"Cube" bakes from other projects
+        base_color, base_roughness = _base_values(material)
+        ident = repr((astuple(self.config), channel, resolution,
+                      tuple(round(c, 6) for c in base_color), round(base_roughness, 6),
+                      mesh_digest))
+        return hashlib.sha1(ident.encode()).hexdigest()[:16]
     
     def apply_preset(self, material: bpy.types.Material,
                     obj: bpy.types.Object,
-                    preset: str = "realistic") -> None:
+                    preset: str = "realistic",
+                    required_lod: int = 0) -> None:
         """
         Apply a predefined imperfection preset.
         
@@ -708,65 +1138,89 @@ class SurfaceImperfectionManager:
             - "realistic": Moderate wear, typical installation
             - "weathered": Heavy wear, aged appearance
             - "kitchen": Kitchen counter with traffic patterns
+        
+        required_lod halves the generated and baked map size per level from
+        max_resolution (down to 256), for slabs that are small on screen;
+        negative levels are treated as 0.
         """
-        presets = {
-            "clean": SurfaceImperfectionConfig(
-                displacement_scale=0.0005,
-                fingerprint_intensity=0.1,
-                fingerprint_coverage=0.05,
-                dust_amount=0.02,
-                edge_wear_intensity=0.1,
-                traffic_wear_intensity=0.05,
-                ao_intensity=0.5
-            ),
-            "realistic": SurfaceImperfectionConfig(),  # Default values
-            "weathered": SurfaceImperfectionConfig(
-                displacement_scale=0.002,
-                fingerprint_intensity=0.5,
-                fingerprint_coverage=0.4,
-                dust_amount=0.2,
-                edge_wear_intensity=0.6,
-                edge_wear_roughness=0.5,
-                traffic_wear_intensity=0.4,
-                ao_intensity=1.2
-            ),
-            "kitchen": SurfaceImperfectionConfig(
-                displacement_scale=0.001,
-                fingerprint_intensity=0.4,
-                fingerprint_coverage=0.3,
-                dust_amount=0.08,
-                edge_wear_intensity=0.35,
-                traffic_zone_radius=0.4,
-                traffic_wear_intensity=0.3,
-                ao_intensity=0.8
-            )
-        }
-        
-        if preset in presets:
-            self.config = presets[preset]
-            self.displacement_gen = MicroDisplacementGenerator(self.config)
-            self.fingerprint_sys = FingerprintSystem(self.config)
-            self.wear_sys = MaterialWearSystem(self.config)
-            self.shadow_enhancer = ContactShadowEnhancer(self.config)
-            
-            wear_map = {
-                "clean": WearPattern.NONE,
-                "realistic": WearPattern.EDGE_DARKENING,
-                "weathered": WearPattern.CENTER_TRAFFIC,
-                "kitchen": WearPattern.CENTER_TRAFFIC
-            }
-            
-            self.apply_all_imperfections(material, obj, wear_map[preset])
+        required_lod = max(0, int(required_lod))
+        if preset in _PRESETS:
+            # Share the config and generators of the cached preset manager
+            cached = _preset_manager(_preset_config(preset, required_lod))
+            self.config = cached.config
+            self.displacement_gen = cached.displacement_gen
+            self.fingerprint_sys = cached.fingerprint_sys
+            self.wear_sys = cached.wear_sys
+            self.shadow_enhancer = cached.shadow_enhancer
+            
+            self.apply_all_imperfections(material, obj, _PRESET_WEAR[preset])
             print(f"✅ Applied '{preset}' preset")
         else:
             print(f"⚠️ Unknown preset: {preset}. Using 'realistic'.")
             self.apply_all_imperfections(material, obj)
 
 
+# Preset name -> config overrides of the defaults
+_PRESETS = {
+    "clean": dict(
+        displacement_scale=0.0005,
+        fingerprint_intensity=0.1,
+        fingerprint_coverage=0.05,
+        dust_amount=0.02,
+        edge_wear_intensity=0.1,
+        traffic_wear_intensity=0.05,
+        ao_intensity=0.5
+    ),
+    "realistic": dict(),  # Default values
+    "weathered": dict(
+        displacement_scale=0.002,
+        fingerprint_intensity=0.5,
+        fingerprint_coverage=0.4,
+        dust_amount=0.2,
+        edge_wear_intensity=0.6,
+        edge_wear_roughness=0.5,
+        traffic_wear_intensity=0.4,
+        ao_intensity=1.2
+    ),
+    "kitchen": dict(
+        displacement_scale=0.001,
+        fingerprint_intensity=0.4,
+        fingerprint_coverage=0.3,
+        dust_amount=0.08,
+        edge_wear_intensity=0.35,
+        traffic_zone_radius=0.4,
+        traffic_wear_intensity=0.3,
+        ao_intensity=0.8
+    )
+}
+
+_PRESET_WEAR = {
+    "clean": WearPattern.NONE,
+    "realistic": WearPattern.EDGE_DARKENING,
+    "weathered": WearPattern.CENTER_TRAFFIC,
+    "kitchen": WearPattern.CENTER_TRAFFIC
+}
+
+
+@functools.lru_cache(maxsize=16)
+def _preset_config(name: str, required_lod: int = 0) -> SurfaceImperfectionConfig:
+    """Shared config instance for a preset at a map LOD"""
+    config = SurfaceImperfectionConfig(**_PRESETS[name])
+    resolution = max(_MIN_MAP_RESOLUTION, config.max_resolution >> required_lod)
+    return replace(config, bake_resolution=min(resolution, config.max_resolution))
+
+
+@functools.lru_cache(maxsize=16)
+def _preset_manager(config: SurfaceImperfectionConfig) -> 'SurfaceImperfectionManager':
+    """Shared manager for a config, so batches of slabs reuse one set of generators"""
+    return SurfaceImperfectionManager(config)
+
+
 # Convenience function for quick application
 def apply_photorealistic_imperfections(material: bpy.types.Material,
                                       obj: bpy.types.Object,
-                                      preset: str = "realistic") -> None:
+                                      preset: str = "realistic",
+                                      required_lod: int = 0) -> None:
     """
     Quick function to apply all photorealistic imperfections.
     
@@ -774,9 +1228,12 @@ def apply_photorealistic_imperfections(material: bpy.types.Material,
         material: Material to enhance
         obj: Object to apply to
         preset: Imperfection preset ("clean", "realistic", "weathered", "kitchen")
+        required_lod: Map LOD, each level halving the map size (clamped to >= 0)
     """
-    manager = SurfaceImperfectionManager()
-    manager.apply_preset(material, obj, preset)
+    required_lod = max(0, int(required_lod))
+    manager = _preset_manager(_preset_config(preset, required_lod)) if preset in _PRESETS \
+        else SurfaceImperfectionManager()
+    manager.apply_preset(material, obj, preset, required_lod)
 
 
 # Export classes for use in other modules